@@ -5,6 +5,8 @@ from curator.defaults import *
 from curator.validators import *
 from curator.logtools import *
 from curator.utils import *
+from curator.cache import FieldStatsCache, IndexListCache, RepositoryCache
+from curator.records import IndexAge, IndexInfo, SnapshotInfo
 from curator.indexlist import IndexList
 from curator.snapshotlist import SnapshotList
 from curator.actions import *
@@ -245,8 +245,7 @@ class Allocation(object):
         )
         self.loggit.info('Updating index setting {0}'.format(self.body))
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
+            def put_settings(lst):
                 self.client.indices.put_settings(
                     index=utils.to_csv(lst), body=self.body
                 )
@@ -259,6 +258,8 @@ class Allocation(object):
                         self.client, 'allocation',
                         wait_interval=self.wait_interval, max_wait=self.max_wait
                     )
+            utils.chunked_call(
+                self.client, 'indices.put_settings', self.index_list.indices, put_settings)
         except Exception as err:
             utils.report_failure(err)
 
@@ -315,8 +316,7 @@ class Close(object):
             )
         )
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
+            def close_chunk(lst):
                 lst_as_csv = utils.to_csv(lst)
                 self.loggit.debug('CSV list of indices to close: {0}'.format(lst_as_csv))
                 if self.delete_aliases:
@@ -342,6 +342,8 @@ class Close(object):
                                 '{0} {1}'.format(err.error, err.info)
                             )
                 self.client.indices.close(index=lst_as_csv, ignore_unavailable=True)
+            utils.chunked_call(
+                self.client, 'indices.close', self.index_list.indices, close_chunk)
         except Exception as err:
             utils.report_failure(err)
 
@@ -380,10 +382,11 @@ class Freeze(object):
             )
         )
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
+            def freeze_chunk(lst):
                 self.client.xpack.indices.freeze(
                     index=utils.to_csv(lst))
+            utils.chunked_call(
+                self.client, 'indices.freeze', self.index_list.indices, freeze_chunk)
         except Exception as err:
             utils.report_failure(err)
 
@@ -422,10 +425,11 @@ class Unfreeze(object):
             )
         )
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
+            def unfreeze_chunk(lst):
                 self.client.xpack.indices.unfreeze(
                     index=utils.to_csv(lst))
+            utils.chunked_call(
+                self.client, 'indices.unfreeze', self.index_list.indices, unfreeze_chunk)
         except Exception as err:
             utils.report_failure(err)
 
@@ -608,6 +612,9 @@ class DeleteIndices(object):
         #: Instance variable.
         #: String value of `master_timeout` + 's', for seconds.
         self.master_timeout = str(master_timeout) + 's'
+        #: Instance variable.
+        #: The indices `do_action` has verified as deleted
+        self.deleted_indices = []
         self.loggit = logging.getLogger('curator.actions.delete_indices')
         self.loggit.debug('master_timeout value: {0}'.format(
             self.master_timeout))
@@ -647,6 +654,7 @@ class DeleteIndices(object):
             self.client.indices.delete(
                 index=utils.to_csv(working_list), master_timeout=self.master_timeout)
             result = [i for i in working_list if i in utils.get_indices(self.client)]
+            self.deleted_indices.extend(i for i in working_list if i not in result)
             if self._verify_result(result, count):
                 return
             else:
@@ -673,9 +681,10 @@ class DeleteIndices(object):
             )
         )
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
-                self.__chunk_loop(lst)
+            utils.chunked_call(
+                self.client, 'indices.delete', self.index_list.indices,
+                self.__chunk_loop
+            )
         except Exception as err:
             utils.report_failure(err)
 
@@ -815,6 +824,7 @@ class IndexSettings(object):
         # Detect if even one index is open.  Save all found to open_index_list.
         open_index_list = []
         open_indices = False
+        self.index_list.load_data('metadata')
         for idx in self.index_list.indices:
             if self.index_list.index_info[idx]['state'] == 'open':
                 open_index_list.append(idx)
@@ -858,14 +868,15 @@ class IndexSettings(object):
             '{1}'.format(len(self.index_list.indices), self.index_list.indices)
         )
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
+            def put_settings(lst):
                 response = self.client.indices.put_settings(
                     index=utils.to_csv(lst), body=self.body,
                     ignore_unavailable=self.ignore_unavailable,
                     preserve_existing=self.preserve_existing
                 )
                 self.loggit.debug('PUT SETTINGS RESPONSE: {0}'.format(response))
+            utils.chunked_call(
+                self.client, 'indices.put_settings', self.index_list.indices, put_settings)
         except Exception as err:
             utils.report_failure(err)
 
@@ -903,9 +914,10 @@ class Open(object):
             )
         )
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
+            def open_chunk(lst):
                 self.client.indices.open(index=utils.to_csv(lst))
+            utils.chunked_call(
+                self.client, 'indices.open', self.index_list.indices, open_chunk)
         except Exception as err:
             utils.report_failure(err)
 
@@ -971,8 +983,7 @@ class Replicas(object):
             '{2}'.format(self.count, len(self.index_list.indices), self.index_list.indices)
         )
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
+            def put_settings(lst):
                 self.client.indices.put_settings(
                     index=utils.to_csv(lst),
                     body={'number_of_replicas': self.count}
@@ -986,6 +997,8 @@ class Replicas(object):
                         self.client, 'replicas',
                         wait_interval=self.wait_interval, max_wait=self.max_wait
                     )
+            utils.chunked_call(
+                self.client, 'indices.put_settings', self.index_list.indices, put_settings)
         except Exception as err:
             utils.report_failure(err)
 
@@ -1049,12 +1062,12 @@ class Rollover(object):
         is running 6.1 or higher.
         """
         if 'max_size' in conditions:
-            version = utils.get_version(self.client)
-            if version < (6, 1, 0):
+            if not utils.has_feature(self.client, 'rollover_max_size'):
                 raise exceptions.ConfigurationError(
                     'Your version of elasticsearch ({0}) does not support '
                     'the max_size rollover condition. It is only supported '
-                    'in versions 6.1.0 and up.'.format(version)
+                    'in versions 6.1.0 and up.'.format(
+                        utils.get_version(self.client))
                 )
         return conditions
 
@@ -1129,12 +1142,15 @@ class Rollover(object):
 
 class DeleteSnapshots(object):
     """Delete Snapshots Action Class"""
-    def __init__(self, slo, retry_interval=120, retry_count=3):
+    def __init__(self, slo, retry_interval=120, retry_count=3, batch_size=1):
         """
         :arg slo: A :class:`curator.snapshotlist.SnapshotList` object
         :arg retry_interval: Number of seconds to delay betwen retries. Default:
             120 (seconds)
         :arg retry_count: Number of attempts to make. Default: 3
+        :arg batch_size: The maximum number of snapshots to delete per
+            request, on versions which can delete several snapshots at once.
+            Default: 1
         """
         utils.verify_snapshot_list(slo)
         #: Instance variable.
@@ -1152,6 +1168,12 @@ class DeleteSnapshots(object):
         #: Instance variable.
         #: The repository name derived from `slo`
         self.repository = slo.repository
+        #: Instance variable.
+        #: Internally accessible copy of `batch_size`
+        self.batch_size = batch_size
+        #: Instance variable.
+        #: The number of snapshots `do_action` has deleted so far
+        self.deleted = 0
         self.loggit = logging.getLogger('curator.actions.delete_snapshots')
 
     def do_dry_run(self):
@@ -1163,14 +1185,48 @@ class DeleteSnapshots(object):
             'repository' : self.repository,
             'retry_interval' : self.retry_interval,
             'retry_count' : self.retry_count,
+            'batch_size' : self.batch_size,
         }
         for snap in self.snapshot_list.snapshots:
             self.loggit.info(
                 'DRY-RUN: delete_snapshot: {0} with arguments: {1}'.format(snap, mykwargs))
 
+    def _batches(self):
+        """
+        Return the snapshots in `slo` in batches of up to `batch_size`
+        snapshots, if the cluster can delete several snapshots at once.
+        Otherwise, each batch holds a single snapshot.
+        """
+        snapshots = self.snapshot_list.snapshots
+        if self.batch_size < 2 or not utils.has_feature(
+                self.client, 'multi_snapshot_delete'):
+            return [[snap] for snap in snapshots]
+        return [
+            snapshots[i:i + self.batch_size]
+            for i in range(0, len(snapshots), self.batch_size)
+        ]
+
+    def _delete(self, snapshots):
+        """
+        Delete `snapshots` with a single request, and count them in
+        `deleted`.
+
+        :arg snapshots: A list of snapshot names
+        """
+        if len(snapshots) == 1:
+            self.loggit.info('Deleting snapshot {0}...'.format(snapshots[0]))
+        else:
+            self.loggit.debug(
+                'Deleting {0} snapshots: {1}...'.format(len(snapshots), snapshots))
+        self.client.snapshot.delete(
+            repository=self.repository, snapshot=utils.to_csv(snapshots))
+        self.deleted += len(snapshots)
+
     def do_action(self):
         """
-        Delete snapshots in `slo`
+        Delete snapshots in `slo`, in batches of up to `batch_size` snapshots
+        per request on versions which support it.  A batch too long for the
+        request URL is split in half until it fits.
         Retry up to `retry_count` times, pausing `retry_interval`
         seconds between retries.
         """
@@ -1188,12 +1244,35 @@ class DeleteSnapshots(object):
                 raise exceptions.FailedExecution(
                     'Unable to delete snapshot(s) because a snapshot is in '
                     'state "IN_PROGRESS"')
+        total = len(self.snapshot_list.snapshots)
+        self.deleted = 0
         try:
-            for snap in self.snapshot_list.snapshots:
-                self.loggit.info('Deleting snapshot {0}...'.format(snap))
-                self.client.snapshot.delete(
-                    repository=self.repository, snapshot=snap)
+            batches = self._batches()
+            for num, batch in enumerate(batches, 1):
+                if self.batch_size < 2:
+                    self._delete(batch)
+                    continue
+                self.loggit.info(
+                    'Deleting batch {0} of {1}: {2} snapshot(s)...'.format(
+                        num, len(batches), len(batch))
+                )
+                start = time.time()
+                if len(batch) == 1:
+                    self._delete(batch)
+                else:
+                    utils.chunked_call(
+                        self.client, 'snapshot.delete', batch, self._delete)
+                self.loggit.info(
+                    'Deleted batch {0} of {1} in {2:.2f} seconds. {3} of {4} '
+                    'snapshots deleted'.format(
+                        num, len(batches), time.time() - start, self.deleted,
+                        total)
+                )
         except Exception as err:
+            self.loggit.error(
+                '{0} of {1} snapshots were deleted before the failure'.format(
+                    self.deleted, total)
+            )
             utils.report_failure(err)
 
 class Reindex(object):
@@ -1460,12 +1539,11 @@ class Reindex(object):
             'wait_for_completion': False,
             'slices': self.slices
         }
-        version = utils.get_version(self.client)
-        if version < (5, 1, 0):
+        if not utils.has_feature(self.client, 'sliced_reindex'):
             self.loggit.info(
                 'Your version of elasticsearch ({0}) does not support '
                 'sliced scroll for reindex, so that setting will not be '
-                'used'.format(version)
+                'used'.format(utils.get_version(self.client))
             )
             del reindex_args['slices']
         return reindex_args
@@ -1621,7 +1699,7 @@ class Snapshot(object):
     def __init__(
             self, ilo, repository=None, name=None, ignore_unavailable=False,
             include_global_state=True, partial=False, wait_for_completion=True, wait_interval=9,
-            max_wait=-1, skip_repo_fs_check=False
+            max_wait=-1, skip_repo_fs_check=False, repository_cache=None
     ):
         """
         :arg ilo: A :class:`curator.indexlist.IndexList` object
@@ -1647,6 +1725,9 @@ class Snapshot(object):
             shared filesystems where intermittent timeouts can affect
             validation, but won't likely affect snapshot success.
         :type skip_repo_fs_check: bool
+        :arg repository_cache: An optional
+            :class:`curator.cache.RepositoryCache`, so that the write access
+            check is skipped if it was done recently.
         """
         utils.verify_index_list(ilo)
         # Check here and don't bother with the rest of this if there are no
@@ -1684,6 +1765,9 @@ class Snapshot(object):
         #: Instance variable.
         #: Internally accessible copy of `skip_repo_fs_check`
         self.skip_repo_fs_check = skip_repo_fs_check
+        #: Instance variable.
+        #: Internally accessible copy of `repository_cache`
+        self.repository_cache = repository_cache
         self.state = None
 
         #: Instance variable.
@@ -1743,7 +1827,8 @@ class Snapshot(object):
         Snapshot indices in `index_list.indices`, with options passed.
         """
         if not self.skip_repo_fs_check:
-            utils.test_repo_fs(self.client, self.repository)
+            utils.test_repo_fs(
+                self.client, self.repository, cache=self.repository_cache)
         if utils.snapshot_running(self.client):
             raise exceptions.SnapshotInProgress('Snapshot already in progress.')
         try:
@@ -1781,7 +1866,7 @@ class Restore(object):
             self, slo, name=None, indices=None, include_aliases=False, ignore_unavailable=False,
             include_global_state=False, partial=False, rename_pattern=None,
             rename_replacement=None, extra_settings={}, wait_for_completion=True, wait_interval=9,
-            max_wait=-1, skip_repo_fs_check=False
+            max_wait=-1, skip_repo_fs_check=False, repository_cache=None
     ):
         """
         :arg slo: A :class:`curator.snapshotlist.SnapshotList` object
@@ -1826,6 +1911,9 @@ class Restore(object):
             shared filesystems where intermittent timeouts can affect
             validation, but won't likely affect snapshot success.
         :type skip_repo_fs_check: bool
+        :arg repository_cache: An optional
+            :class:`curator.cache.RepositoryCache`, so that the write access
+            check is skipped if it was done recently.
         """
         self.loggit = logging.getLogger('curator.actions.snapshot')
         utils.verify_snapshot_list(slo)
@@ -1857,6 +1945,7 @@ class Restore(object):
         if indices:
             self.indices = utils.ensure_list(indices)
         else:
+            slo.load_details([self.name])
             self.indices = slo.snapshot_info[self.name]['indices']
         self.wfc = wait_for_completion
         #: Instance variable
@@ -1879,6 +1968,9 @@ class Restore(object):
         #: Instance variable.
         #: Internally accessible copy of `skip_repo_fs_check`
         self.skip_repo_fs_check = skip_repo_fs_check
+        #: Instance variable.
+        #: Internally accessible copy of `repository_cache`
+        self.repository_cache = repository_cache
 
         #: Instance variable.
         #: Populated at instance creation time from the other options
@@ -1982,7 +2074,8 @@ class Restore(object):
         Restore indices with options passed.
         """
         if not self.skip_repo_fs_check:
-            utils.test_repo_fs(self.client, self.repository)
+            utils.test_repo_fs(
+                self.client, self.repository, cache=self.repository_cache)
         if utils.snapshot_running(self.client):
             raise exceptions.SnapshotInProgress('Cannot restore while a snapshot is in progress.')
         try:
@@ -2102,7 +2195,7 @@ class Shrink(object):
         if extra_settings:
             self._merge_extra_settings(extra_settings)
 
-        if utils.get_version(self.client) >= (6, 1, 0):
+        if utils.has_feature(self.client, 'shrink_copies_settings'):
             self._merge_extra_settings({
                 'settings': {
                     'index.routing.allocation.require._name': None,
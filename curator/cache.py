@@ -0,0 +1,318 @@
+"""Caches which keep data between actions, or between Curator runs"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from curator.indexlist import IndexList
+
+def _read_entries(path, version, name):
+    """
+    Return the entries of the cache file at `path`.  A missing, unreadable or
+    outdated file, which is not of `version`, gives no entries, so that they
+    are collected again.
+
+    :arg path: The path of the cache file
+    :arg version: The version of the cache file format
+    :arg name: The name of the cache, for log messages
+    :rtype: dict
+    """
+    loggit = logging.getLogger('curator.cache')
+    if not os.path.isfile(path):
+        loggit.debug('No {0} cache at {1}'.format(name, path))
+        return {}
+    try:
+        with open(path, 'r') as fhandle:
+            data = json.load(fhandle)
+        if data.get('version') != version:
+            raise ValueError('Unsupported version {0}'.format(data.get('version')))
+        entries = data['entries']
+    except (IOError, OSError, ValueError, KeyError, AttributeError) as err:
+        loggit.warning('Ignoring unreadable {0} cache {1}: {2}'.format(name, path, err))
+        return {}
+    loggit.debug(
+        'Loaded {0} {1} cache entries from {2}'.format(len(entries), name, path))
+    return entries
+
+def _write_entries(path, version, entries, name):
+    """
+    Write `entries` to the cache file at `path`, and return `True` if that
+    worked.  The file is replaced atomically, so a concurrent run reads
+    either the old or the new cache, never a partial one.  A failure to write
+    is logged, but is not fatal, as the cache can always be rebuilt.
+
+    :arg path: The path of the cache file
+    :arg version: The version of the cache file format
+    :arg entries: The entries to write
+    :arg name: The name of the cache, for log messages
+    :rtype: bool
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    tmpname = None
+    try:
+        fdesc, tmpname = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fdesc, 'w') as fhandle:
+            json.dump({'version': version, 'entries': entries}, fhandle)
+        os.replace(tmpname, path)
+        return True
+    except (IOError, OSError, TypeError, ValueError) as err:
+        logging.getLogger('curator.cache').warning(
+            'Unable to write {0} cache {1}: {2}'.format(name, path, err))
+        if tmpname is not None and os.path.exists(tmpname):
+            os.unlink(tmpname)
+        return False
+
+class FieldStatsCache(object):
+    """
+    An on-disk cache of the min and max values of a date field, per index.
+
+    Entries are keyed by index UUID, rather than name, so that an index which
+    is deleted and re-created under the same name never reuses a stale entry.
+    Only indices which can no longer be written to should be stored here.
+
+    :arg path: The path of the JSON file which holds the cache.  It is created
+        by the first call to :py:meth:`save`.
+    """
+    #: The version of the cache file format
+    version = 1
+
+    def __init__(self, path):
+        self.loggit = logging.getLogger('curator.cache')
+        #: Instance variable.
+        #: The path of the cache file. **Type:** ``str()``
+        self.path = path
+        #: Instance variable.
+        #: The cached values, as ``{uuid: {field: [min_value, max_value]}}``.
+        #: **Type:** ``dict()``
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """
+        Read `entries` from `path`.  A missing, unreadable or outdated file
+        leaves the cache empty, so that the values are queried again.
+        """
+        self.entries = _read_entries(self.path, self.version, 'field_stats')
+
+    def get(self, uuid, field):
+        """
+        Return the cached ``(min_value, max_value)`` of `field` for the index
+        with `uuid`, or `None` if it is not cached.
+
+        :arg uuid: The index UUID
+        :arg field: The date field name
+        :rtype: tuple
+        """
+        values = self.entries.get(uuid, {}).get(field)
+        return tuple(values) if values else None
+
+    def put(self, uuid, field, min_value, max_value):
+        """
+        Cache the `min_value` and `max_value` of `field` for the index with
+        `uuid`.
+
+        :arg uuid: The index UUID
+        :arg field: The date field name
+        :arg min_value: The minimum value, as epoch seconds
+        :arg max_value: The maximum value, as epoch seconds
+        """
+        if self.get(uuid, field) != (min_value, max_value):
+            self.entries.setdefault(uuid, {})[field] = [min_value, max_value]
+            self.dirty = True
+
+    def prune(self, uuids):
+        """
+        Forget the entries of every index whose UUID is not in `uuids`, so
+        that indices which have been deleted do not stay in the cache.
+
+        :arg uuids: The UUIDs of all indices in the cluster
+        """
+        live = set(uuids)
+        stale = [uuid for uuid in self.entries if uuid not in live]
+        for uuid in stale:
+            del self.entries[uuid]
+        if stale:
+            self.loggit.debug(
+                'Pruned {0} deleted indices from the field_stats cache'.format(len(stale)))
+            self.dirty = True
+
+    def save(self):
+        """
+        Write `entries` to `path`, if anything changed since it was loaded.
+        The file is replaced atomically, so a concurrent run reads either the
+        old or the new cache, never a partial one.  A failure to write is
+        logged, but is not fatal, as the cache can always be rebuilt.
+        """
+        if not self.dirty:
+            return
+        if _write_entries(self.path, self.version, self.entries, 'field_stats'):
+            self.dirty = False
+
+class IndexListCache(object):
+    """
+    Discovered indices, and the data collected about them, kept for the
+    length of one run of an action file, so that each action starts from
+    them instead of discovering the whole cluster again.
+
+    Actions get a :py:meth:`~.curator.indexlist.IndexList.clone` of the
+    cached list.  After an action changes indices, call :py:meth:`invalidate`
+    for them, or :py:meth:`clear` if it may have created new ones.
+
+    :arg kwargs: Any other keyword arguments for
+        :class:`~.curator.indexlist.IndexList`, such as `concurrency`
+    """
+    def __init__(self, **kwargs):
+        self.loggit = logging.getLogger('curator.cache')
+        #: Instance variable.
+        #: The keyword arguments used to create the cached lists.
+        #: **Type:** ``dict()``
+        self.kwargs = kwargs
+        #: Instance variable.
+        #: The cached :class:`~.curator.indexlist.IndexList` objects, by the
+        #: `search_pattern` they were discovered with. **Type:** ``dict()``
+        self.index_lists = {}
+
+    def get(self, client, search_pattern='_all'):
+        """
+        Return a clone of a cached list which has every index matching
+        `search_pattern`, using `client`.  If there is none, the indices are
+        discovered with a single ``_cat/indices`` call, and cached.
+
+        :arg client: An :class:`elasticsearch.Elasticsearch` client object
+        :arg search_pattern: An index expression, such as ``logstash-*``.
+            Default: ``_all``
+        :rtype: :py:class:`~.curator.indexlist.IndexList`
+        """
+        for pattern in ['_all', search_pattern]:
+            if pattern in self.index_lists:
+                self.loggit.debug(
+                    'Reusing indices matching {0} from the index list '
+                    'cache'.format(pattern))
+                return self.index_lists[pattern].clone(client=client)
+        self.loggit.debug(
+            'Discovering indices matching {0} for the index list '
+            'cache'.format(search_pattern))
+        index_list = IndexList(
+            client, lazy=True, discovery='cat', search_pattern=search_pattern,
+            **self.kwargs
+        )
+        self.index_lists[search_pattern] = index_list
+        return index_list.clone(client=client)
+
+    def invalidate(self, indices, deleted=False):
+        """
+        Discard the cached data of `indices`, which an action has changed, so
+        that it is collected again when a later action needs it.
+
+        :arg indices: A list of indices
+        :arg deleted: If `True`, the indices were deleted, and are dropped
+            from the cached lists entirely.
+        """
+        if indices:
+            self.loggit.debug(
+                'Invalidating index list cache entries for {0}'.format(indices))
+            for index_list in self.index_lists.values():
+                index_list.forget(indices, deleted=deleted)
+
+    def clear(self):
+        """
+        Discard the cached lists, so that :py:meth:`get` discovers indices
+        again.  Use this when indices may have been created.
+        """
+        self.loggit.debug('Clearing the index list cache')
+        self.index_lists = {}
+
+class RepositoryCache(object):
+    """
+    Successful repository verifications, each kept for `ttl` seconds, so that
+    a repository which several actions use is verified once per `ttl`,
+    rather than once per action.
+
+    Entries are keyed by repository name and by the IDs of the nodes of the
+    cluster, so that a repository is verified again as soon as a node joins
+    or leaves, as that node may not have access to it.
+
+    :arg path: The path of an optional JSON file which keeps the entries
+        between runs.  It is created by the first call to :py:meth:`save`.  If
+        `None`, entries are only kept in memory, for one run.
+    :arg ttl: The number of seconds a verification is trusted for
+    """
+    #: The version of the cache file format
+    version = 1
+
+    def __init__(self, path=None, ttl=3600):
+        self.loggit = logging.getLogger('curator.cache')
+        #: Instance variable.
+        #: The path of the cache file, if any. **Type:** ``str()``
+        self.path = path
+        #: Instance variable.
+        #: The number of seconds a verification is trusted for.
+        #: **Type:** ``int()``
+        self.ttl = ttl
+        #: Instance variable.
+        #: The epoch time of each verification, by the key from :py:meth:`key`.
+        #: **Type:** ``dict()``
+        self.entries = {}
+        self.dirty = False
+        if path:
+            self.entries = _read_entries(path, self.version, 'repository')
+
+    def key(self, client, repository):
+        """
+        Return the key of `repository` in the cluster `client` connects to,
+        made of its name and a digest of the IDs of the nodes of the cluster,
+        or `None` if the nodes cannot be listed.
+
+        :arg client: An :class:`elasticsearch.Elasticsearch` client object
+        :arg repository: The Elasticsearch snapshot repository name
+        :rtype: str
+        """
+        try:
+            nodes = sorted(
+                row['id'] for row in
+                client.cat.nodes(format='json', h='id', full_id=True)
+            )
+        except Exception as err:
+            self.loggit.debug('Unable to list the nodes of the cluster: {0}'.format(err))
+            return None
+        digest = hashlib.sha1(','.join(nodes).encode('utf-8')).hexdigest()
+        return '{0}/{1}'.format(repository, digest)
+
+    def verified(self, key):
+        """
+        Return `True` if the repository with `key` was verified less than
+        `ttl` seconds ago.
+
+        :arg key: A key from :py:meth:`key`
+        :rtype: bool
+        """
+        if key is None or key not in self.entries:
+            return False
+        return time.time() - self.entries[key] < self.ttl
+
+    def put(self, key):
+        """
+        Record that the repository with `key` was just verified, and forget
+        verifications which have expired.
+
+        :arg key: A key from :py:meth:`key`
+        """
+        if key is None:
+            return
+        now = time.time()
+        self.entries = {
+            k: v for k, v in self.entries.items() if now - v < self.ttl}
+        self.entries[key] = now
+        self.dirty = True
+
+    def save(self):
+        """
+        Write `entries` to `path`, if there is one and anything changed since
+        it was loaded.  See :py:class:`FieldStatsCache` for how it is written.
+        """
+        if not self.path or not self.dirty:
+            return
+        if _write_entries(self.path, self.version, self.entries, 'repository'):
+            self.dirty = False
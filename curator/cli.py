@@ -6,12 +6,16 @@ import yaml
 import click
 from voluptuous import Schema
 from curator import actions
+from curator.cache import FieldStatsCache, IndexListCache, RepositoryCache
 from curator.config_utils import process_config, password_filter
 from curator.defaults import settings
 from curator.exceptions import ClientException, ConfigurationError, NoIndices, NoSnapshots
 from curator.indexlist import IndexList
 from curator.snapshotlist import SnapshotList
-from curator.utils import get_client, get_yaml, prune_nones, validate_actions, get_write_index
+from curator.utils import (
+    get_client, get_yaml, prune_nones, validate_actions, get_write_index,
+    get_search_pattern, set_request_timeout
+)
 from curator.validators import SchemaCheck
 from curator._version import __version__
 
@@ -36,6 +40,35 @@ CLASS_MAP = {
     'unfreeze' : actions.Unfreeze,
 }
 
+# Actions which may create indices, so that indices must be discovered again
+INDEX_CREATING_ACTIONS = ['create_index', 'reindex', 'restore', 'rollover', 'shrink']
+# Actions which change the state, settings or segments of existing indices
+INDEX_CHANGING_ACTIONS = [
+    'allocation', 'close', 'forcemerge', 'freeze', 'index_settings', 'open',
+    'replicas', 'unfreeze',
+]
+
+def invalidate_index_cache(index_cache, action, action_obj):
+    """
+    Discard what `index_cache` knows about the indices `action_obj` changed,
+    after it is done, so that later actions collect it again.
+
+    :arg index_cache: A :class:`curator.cache.IndexListCache` object
+    :arg action: The name of the action
+    :arg action_obj: The action object which was run
+    """
+    if action in INDEX_CREATING_ACTIONS:
+        index_cache.clear()
+    elif action == 'delete_indices':
+        # Only the indices verified as deleted are dropped.  Any others still
+        # exist, so they are only collected again.
+        deleted = set(action_obj.deleted_indices)
+        index_cache.invalidate(action_obj.deleted_indices, deleted=True)
+        index_cache.invalidate(
+            [idx for idx in action_obj.index_list.indices if idx not in deleted])
+    elif action in INDEX_CHANGING_ACTIONS:
+        index_cache.invalidate(action_obj.index_list.indices)
+
 def process_action(client, config, **kwargs):
     """
     Do the `action` in the configuration dictionary, using the associated args.
@@ -56,10 +89,30 @@ def process_action(client, config, **kwargs):
 
     action_class = CLASS_MAP[action]
 
+    # IndexList settings which come from the client configuration
+    ilo_kwargs = {
+        'concurrency': kwargs.get('request_concurrency', 1),
+        'msearch_batch_size': kwargs.get('msearch_batch_size', 100),
+        'field_stats_cache': kwargs.get('field_stats_cache'),
+    }
+    # Indices discovered by an earlier action in this run, if any
+    index_cache = kwargs.get('index_cache')
+    def index_list(filter_list):
+        # Only discover the indices the leading pattern filters can keep
+        search_pattern = get_search_pattern(filter_list)
+        if index_cache is not None:
+            return index_cache.get(client, search_pattern)
+        return IndexList(
+            client, lazy=True, discovery='cat', search_pattern=search_pattern,
+            **ilo_kwargs
+        )
+
     # Add some settings to mykwargs...
     if action == 'delete_indices':
         mykwargs['master_timeout'] = (
             kwargs['master_timeout'] if 'master_timeout' in kwargs else 30)
+    if action in ['restore', 'snapshot']:
+        mykwargs['repository_cache'] = kwargs.get('repository_cache')
 
     ### Update the defaults with whatever came with opts, minus any Nones
     mykwargs.update(prune_nones(opts))
@@ -70,38 +123,52 @@ def process_action(client, config, **kwargs):
         # Special behavior for this action, as it has 2 index lists
         logger.debug('Running "{0}" action'.format(action.upper()))
         action_obj = action_class(**mykwargs)
-        removes = IndexList(client)
-        adds = IndexList(client)
         if 'remove' in config:
             logger.debug(
                 'Removing indices from alias "{0}"'.format(opts['name']))
-            removes.iterate_filters(config['remove'])
+            removes = index_list(config['remove'].get('filters', []))
+            removes.iterate_filters(
+                config['remove'], optimize=kwargs.get('optimize_filters', False))
             action_obj.remove(
                 removes, warn_if_no_indices=opts['warn_if_no_indices'])
         if 'add' in config:
             logger.debug('Adding indices to alias "{0}"'.format(opts['name']))
-            adds.iterate_filters(config['add'])
+            adds = index_list(config['add'].get('filters', []))
+            adds.iterate_filters(
+                config['add'], optimize=kwargs.get('optimize_filters', False))
             action_obj.add(adds, warn_if_no_indices=opts['warn_if_no_indices'])
     elif action in ['cluster_routing', 'create_index', 'rollover']:
         action_obj = action_class(client, **mykwargs)
     elif action == 'delete_snapshots' or action == 'restore':
         logger.debug('Running "{0}"'.format(action))
-        slo = SnapshotList(client, repository=opts['repository'])
+        slo = SnapshotList(
+            client, repository=opts['repository'], discovery='cat',
+            page_size=settings.snapshot_page_size()
+        )
         slo.iterate_filters(config)
         # We don't need to send this value to the action
         mykwargs.pop('repository')
         action_obj = action_class(slo, **mykwargs)
     else:
         logger.debug('Running "{0}"'.format(action.upper()))
-        ilo = IndexList(client)
-        ilo.iterate_filters(config)
+        ilo = index_list(config.get('filters', []))
+        ilo.iterate_filters(
+            config, optimize=kwargs.get('optimize_filters', False))
         action_obj = action_class(ilo, **mykwargs)
     ### Do the action
     if 'dry_run' in kwargs and kwargs['dry_run']:
         action_obj.do_dry_run()
     else:
         logger.debug('Doing the action here.')
-        action_obj.do_action()
+        try:
+            action_obj.do_action()
+        except Exception:
+            # It is unknown how much of the action was done
+            if index_cache is not None:
+                index_cache.clear()
+            raise
+        if index_cache is not None:
+            invalidate_index_cache(index_cache, action, action_obj)
 
 def run(config, action_file, dry_run=False):
     """
@@ -112,8 +179,30 @@ def run(config, action_file, dry_run=False):
     logger.debug('Client and logging options validated.')
 
     # Extract this and save it for later, in case there's no timeout_override.
-    default_timeout = client_args.pop('timeout')
+    default_timeout = client_args['timeout']
     logger.debug('default_timeout = {0}'.format(default_timeout))
+    # These are not client connection settings, so extract them, too.
+    request_concurrency = client_args.pop('request_concurrency', 1)
+    logger.debug('request_concurrency = {0}'.format(request_concurrency))
+    msearch_batch_size = client_args.pop('msearch_batch_size', 100)
+    logger.debug('msearch_batch_size = {0}'.format(msearch_batch_size))
+    field_stats_cache = client_args.pop('field_stats_cache', None)
+    logger.debug('field_stats_cache = {0}'.format(field_stats_cache))
+    if field_stats_cache:
+        # One cache for all actions, so each reuses what the others found
+        field_stats_cache = FieldStatsCache(field_stats_cache)
+    # Repositories are verified once per run, or per TTL if kept on disk
+    repository_cache = RepositoryCache(
+        client_args.pop('repository_cache', None),
+        ttl=client_args.pop('repository_cache_ttl', 3600)
+    )
+    logger.debug('repository_cache = {0}'.format(repository_cache.path))
+    # Indices are discovered once, and only what an action changed is
+    # collected again for later actions
+    index_cache = IndexListCache(
+        concurrency=request_concurrency, msearch_batch_size=msearch_batch_size,
+        field_stats_cache=field_stats_cache
+    )
     #########################################
     ### Start working on the actions here ###
     #########################################
@@ -124,6 +213,8 @@ def run(config, action_file, dry_run=False):
     actions = action_dict['actions']
     logger.debug('Full list of actions: {0}'.format(password_filter(actions)))
     action_keys = sorted(list(actions.keys()))
+    # One client, and its pool of connections, serves every action
+    client = None
     for idx in action_keys:
         action = actions[idx]['action']
         action_disabled = actions[idx]['options'].pop('disable_action')
@@ -138,6 +229,8 @@ def run(config, action_file, dry_run=False):
         logger.debug('ignore_empty_list = {0}'.format(ignore_empty_list))
         allow_ilm = actions[idx]['options'].pop('allow_ilm_indices')
         logger.debug('allow_ilm_indices = {0}'.format(allow_ilm))
+        optimize_filters = actions[idx]['options'].pop('optimize_filters')
+        logger.debug('optimize_filters = {0}'.format(optimize_filters))
 
         ### Skip to next action if 'disabled'
         if action_disabled:
@@ -150,22 +243,30 @@ def run(config, action_file, dry_run=False):
             logger.info('Preparing Action ID: {0}, "{1}"'.format(idx, action))
         # Override the timeout, if specified, otherwise use the default.
         if isinstance(timeout_override, int):
-            client_args['timeout'] = timeout_override
+            timeout = timeout_override
         else:
-            client_args['timeout'] = default_timeout
+            timeout = default_timeout
 
         # Set up action kwargs
         kwargs = {}
-        kwargs['master_timeout'] = (
-            client_args['timeout'] if client_args['timeout'] <= 300 else 300)
+        kwargs['master_timeout'] = timeout if timeout <= 300 else 300
         kwargs['dry_run'] = dry_run
+        kwargs['optimize_filters'] = optimize_filters
+        kwargs['request_concurrency'] = request_concurrency
+        kwargs['msearch_batch_size'] = msearch_batch_size
+        kwargs['field_stats_cache'] = field_stats_cache
+        kwargs['index_cache'] = index_cache
+        kwargs['repository_cache'] = repository_cache
 
-        # Create a client object for each action...
-        logger.info('Creating client object and testing connection')
-        try:
-            client = get_client(**client_args)
-        except (ClientException, ConfigurationError):
-            sys.exit(1)
+        # Create the client object for the first action which is performed...
+        if client is None:
+            logger.info('Creating client object and testing connection')
+            try:
+                client = get_client(**client_args)
+            except (ClientException, ConfigurationError):
+                sys.exit(1)
+        # ...and apply this action's timeout to each of its requests
+        set_request_timeout(client, timeout)
         ### Filter ILM indices unless expressly permitted
         if allow_ilm:
             logger.warning('allow_ilm_indices: true')
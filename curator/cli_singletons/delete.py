@@ -42,6 +42,11 @@ def delete_indices(ctx, ignore_empty_list, allow_ilm_indices, filter_list):
 @click.option('--repository', type=str, required=True, help='Snapshot repository name')
 @click.option('--retry_count', type=int, help='Number of times to retry (max 3)')
 @click.option('--retry_interval', type=int, help='Time in seconds between retries')
+@click.option(
+    '--batch_size',
+    type=int,
+    help='Maximum number of snapshots to delete per request (Elasticsearch 7.8+)'
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -61,7 +66,7 @@ def delete_indices(ctx, ignore_empty_list, allow_ilm_indices, filter_list):
 )
 @click.pass_context
 def delete_snapshots(
-        ctx, repository, retry_count, retry_interval,
+        ctx, repository, retry_count, retry_interval, batch_size,
         ignore_empty_list, allow_ilm_indices, filter_list
     ):
     """
@@ -70,6 +75,7 @@ def delete_snapshots(
     manual_options = {
         'retry_count': retry_count,
         'retry_interval': retry_interval,
+        'batch_size': batch_size,
         'allow_ilm_indices': allow_ilm_indices,
     }
     # ctx.info_name is the name of the function or name specified in @click.command decorator
@@ -8,10 +8,11 @@ from curator.actions import (
     ForceMerge, Freeze, IndexSettings, Open, Reindex, Replicas, Restore, Rollover, Shrink,
     Snapshot, Unfreeze
 )
-from curator.defaults.settings import snapshot_actions
+from curator.cache import FieldStatsCache, RepositoryCache
+from curator.defaults.settings import snapshot_actions, snapshot_page_size
 from curator.exceptions import ConfigurationError, NoIndices, NoSnapshots
 from curator.validators import SchemaCheck, filters, options
-from curator.utils import get_client, prune_nones, validate_filters
+from curator.utils import get_client, get_search_pattern, prune_nones, validate_filters
 
 
 
@@ -38,7 +39,7 @@ CLASS_MAP = {
 
 EXCLUDED_OPTIONS = [
     'ignore_empty_list', 'timeout_override',
-    'continue_if_exception', 'disable_action'
+    'continue_if_exception', 'disable_action', 'optimize_filters'
 ]
 
 class cli_action():
@@ -87,6 +88,21 @@ class cli_action():
                     self.action_kwargs[k] = kwargs[k] if k in kwargs else None
         else:
             self.check_filters(filter_list)
+        # IndexList settings which come from the client configuration
+        self.ilo_kwargs = {
+            'concurrency': client_args.pop('request_concurrency', 1),
+            'msearch_batch_size': client_args.pop('msearch_batch_size', 100),
+            'field_stats_cache': None,
+        }
+        field_stats_cache = client_args.pop('field_stats_cache', None)
+        if field_stats_cache:
+            self.ilo_kwargs['field_stats_cache'] = FieldStatsCache(field_stats_cache)
+        repository_cache = client_args.pop('repository_cache', None)
+        repository_cache_ttl = client_args.pop('repository_cache_ttl', 3600)
+        # A singleton runs one action, so only an on-disk cache can help
+        if repository_cache and action in ['restore', 'snapshot']:
+            self.options['repository_cache'] = RepositoryCache(
+                repository_cache, ttl=repository_cache_ttl)
         self.client = get_client(**client_args)
         self.ignore = ignore_empty_list
 
@@ -154,9 +170,16 @@ class cli_action():
     def get_list_object(self):
         """Get either a SnapshotList or IndexList object"""
         if self.action in snapshot_actions() or self.action == 'show_snapshots':
-            self.list_object = SnapshotList(self.client, repository=self.repository)
+            self.list_object = SnapshotList(
+                self.client, repository=self.repository, discovery='cat',
+                page_size=snapshot_page_size()
+            )
         else:
-            self.list_object = IndexList(self.client)
+            self.list_object = IndexList(
+                self.client,
+                search_pattern=get_search_pattern(getattr(self, 'filters', [])),
+                **self.ilo_kwargs
+            )
 
     def get_alias_obj(self):
         """Get the Alias object"""
@@ -170,7 +193,11 @@ class cli_action():
                         self.alias['name'] # 2 = the alias name
                     )
                 )
-                self.alias[k]['ilo'] = IndexList(self.client)
+                self.alias[k]['ilo'] = IndexList(
+                    self.client,
+                    search_pattern=get_search_pattern(self.alias[k]['filters']),
+                    **self.ilo_kwargs
+                )
                 self.alias[k]['ilo'].iterate_filters({'filters':self.alias[k]['filters']})
                 fltr = getattr(action_obj, k)
                 fltr(self.alias[k]['ilo'], warn_if_no_indices=self.alias['wini'])
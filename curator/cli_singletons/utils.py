@@ -30,7 +30,7 @@ CLASS_MAP = {
 
 EXCLUDED_OPTIONS = [
     'ignore_empty_list', 'timeout_override',
-    'continue_if_exception', 'disable_action'
+    'continue_if_exception', 'disable_action', 'optimize_filters'
 ]
 
 def get_width():
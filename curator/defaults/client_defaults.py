@@ -25,6 +25,11 @@ def config_client():
         Optional('http_auth', default=None): Any(None, *string_types),
         Optional('timeout', default=30): All(Coerce(int), Range(min=1, max=86400)),
         Optional('master_only', default=False): Boolean(),
+        Optional('request_concurrency', default=1): All(Coerce(int), Range(min=1, max=10)),
+        Optional('msearch_batch_size', default=100): All(Coerce(int), Range(min=1, max=1000)),
+        Optional('field_stats_cache', default=None): Any(None, *string_types),
+        Optional('repository_cache', default=None): Any(None, *string_types),
+        Optional('repository_cache_ttl', default=3600): All(Coerce(int), Range(min=0, max=604800)),
         Optional('api_key', default=None): Any(None, *string_types),
         Optional('apikey_auth', default=None): Any(None, *string_types),
         Optional('skip_version_test', default=False): Boolean(),
@@ -12,6 +12,9 @@ def allocation_type():
 def allow_ilm_indices():
     return {Optional('allow_ilm_indices', default=False): Any(bool, All(Any(*string_types), Boolean()))}
 
+def batch_size():
+    return {Optional('batch_size', default=1): All(Coerce(int), Range(min=1, max=10000))}
+
 def conditions():
     return {Optional('conditions'): {Optional('max_age'): Any(*string_types), Optional('max_docs'): Coerce(int), Optional('max_size'): Any(*string_types)}}
 
@@ -116,6 +119,9 @@ def number_of_replicas():
 def number_of_shards():
     return {Optional('number_of_shards', default=1): All(Coerce(int), Range(min=1, max=99))}
 
+def optimize_filters():
+    return {Optional('optimize_filters', default=False): Any(bool, All(Any(*string_types), Boolean()))}
+
 def partial():
     return {Optional('partial', default=False): Any(bool, All(Any(*string_types), Boolean()))}
 
@@ -11,6 +11,20 @@ def version_min():
     """Return the minimum Elasticsearch version Curator supports"""
     return (5, 0, 0)
 
+def feature_versions():
+    """
+    Return a dictionary of the optional Elasticsearch features Curator uses,
+    with the minimum version which supports each of them
+    """
+    return {
+        'sliced_reindex': (5, 1, 0),
+        'rollover_max_size': (6, 1, 0),
+        'shrink_copies_settings': (6, 1, 0),
+        'is_write_index': (6, 5, 0),
+        'multi_snapshot_delete': (7, 8, 0),
+        'snapshot_pagination': (7, 14, 0),
+    }
+
 # Default Config file location
 def config_file():
     """Return the default config file location"""
@@ -26,6 +40,71 @@ def regex_map():
         'suffix': r'^.*{0}$',
     }
 
+def cat_indices_columns():
+    """Return the ``_cat/indices`` columns used for index discovery"""
+    return 'index,uuid,status,pri,rep,creation.date,docs.count,store.size,pri.store.size'
+
+def cat_snapshots_columns():
+    """Return the ``_cat/snapshots`` columns used for snapshot discovery"""
+    return 'id,status,start_epoch'
+
+def index_setting_fields():
+    """
+    Return the ``index`` settings which Curator reads from index metadata, in
+    `IndexList`
+    """
+    return [
+        'blocks', 'creation_date', 'lifecycle', 'number_of_replicas',
+        'number_of_shards', 'routing', 'uuid',
+    ]
+
+def filter_paths():
+    """
+    Return the ``filter_path`` of each request of which Curator reads only
+    part of the response, by call site, so that the rest is never sent
+    """
+    metadata = 'metadata.indices.*.'
+    return {
+        'cluster_state_metadata': ','.join(
+            [metadata + 'state', metadata + 'rollover_info'] +
+            [metadata + 'settings.index.' + f for f in index_setting_fields()]
+        ),
+        'index_settings': ','.join(
+            ['*.settings.index.' + f for f in index_setting_fields()]),
+        'index_stats': ','.join([
+            'indices.*.total.store.size_in_bytes',
+            'indices.*.total.docs.count',
+            'indices.*.primaries.store.size_in_bytes',
+        ]),
+        'index_segments': 'indices.*.total.segments.count',
+        'relocate_check': 'routing_table.indices.*.shards.*.state',
+        'restore_check': '*.shards.stage',
+        'snapshot_check': 'snapshots.state',
+        'snapshot_status': 'snapshots.snapshot',
+        'find_snapshot_tasks': 'nodes.*.tasks.*.action',
+    }
+
+def pruned_snapshot_fields():
+    """
+    Return the fields of each snapshot, which can be as long as its list of
+    indices, that are not kept when listing all snapshots in a repository
+    """
+    return ['indices', 'data_streams', 'feature_states', 'index_details', 'failures']
+
+def index_chunk_size():
+    """
+    Return the csv string length of index names to start chunked requests
+    with, before any request has been found to be too large
+    """
+    return 8192
+
+def snapshot_page_size():
+    """
+    Return the number of snapshots to request per page when listing a
+    repository with the snapshot API, on versions which support it
+    """
+    return 1000
+
 def date_regex():
     """Return a dictionary/map of the strftime string characters and their string length"""
     return {
@@ -113,6 +192,7 @@ def default_options():
         'continue_if_exception': False,
         'disable_action': False,
         'ignore_empty_list': False,
+        'optimize_filters': False,
         'timeout_override': None,
     }
 
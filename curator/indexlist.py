@@ -3,13 +3,18 @@ import time
 import re
 import itertools
 import logging
+import sys
 from elasticsearch.exceptions import NotFoundError, TransportError
 from curator import exceptions, utils
 from curator.defaults import settings
+from curator.records import IndexAge, IndexInfo
 from curator.validators import SchemaCheck, filters
 
 class IndexList(object):
-    def __init__(self, client):
+    def __init__(
+            self, client, lazy=False, discovery='settings', concurrency=1,
+            msearch_batch_size=100, field_stats_cache=None, search_pattern='_all'
+        ):
         utils.verify_client_object(client)
         self.loggit = logging.getLogger('curator.indexlist')
         #: An Elasticsearch Client object
@@ -18,18 +23,86 @@ class IndexList(object):
         #: Instance variable.
         #: Information extracted from indices, such as segment count, age, etc.
         #: Populated at instance creation time, and by other private helper
-        #: methods, as needed. **Type:** ``dict()``
+        #: methods, as needed. **Type:** ``dict()`` of
+        #: :py:class:`~.curator.records.IndexInfo`
         self.index_info = {}
-        #: Instance variable.
-        #: The running list of indices which will be used by an Action class.
-        #: Populated at instance creation time. **Type:** ``list()``
+        # Indices which filters have removed from `indices`, but which have not
+        # been pruned from it yet.  See the `indices` property.
+        self._removed = set()
         self.indices = []
         #: Instance variable.
         #: All indices in the cluster at instance creation time.
         #: **Type:** ``list()``
         self.all_indices = []
+        #: Instance variable.
+        #: If `True`, index metadata and stats are not collected at instance
+        #: creation time, but only when a filter or action first reads them,
+        #: and then only for the indices remaining in `indices` at that time.
+        #: **Type:** ``bool()``
+        self.lazy = lazy
+        #: Instance variable.
+        #: The ``index`` settings of each index which Curator reads (see
+        #: :py:func:`~.curator.defaults.settings.index_setting_fields`), as of
+        #: when they were first collected along with its metadata.  Filters
+        #: which test settings read them from here, rather than fetching them
+        #: again.
+        #: **Type:** ``dict()``
+        self.index_settings = {}
+        # The indices for which each data group has already been collected
+        self._loaded = {'metadata': set(), 'settings': set(), 'stats': set()}
+        # The arguments the `name` and `field_stats` ages were last calculated
+        # with.  Indices are only ever removed from the list, so ages which
+        # were calculated with the same arguments are still complete.
+        self._ages_calculated = {}
+        #: Instance variable.
+        #: How indices are discovered at instance creation time.  ``settings``
+        #: gets names from the index settings API, then metadata and stats in
+        #: chunked cluster state and index stats calls.  ``cat`` gets all of
+        #: them from a single ``_cat/indices`` call, falling back to
+        #: ``settings`` if that fails. **Type:** ``str()``
+        self.discovery = discovery
+        #: Instance variable.
+        #: The maximum number of chunked requests, such as for metadata, stats
+        #: or settings, which may be in flight at the same time.  ``1`` sends
+        #: them one after another. **Type:** ``int()``
+        self.concurrency = concurrency
+        #: Instance variable.
+        #: The number of indices queried per ``_msearch`` request when ages
+        #: are read from the min and max values of a field. **Type:** ``int()``
+        self.msearch_batch_size = msearch_batch_size
+        #: Instance variable.
+        #: An optional :class:`curator.cache.FieldStatsCache`, which keeps the
+        #: min and max values of a field for indices which can no longer be
+        #: written to, so that they are not queried again in later runs.
+        self.field_stats_cache = field_stats_cache
+        #: Instance variable.
+        #: The index expression, such as ``logstash-*``, which limits the
+        #: indices discovered at instance creation time, and so every later
+        #: request for their data. See :py:func:`curator.utils.get_search_pattern`.
+        #: **Type:** ``str()``
+        self.search_pattern = search_pattern
         self.__get_indices()
 
+    @property
+    def indices(self):
+        """
+        The running list of indices which will be used by an Action class.
+        Populated at instance creation time. **Type:** ``list()``
+
+        Filters mark indices for removal in constant time, and they are pruned
+        from the list in a single pass the next time it is read.
+        """
+        if self._removed:
+            self._indices[:] = [
+                idx for idx in self._indices if idx not in self._removed]
+            self._removed = set()
+        return self._indices
+
+    @indices.setter
+    def indices(self, value):
+        self._indices = value
+        self._removed = set()
+
     def __actionable(self, idx):
         self.loggit.debug(
             'Index {0} is actionable and remains in the list.'.format(idx))
@@ -37,7 +110,7 @@ class IndexList(object):
     def __not_actionable(self, idx):
             self.loggit.debug(
                 'Index {0} is not actionable, removing from list.'.format(idx))
-            self.indices.remove(idx)
+            self._removed.add(idx)
 
     def __excludify(self, condition, exclude, index, msg=None):
         if condition == True:
@@ -62,32 +135,87 @@ class IndexList(object):
         Pull all indices into `all_indices`, then populate `indices` and
         `index_info`
         """
-        self.loggit.debug('Getting all indices')
-        self.all_indices = utils.get_indices(self.client)
+        self.loggit.debug(
+            'Getting all indices matching {0}'.format(self.search_pattern))
+        if self.discovery == 'cat':
+            try:
+                self.__get_cat_indices()
+                return
+            except (exceptions.FailedExecution, KeyError, ValueError) as err:
+                self.loggit.warning(
+                    'Unable to discover indices with _cat/indices, falling back '
+                    'to multiple API calls. Error: {0}'.format(err)
+                )
+                self.index_info = {}
+                self._loaded = {'metadata': set(), 'settings': set(), 'stats': set()}
+        elif self.discovery != 'settings':
+            raise ValueError(
+                'Invalid value for "discovery": {0}'.format(self.discovery))
+        self.all_indices = [
+            sys.intern(index)
+            for index in utils.get_indices(self.client, self.search_pattern)
+        ]
         self.indices = self.all_indices[:]
         if self.indices:
             for index in self.indices:
                 self.__build_index_info(index)
-            self._get_metadata()
-            self._get_index_stats()
+            if not self.lazy:
+                self._get_metadata()
+                self._get_index_stats()
+
+    def __get_cat_indices(self):
+        """
+        Pull all indices into `all_indices`, then populate `indices` and
+        `index_info`, all from a single ``_cat/indices`` call
+        """
+        rows = utils.get_cat_indices(self.client, self.search_pattern)
+        self.all_indices = [sys.intern(row['index']) for row in rows]
+        self.indices = self.all_indices[:]
+        for index, row in zip(self.all_indices, rows):
+            self.__build_index_info(index)
+            s = self.index_info[index]
+            s['state'] = row['status']
+            s['uuid'] = row.get('uuid')
+            s['number_of_shards'] = row['pri']
+            s['number_of_replicas'] = row['rep']
+            if row['creation.date'] is None:
+                self.loggit.warn(
+                    'Index: {0} has no "creation_date"! This implies '
+                    'that the index predates Elasticsearch v1.4. For '
+                    'safety, this index will be removed from the '
+                    'actionable list.'.format(index)
+                )
+                self.__not_actionable(index)
+            else:
+                s['age']['creation_date'] = utils.fix_epoch(row['creation.date'])
+            # Closed indices report no stats, like in `_get_index_stats`, and
+            # open indices with unassigned primaries report null values
+            if s['state'] != 'close':
+                s['size_in_bytes'] = int(row['store.size'] or 0)
+                s['docs'] = int(row['docs.count'] or 0)
+                s['primary_size_in_bytes'] = int(row['pri.store.size'] or 0)
+        self._loaded['metadata'].update(self.all_indices)
+        self._loaded['stats'].update(self.all_indices)
 
     def __build_index_info(self, index):
         """
-        Ensure that `index` is a key in `index_info`. If not, create a
-        sub-dictionary structure under that key.
+        Ensure that `index` is a key in `index_info`. If not, create an
+        `IndexInfo` record under that key.  Index names are interned, so that
+        `all_indices`, `indices` and the keys of `index_info` and
+        `index_settings` all share a single copy of each name.
         """
         self.loggit.debug(
             'Building preliminary index metadata for {0}'.format(index))
         if not index in self.index_info:
-            self.index_info[index] = {
-                "age" : {},
-                "number_of_replicas" : 0,
-                "number_of_shards" : 0,
-                "segments" : 0,
-                "size_in_bytes" : 0,
-                "docs" : 0,
-                "state" : "",
-            }
+            self.index_info[sys.intern(index)] = IndexInfo(
+                age=IndexAge(),
+                number_of_replicas=0,
+                number_of_shards=0,
+                segments=0,
+                size_in_bytes=0,
+                docs=0,
+                state='',
+            )
 
     def __map_method(self, ft):
         methods = {
@@ -110,16 +238,113 @@ class IndexList(object):
         }
         return methods[ft]
 
-    def _get_index_stats(self):
+    def needs_data(self, group):
+        """
+        Return the indices in `indices` which do not yet have data `group`
+        populated in `index_info`.
+
+        :arg group: One of ``metadata`` (state, shard and replica counts,
+            creation date, routing), ``settings`` (`index_settings`, which
+            ``_cat/indices`` discovery does not collect) or ``stats`` (size
+            and doc counts)
+        :rtype: list
+        """
+        return [idx for idx in self.indices if idx not in self._loaded[group]]
+
+    def load_data(self, *groups):
+        """
+        Populate `index_info` with data `groups` for any index in `indices`
+        which does not have them yet.  Unless `lazy` is `True`, everything but
+        the ``settings`` after ``_cat/indices`` discovery is collected at
+        instance creation time, so only ``settings`` are loaded here.
+
+        Segment counts and ``field_stats`` ages are always collected on demand
+        by the filters which use them, so they are not data groups here.
+
+        :arg groups: Any of ``metadata``, ``settings`` or ``stats``
+        """
+        if not self.lazy:
+            groups = tuple(group for group in groups if group == 'settings')
+        # Stats collection skips closed indices, so it needs the state first
+        if 'stats' in groups:
+            groups = ('metadata',) + groups
+        if 'metadata' in groups:
+            needed = self.needs_data('metadata')
+            if needed:
+                self._get_metadata(indices=needed)
+        if 'settings' in groups:
+            # Settings come from the same cluster state call as metadata
+            needed = self.needs_data('settings')
+            if needed:
+                self._get_metadata(indices=needed)
+            # The filters which read settings must not let an index through
+            # because its settings could not be read, so fetch any still
+            # missing again, and let errors raise this time
+            missing = [idx for idx in self.indices if idx not in self.index_settings]
+            if missing:
+                self._get_missing_settings(missing)
+        if 'stats' in groups:
+            needed = self.needs_data('stats')
+            if needed:
+                self._get_index_stats(indices=needed)
+
+    def clone(self, client=None):
+        """
+        Return a new `IndexList` of the same indices, without discovering
+        them again.  The clone has its own `indices`, so filters on one list
+        do not affect the other, but it shares `index_info`, `index_settings`
+        and the record of which data groups are loaded, as these describe the
+        cluster rather than any one filter chain.  Data either list loads
+        later is therefore available to both.
+
+        :arg client: An :class:`elasticsearch.Elasticsearch` client object for
+            the clone to use.  Default: `client`
+        :rtype: :py:class:`~.curator.indexlist.IndexList`
+        """
+        new = IndexList.__new__(IndexList)
+        new.__dict__.update(self.__dict__)
+        if client is not None:
+            utils.verify_client_object(client)
+            new.client = client
+        new.indices = self.indices[:]
+        new._ages_calculated = {}
+        return new
+
+    def forget(self, indices, deleted=False):
+        """
+        Discard everything collected about `indices`, after an action has
+        changed them, so that it is collected again when next needed.  This
+        requires `lazy`, as otherwise the data would not be collected again.
+
+        :arg indices: A list of indices
+        :arg deleted: If `True`, the indices no longer exist, and are removed
+            from `all_indices` and `indices` as well.
+        """
+        forgotten = set(indices)
+        for index in forgotten:
+            for loaded in self._loaded.values():
+                loaded.discard(index)
+            self.index_info.pop(index, None)
+            self.index_settings.pop(index, None)
+            if not deleted and index in self.all_indices:
+                self.__build_index_info(index)
+        if deleted:
+            self.all_indices[:] = [
+                idx for idx in self.all_indices if idx not in forgotten]
+            self._removed.update(forgotten)
+
+    def _get_index_stats(self, indices=None):
         """
         Populate `index_info` with index `size_in_bytes`, `primary_size_in_bytes` and doc count
         information for each index.
+
+        :arg indices: The indices to collect stats for.  Default: `indices`
         """
         self.loggit.debug('Getting index stats')
         self.empty_list_check()
         # Subroutine to do the dirty work
         def iterate_over_stats(stats):
-            for index in stats['indices']:
+            for index in stats.get('indices', {}):
                 size = stats['indices'][index]['total']['store']['size_in_bytes']
                 docs = stats['indices'][index]['total']['docs']['count']
                 primary_size = stats['indices'][index]['primaries']['store']['size_in_bytes']
@@ -133,75 +358,108 @@ class IndexList(object):
                 self.index_info[index]['docs'] = docs
                 self.index_info[index]['primary_size_in_bytes'] = primary_size
 
-        working_list = self.working_list()
-        for index in self.working_list():
-            if self.index_info[index]['state'] == 'close':
-                working_list.remove(index)
+        if indices is None:
+            indices = self.working_list()
+        self._loaded['stats'].update(indices)
+        working_list = [
+            index for index in indices if self.index_info[index]['state'] != 'close'
+        ]
         if working_list:
-            index_lists = utils.chunk_index_list(working_list)
-            for l in index_lists:
-                stats_result = {}
-
-                try:
-                    stats_result.update(self._get_indices_stats(l))
-                except TransportError as err:
-                    if err.status_code == 413:
-                        self.loggit.debug('Huge Payload 413 Error - Trying to get information with multiple requests')
-                        stats_result = {}
-                        stats_result.update(self._bulk_queries(l, self._get_indices_stats))
-
+            for _, stats_result in self._fetch_chunks(
+                    working_list, self._get_indices_stats, 'indices.stats'):
                 iterate_over_stats(stats_result)
 
     def _get_indices_stats(self, data):
-        return self.client.indices.stats(index=utils.to_csv(data), metric='store,docs')
+        return self.client.indices.stats(
+            index=utils.to_csv(data), metric='store,docs',
+            filter_path=settings.filter_paths()['index_stats']
+        )
 
-    def _bulk_queries(self, data, exec_func):
-        slice_number = 10
-        query_result = {}
-        loop_number = round(len(data)/slice_number) if round(len(data)/slice_number) > 0 else 1
-        self.loggit.debug("Bulk Queries - number requests created: {0}".format(loop_number))
+    def _fetch_chunks(self, indices, exec_func, endpoint):
+        """
+        Split `indices` into chunks and fetch each of them with `exec_func`,
+        with up to `concurrency` requests in flight at once.  Chunks which are
+        too large for the cluster are split further.  Any other transport
+        error yields an empty result for that chunk.  Return a list of
+        ``(chunk, result)`` pairs, in chunk order, so that callers can merge
+        the results into `index_info` from the calling thread.
+
+        :arg indices: A list of indices
+        :arg exec_func: The method which makes the request for a chunk
+        :arg endpoint: The name of the API endpoint `exec_func` calls
+        :rtype: list
+        """
+        def fetch(data):
+            try:
+                return exec_func(data)
+            except TransportError as err:
+                if utils.request_too_large(err):
+                    raise
+                return {}
+        return utils.chunked_call(
+            self.client, endpoint, indices, fetch, concurrency=self.concurrency)
+
+    def _get_settings(self, data):
+        return self.client.indices.get_settings(
+            index=utils.to_csv(data),
+            filter_path=settings.filter_paths()['index_settings']
+        )
 
-        for num in range(0, loop_number):
-            if num == (loop_number-1):
-                data_sliced = data[num*slice_number:]
-            else:
-                data_sliced = data[num*slice_number:(num+1)*slice_number]
-            query_result.update(exec_func(data_sliced))
+    def _get_missing_settings(self, indices):
+        """
+        Populate `index_settings` for `indices` with the index settings API,
+        raising any error other than a request too large for the cluster.
 
-        return query_result
+        :arg indices: A list of indices
+        """
+        self.loggit.debug(
+            'Getting index settings for {0} indices'.format(len(indices)))
+        for _, working_list in utils.chunked_call(
+                self.client, 'indices.get_settings', indices, self._get_settings):
+            for index in working_list:
+                self.index_settings[sys.intern(index)] = (
+                    working_list[index]['settings']['index'])
 
     def _get_cluster_state(self, data):
-        return self.client.cluster.state(index=utils.to_csv(data), metric='metadata')['metadata']['indices']
-
-    def _get_metadata(self):
+        # Only the settings in `settings.index_setting_fields`, and none of
+        # the mappings or aliases, which can be most of the metadata
+        return self.client.cluster.state(
+            index=utils.to_csv(data), metric='metadata',
+            filter_path=settings.filter_paths()['cluster_state_metadata']
+        ).get('metadata', {}).get('indices', {})
+
+    def _get_metadata(self, indices=None):
         """
-        Populate `index_info` with index `size_in_bytes` and doc count
-        information for each index.
+        Populate `index_info` with index state, shard and replica counts,
+        creation date and routing, and `index_settings` with the index
+        settings, for each index.
+
+        :arg indices: The indices to collect metadata for.  Default: `indices`
         """
         self.loggit.debug('Getting index metadata')
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            working_list = {}
-            try:
-                working_list.update(self._get_cluster_state(l))
-            except TransportError as err:
-                if err.status_code == 413:
-                    self.loggit.debug('Huge Payload 413 Error - Trying to get information with multiple requests')
-                    working_list = {}
-                    working_list.update(self._bulk_queries(l, self._get_cluster_state))
-
+        if indices is None:
+            indices = self.indices
+        for l, working_list in self._fetch_chunks(
+                indices, self._get_cluster_state, 'cluster.state'):
+            self._loaded['metadata'].update(l)
+            self._loaded['settings'].update(l)
             if working_list:
+                no_settings = [
+                    index for index in working_list if 'settings' not in working_list[index]
+                ]
+                if no_settings:
+                    # Used by AWS ES <= 5.1
+                    # We can try to get the same info from index/_settings,
+                    # in one call for the whole chunk.
+                    # workaround for https://github.com/elastic/curator/issues/880
+                    alt_wl = self._get_settings(no_settings)
+                    for index in no_settings:
+                        working_list[index]['settings'] = alt_wl[index]['settings']
                 for index in list(working_list.keys()):
                     s = self.index_info[index]
                     wl = working_list[index]
-
-                    if 'settings' not in wl:
-                        # Used by AWS ES <= 5.1
-                        # We can try to get the same info from index/_settings.
-                        # workaround for https://github.com/elastic/curator/issues/880
-                        alt_wl = self.client.indices.get(index, feature='_settings')[index]
-                        wl['settings'] = alt_wl['settings']
+                    self.index_settings[sys.intern(index)] = wl['settings']['index']
 
                     if 'creation_date' not in wl['settings']['index']:
                         self.loggit.warn(
@@ -222,9 +480,29 @@ class IndexList(object):
                         wl['settings']['index']['number_of_shards']
                     )
                     s['state'] = wl['state']
+                    s['uuid'] = wl['settings']['index'].get('uuid')
+                    s['sealed'] = self.__is_sealed(wl)
                     if 'routing' in wl['settings']['index']:
                         s['routing'] = wl['settings']['index']['routing']
 
+    def __is_sealed(self, metadata):
+        """
+        Return `True` if the index with cluster state `metadata` can no longer
+        be a write target: it has rolled over, finished indexing under ILM, or
+        is blocked for writes.
+        """
+        index_settings = metadata['settings']['index']
+        blocks = index_settings.get('blocks', {})
+        lifecycle = index_settings.get('lifecycle', {})
+        return (
+            bool(metadata.get('rollover_info'))
+            or str(lifecycle.get('indexing_complete')).lower() == 'true'
+            or any(
+                str(blocks.get(block)).lower() == 'true'
+                for block in ['write', 'read_only', 'read_only_allow_delete']
+            )
+        )
+
     def empty_list_check(self):
         """Raise exception if `indices` is empty"""
         self.loggit.debug('Checking for empty list')
@@ -242,35 +520,26 @@ class IndexList(object):
         return self.indices[:]
 
     def _get_indices_segments(self, data):
-        return self.client.indices.segments(index=utils.to_csv(data))['indices'].copy()
+        # Only the per-index segment count, rather than the full segments API
+        # listing of every segment of every shard copy
+        return self.client.indices.stats(
+            index=utils.to_csv(data), metric='segments',
+            filter_path=settings.filter_paths()['index_segments']
+        ).get('indices', {})
 
     def _get_segment_counts(self):
         """
-        Populate `index_info` with segment information for each index.
+        Populate `index_info` with the total segment count of each index,
+        across all of its primary and replica shards.
         """
         self.loggit.debug('Getting index segment counts')
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            working_list = {}
-            try:
-                working_list.update(self._get_indices_segments(l))
-            except TransportError as err:
-                if err.status_code == 413:
-                    self.loggit.debug('Huge Payload 413 Error - Trying to get information with multiple requests')
-                    working_list = {}
-                    working_list.update(self._bulk_queries(l, self._get_indices_segments))
-
-            if working_list:
-                for index in list(working_list.keys()):
-                    shards = working_list[index]['shards']
-                    segmentcount = 0
-                    for shardnum in shards:
-                        for shard in range(0,len(shards[shardnum])):
-                            segmentcount += (
-                                shards[shardnum][shard]['num_search_segments']
-                            )
-                    self.index_info[index]['segments'] = segmentcount
+        for _, working_list in self._fetch_chunks(
+                self.indices, self._get_indices_segments, 'indices.stats'):
+            for index in list(working_list.keys()):
+                self.index_info[index]['segments'] = (
+                    working_list[index]['total']['segments']['count']
+                )
 
     def _get_name_based_ages(self, timestring):
         """
@@ -288,6 +557,9 @@ class IndexList(object):
             epoch = ts.get_epoch(index)
             if isinstance(epoch, int):
                 self.index_info[index]['age']['name'] = epoch
+            else:
+                # Clear any age from a different timestring
+                self.index_info[index]['age'].pop('name', None)
 
     def _get_field_stats_dates(self, field='@timestamp'):
         """
@@ -310,21 +582,58 @@ class IndexList(object):
             '{0} field'.format(field)
         )
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            for index in l:
-                body = {
-                    'aggs' : {
-                        'min' : { 'min' : { 'field' : field } },
-                        'max' : { 'max' : { 'field' : field } }
-                    }
-                }
-                response = self.client.search(index=index, size=0, body=body)
+        cache = self.field_stats_cache
+        if cache is not None:
+            self.__get_cached_field_stats_dates(field)
+            if not self.indices:
+                self.__save_field_stats_cache()
+                return
+        body = {
+            'size': 0,
+            'aggs' : {
+                'min' : { 'min' : { 'field' : field } },
+                'max' : { 'max' : { 'field' : field } }
+            }
+        }
+        def msearch(batch):
+            searches = []
+            for index in batch:
+                searches.append({'index': index})
+                searches.append(body)
+            return self.client.msearch(body=searches)['responses']
+        if cache is not None:
+            # Query only the indices which were not found in the cache
+            pending = [
+                index for index in self.indices
+                if 'max_value' not in self.index_info[index]['age']
+            ]
+        else:
+            pending = self.indices
+        size = self.msearch_batch_size
+        batches = [
+            pending[i:i + size] for i in range(0, len(pending), size)
+        ]
+        results = utils.chunk_map(msearch, batches, self.concurrency)
+        for batch, responses in zip(batches, results):
+            for index, response in zip(batch, responses):
                 self.loggit.debug('RESPONSE: {0}'.format(response))
+                if 'error' in response:
+                    self.loggit.warn(
+                        'Index: {0} could not be queried for the min & max '
+                        'value of {1}. For safety, this index will be removed '
+                        'from the actionable list. Error: {2}'.format(
+                            index, field, response['error']
+                        )
+                    )
+                    self.__not_actionable(index)
+                    continue
                 if response:
                     try:
                         r = response['aggregations']
                         self.loggit.debug('r: {0}'.format(r))
+                        if r['min']['value'] is None or r['max']['value'] is None:
+                            # An unmapped field aggregates to null values
+                            raise KeyError(field)
                         s = self.index_info[index]['age']
                         s['min_value'] = utils.fix_epoch(r['min']['value'])
                         s['max_value'] = utils.fix_epoch(r['max']['value'])
@@ -334,6 +643,51 @@ class IndexList(object):
                             'Field "{0}" not found in index '
                             '"{1}"'.format(field, index)
                             )
+                    if cache is not None and self.index_info[index].get('sealed'):
+                        cache.put(
+                            self.index_info[index]['uuid'], field,
+                            s['min_value'], s['max_value']
+                        )
+        if cache is not None:
+            self.__save_field_stats_cache()
+
+    def __get_cached_field_stats_dates(self, field):
+        """
+        Populate `index_info` with the min and max values of `field` from
+        `field_stats_cache`, for the indices which can no longer be written to.
+        Those indices need not be queried.
+
+        :arg field: The field with the date value.
+        """
+        # Discovery through _cat/indices does not collect the UUID or write
+        # state, which come with the settings.
+        self.load_data('settings')
+        hits = 0
+        for index in self.indices:
+            info = self.index_info[index]
+            # Clear values from a previous field, so they are not mistaken
+            # for cached values of this one
+            info['age'].pop('min_value', None)
+            info['age'].pop('max_value', None)
+            if not info.get('sealed') or not info.get('uuid'):
+                continue
+            values = self.field_stats_cache.get(info['uuid'], field)
+            if values:
+                info['age']['min_value'], info['age']['max_value'] = values
+                hits += 1
+        self.loggit.debug(
+            'field_stats cache: {0} of {1} indices cached'.format(hits, len(self.indices)))
+
+    def __save_field_stats_cache(self):
+        """
+        Save `field_stats_cache`, first forgetting the indices which no longer
+        exist, if every index in the cluster was discovered, and so is known
+        by its UUID.
+        """
+        uuids = [self.index_info[index].get('uuid') for index in self.all_indices]
+        if self.search_pattern == '_all' and all(uuids):
+            self.field_stats_cache.prune(uuids)
+        self.field_stats_cache.save()
 
     def _calculate_ages(self, source=None, timestring=None, field=None,
             stats_result=None
@@ -360,10 +714,13 @@ class IndexList(object):
                 raise exceptions.MissingArgument(
                     'source "name" requires the "timestring" keyword argument'
                 )
+            if self.__ages_already_calculated(source, timestring):
+                return
             self._get_name_based_ages(timestring)
+            self._ages_calculated[source] = timestring
         elif source == 'creation_date':
-            # Nothing to do here as this comes from `get_metadata` in __init__
-            pass
+            # This comes from `_get_metadata`, which is deferred if `lazy`
+            self.load_data('metadata')
         elif source == 'field_stats':
             if not field:
                 raise exceptions.MissingArgument(
@@ -374,7 +731,10 @@ class IndexList(object):
                     'Invalid value for "stats_result": {0}'.format(stats_result)
                 )
             self.age_keyfield = stats_result
+            if self.__ages_already_calculated(source, field):
+                return
             self._get_field_stats_dates(field=field)
+            self._ages_calculated[source] = field
         else:
             raise ValueError(
                 'Invalid source: {0}.  '
@@ -382,6 +742,20 @@ class IndexList(object):
                 '"creation_date", "field_stats".'.format(source)
             )
 
+    def __ages_already_calculated(self, source, argument):
+        """
+        Return `True` if the ages from `source` were already calculated with
+        `argument` (a timestring or field name), so that a filter chain, or
+        each group of a ``count`` filter, does not collect them again.
+        """
+        if self._ages_calculated.get(source) == argument:
+            self.loggit.debug(
+                'Reusing "{0}" ages already calculated with {1}'.format(
+                    source, argument))
+            self.empty_list_check()
+            return True
+        return False
+
     def _sort_by_age(self, index_list, reverse=True):
         """
         Take a list of indices and sort them by date.
@@ -554,7 +928,7 @@ class IndexList(object):
                 self.loggit.debug(
                     'Index "{0}" does not meet provided criteria. '
                     'Removing from list.'.format(index))
-                self.indices.remove(index)
+                self.__not_actionable(index)
 
     def filter_by_space(
         self, disk_space=None, reverse=True, use_age=False,
@@ -624,6 +998,7 @@ class IndexList(object):
             'Omitting any closed indices.'
         )
         self.filter_closed()
+        self.load_data('stats')
 
         # Create a copy-by-value working list
         working_list = self.working_list()
@@ -720,6 +1095,7 @@ class IndexList(object):
         """
         self.loggit.debug('Filtering closed indices')
         self.empty_list_check()
+        self.load_data('metadata')
         for index in self.working_list():
             condition = self.index_info[index]['state'] == 'close'
             self.loggit.debug('Index {0} state: {1}'.format(
@@ -743,6 +1119,7 @@ class IndexList(object):
         self.loggit.debug('Filtering empty indices')
         self.filter_closed()
         self.empty_list_check()
+        self.load_data('stats')
         for index in self.working_list():
             condition = self.index_info[index]['docs'] == 0
             self.loggit.debug('Index {0} doc count: {1}'.format(
@@ -762,6 +1139,7 @@ class IndexList(object):
         """
         self.loggit.debug('Filtering open indices')
         self.empty_list_check()
+        self.load_data('metadata')
         for index in self.working_list():
             condition = self.index_info[index]['state'] == 'open'
             self.loggit.debug('Index {0} state: {1}'.format(
@@ -796,26 +1174,23 @@ class IndexList(object):
                 'Invalid "allocation_type": {0}'.format(allocation_type)
             )
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            working_list = self.client.indices.get_settings(index=utils.to_csv(l))
-            if working_list:
-                for index in list(working_list.keys()):
-                    try:
-                        has_routing = (
-                            working_list[index]['settings']['index']['routing']['allocation'][allocation_type][key] == value
-                        )
-                    except KeyError:
-                        has_routing = False
-                    # if has_routing:
-                    msg = (
-                        '{0}: Routing (mis)match: '
-                        'index.routing.allocation.{1}.{2}={3}.'.format(
-                            index, allocation_type, key, value
-                        )
-                    )
-                        # self.indices.remove(index)
-                    self.__excludify(has_routing, exclude, index, msg)
+        self.load_data('settings')
+        for index in self.working_list():
+            if index not in self.index_settings:
+                continue
+            try:
+                has_routing = (
+                    self.index_settings[index]['routing']['allocation'][allocation_type][key] == value
+                )
+            except KeyError:
+                has_routing = False
+            msg = (
+                '{0}: Routing (mis)match: '
+                'index.routing.allocation.{1}.{2}={3}.'.format(
+                    index, allocation_type, key, value
+                )
+            )
+            self.__excludify(has_routing, exclude, index, msg)
 
     def filter_none(self):
         self.loggit.debug('"None" filter selected.  No filtering will be done.')
@@ -852,18 +1227,20 @@ class IndexList(object):
             raise exceptions.MissingArgument('No value for "aliases" provided')
         aliases = utils.ensure_list(aliases)
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
+        def get_aliased(l):
             try:
                 # get_alias will either return {} or a NotFoundError.
-                has_alias = list(self.client.indices.get_alias(
+                return list(self.client.indices.get_alias(
                     index=utils.to_csv(l),
                     name=utils.to_csv(aliases)
                 ).keys())
-                self.loggit.debug('has_alias: {0}'.format(has_alias))
             except NotFoundError:
                 # if we see the NotFoundError, we need to set working_list to {}
-                has_alias = []
+                return []
+        for l, has_alias in utils.chunked_call(
+                self.client, 'indices.get_alias', self.indices, get_aliased,
+                concurrency=self.concurrency):
+            self.loggit.debug('has_alias: {0}'.format(has_alias))
             for index in l:
                 if index in has_alias:
                     isOrNot = 'is'
@@ -945,7 +1322,6 @@ class IndexList(object):
                 # Prune indices not matching the regular expression the object (and filtered_indices)
                 # We do not want to act on them by accident.
                 prune_these = list(filter(lambda x: r.match(x) is None, working_list))
-                filtered_indices = working_list
                 for index in prune_these:
                     msg = (
                         '{0} does not match regular expression {1}.'.format(
@@ -955,8 +1331,9 @@ class IndexList(object):
                     condition = True
                     exclude = True
                     self.__excludify(condition, exclude, index, msg)
-                    # also remove it from filtered_indices
-                    filtered_indices.remove(index)
+                # also remove them from filtered_indices
+                pruned = set(prune_these)
+                filtered_indices = [x for x in working_list if x not in pruned]
                 # Presort these filtered_indices using the lambda
                 presorted = sorted(filtered_indices, key=lambda x: r.match(x).group(1))
             except Exception as e:
@@ -1035,6 +1412,7 @@ class IndexList(object):
             )
 
         self.empty_list_check()
+        self.load_data('metadata')
         for index in self.working_list():
             self.loggit.debug('Filter by number of shards: Index: {0}'.format(index))
 
@@ -1170,7 +1548,7 @@ class IndexList(object):
                 self.loggit.debug(
                     'Index "{0}" does not meet provided criteria. '
                     'Removing from list.'.format(index))
-                self.indices.remove(index)
+                self.__not_actionable(index)
 
     def filter_ilm(self, exclude=True):
         """
@@ -1182,28 +1560,78 @@ class IndexList(object):
             Default is `True`
         """
         self.loggit.debug('Filtering indices with index.lifecycle.name')
-        index_lists = utils.chunk_index_list(self.indices)
-        if index_lists == [['']]:
+        if not self.indices:
             self.loggit.debug('Empty working list. No ILM indices to filter.')
             return
-        for l in index_lists:
-            working_list = self.client.indices.get_settings(index=utils.to_csv(l))
-            if working_list:
-                for index in list(working_list.keys()):
-                    try:
-                        subvalue = working_list[index]['settings']['index']['lifecycle']
-                        has_ilm = 'name' in subvalue
-                        msg = '{0} has index.lifecycle.name {1}'.format(index, subvalue['name'])
-                    except KeyError:
-                        has_ilm = False
-                        msg = 'index.lifecycle.name is not set for index {0}'.format(index)
-                    self.__excludify(has_ilm, exclude, index, msg)
+        self.load_data('settings')
+        for index in self.working_list():
+            if index not in self.index_settings:
+                continue
+            try:
+                subvalue = self.index_settings[index]['lifecycle']
+                has_ilm = 'name' in subvalue
+                msg = '{0} has index.lifecycle.name {1}'.format(index, subvalue['name'])
+            except KeyError:
+                has_ilm = False
+                msg = 'index.lifecycle.name is not set for index {0}'.format(index)
+            self.__excludify(has_ilm, exclude, index, msg)
+
+    def _filter_cost(self, f):
+        """
+        Return the relative cost of running filter `f`: ``0`` if it only reads
+        index names, ``1`` if it reads index metadata or stats, or ``2`` if it
+        makes API calls of its own.  Return `None` if its result depends on
+        which indices are still in `indices` when it runs.
+
+        :arg f: A filter dictionary, including its ``filtertype``
+        """
+        ft = f.get('filtertype')
+        if ft in ['count', 'space'] or f.get('use_age'):
+            return None
+        if ft in ['age', 'period']:
+            return {'name': 0, 'creation_date': 1}.get(f.get('source', 'name'), 2)
+        costs = {
+            'kibana': 0, 'none': 0, 'pattern': 0,
+            'closed': 1, 'empty': 1, 'opened': 1, 'shards': 1, 'size': 1,
+            'alias': 2, 'allocated': 2, 'forcemerged': 2, 'ilm': 2,
+        }
+        # Unknown filter types are left to fail schema validation
+        return costs.get(ft, 2)
+
+    def _plan_filters(self, filter_list):
+        """
+        Return `filter_list` reordered so that, between any filters whose
+        result depends on the indices remaining when they run, the cheapest
+        filters run first.  Every other filter only keeps or removes each
+        index on its own merits, so their order does not change the result.
 
-    def iterate_filters(self, filter_dict):
+        :arg filter_list: A list of filter dictionaries
+        :rtype: list
+        """
+        plan = []
+        segment = []
+        for f in filter_list:
+            if self._filter_cost(f) is None:
+                plan += sorted(segment, key=self._filter_cost)
+                plan.append(f)
+                segment = []
+            else:
+                segment.append(f)
+        plan += sorted(segment, key=self._filter_cost)
+        self.loggit.info('Filter plan{0}: {1}'.format(
+            '' if plan == filter_list else ' (reordered)',
+            ', '.join([f['filtertype'] for f in plan])
+        ))
+        return plan
+
+    def iterate_filters(self, filter_dict, optimize=False):
         """
         Iterate over the filters defined in `config` and execute them.
 
         :arg filter_dict: The configuration dictionary
+        :arg optimize: If `True`, run filters which only read index names
+            first, and those which make API calls of their own last, wherever
+            that cannot change the result.  See `_plan_filters`.
 
         .. note:: `filter_dict` should be a dictionary with the following form:
         .. code-block:: python
@@ -1226,7 +1654,10 @@ class IndexList(object):
             return
 
         self.loggit.debug('All filters: {0}'.format(filter_dict['filters']))
-        for f in filter_dict['filters']:
+        filter_list = filter_dict['filters']
+        if optimize:
+            filter_list = self._plan_filters(filter_list)
+        for f in filter_list:
             self.loggit.debug('Top of the loop: {0}'.format(self.indices))
             self.loggit.debug('Un-parsed filter args: {0}'.format(f))
             # Make sure we got at least this much in the configuration
@@ -1288,6 +1719,7 @@ class IndexList(object):
             'Omitting any closed indices.'
         )
         self.filter_closed()
+        self.load_data('stats')
 
         # Create a copy-by-value working list
         working_list = self.working_list()
@@ -1295,9 +1727,15 @@ class IndexList(object):
         for index in working_list:
 
             if size_behavior == 'primary':
-                index_size = self.index_info[index]['primary_size_in_bytes']
+                index_size = self.index_info[index].get('primary_size_in_bytes')
             else:
-                index_size = self.index_info[index]['size_in_bytes']
+                index_size = self.index_info[index].get('size_in_bytes')
+            if index_size is None:
+                self.loggit.debug(
+                    'Index "{0}" has no size. For safety, it will be removed '
+                    'from the actionable list.'.format(index))
+                self.__not_actionable(index)
+                continue
 
             msg = (
                 '{0}, index size is {1} and size limit is {2}.'.format(
@@ -0,0 +1,114 @@
+"""Compact records of the index and snapshot data which filters read"""
+from collections.abc import MutableMapping
+
+class Record(MutableMapping):
+    """
+    A mapping whose common keys, its fields, are stored in ``__slots__``
+    rather than in a per-instance ``dict``.  A field which has not been set is
+    absent, as it would be from a ``dict``, so records can be read and updated
+    exactly like the dictionaries they replace, at a fraction of their memory.
+
+    Any other key is kept in a ``dict`` which is only created once such a key
+    is first set.
+    """
+    __slots__ = ('_extra',)
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key in self.__slots__:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        return self._extras()[key]
+
+    def __setitem__(self, key, value):
+        if key in self.__slots__:
+            setattr(self, key, value)
+        elif self._extras():
+            self._extra[key] = value
+        else:
+            self._extra = {key: value}
+
+    def __delitem__(self, key):
+        if key in self.__slots__:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        else:
+            del self._extras()[key]
+
+    def __contains__(self, key):
+        if key in self.__slots__:
+            return hasattr(self, key)
+        return key in self._extras()
+
+    def __iter__(self):
+        for key in self.__slots__:
+            if hasattr(self, key):
+                yield key
+        for key in list(self._extras()):
+            yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def get(self, key, default=None):
+        if key in self.__slots__:
+            return getattr(self, key, default)
+        return self._extras().get(key, default)
+
+    def _extras(self):
+        """Return the keys which are not fields, or an empty ``dict``"""
+        return getattr(self, '_extra', None) or {}
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, dict(self.items()))
+
+class IndexAge(Record):
+    """
+    The ages of an index, as epoch seconds, by source: ``creation_date``,
+    ``name``, and the ``min_value`` and ``max_value`` of a date field.
+    """
+    __slots__ = ('creation_date', 'name', 'min_value', 'max_value')
+
+class IndexInfo(Record):
+    """
+    The data `IndexList` filters read about each index, in
+    :py:attr:`~.curator.indexlist.IndexList.index_info`.
+    """
+    __slots__ = (
+        'age', 'number_of_replicas', 'number_of_shards', 'segments',
+        'size_in_bytes', 'primary_size_in_bytes', 'docs', 'state', 'uuid',
+        'sealed', 'routing',
+    )
+
+class SnapshotInfo(Record):
+    """
+    The snapshot documents of `SnapshotList`, in
+    :py:attr:`~.curator.snapshotlist.SnapshotList.snapshot_info`.  The
+    ``indices`` are only present once they have been loaded with
+    :py:meth:`~.curator.snapshotlist.SnapshotList.load_details`.
+    """
+    __slots__ = (
+        'snapshot', 'uuid', 'version_id', 'version', 'include_global_state',
+        'state', 'start_time', 'start_time_in_millis', 'end_time',
+        'end_time_in_millis', 'duration_in_millis', 'failures', 'shards',
+        'age_by_name', 'indices',
+    )
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Return a record of the raw snapshot document `snapshot`.
+
+        :arg snapshot: A snapshot, as returned by the snapshot API
+        """
+        record = cls()
+        for key, value in snapshot.items():
+            record[key] = value
+        return record
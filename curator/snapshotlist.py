@@ -1,15 +1,19 @@
 """SnapshotList"""
 import time
 import re
+import sys
+import heapq
+import itertools
 import logging
 from datetime import timedelta, datetime, date
 from curator import exceptions, utils
 from curator.defaults import settings
+from curator.records import SnapshotInfo
 from curator.validators import SchemaCheck, filters
 
 class SnapshotList(object):
     """Snapshot list object"""
-    def __init__(self, client, repository=None):
+    def __init__(self, client, repository=None, discovery='get', page_size=None):
         utils.verify_client_object(client)
         if not repository:
             raise exceptions.MissingArgument('No value for "repository" provided')
@@ -26,21 +30,59 @@ class SnapshotList(object):
         #: Also accessible as an instance variable.
         self.repository = repository
         #: Instance variable.
+        #: How snapshots are listed at instance creation time.  ``get`` reads
+        #: the snapshot documents of the whole repository.  ``cat`` reads only
+        #: the name, state and start time of each snapshot from
+        #: ``_cat/snapshots``, falling back to ``get`` if that fails.  Either
+        #: way, the ``indices`` of a snapshot are only read by `load_details`.
+        #: **Type:** ``str()``
+        self.discovery = discovery
+        #: Instance variable.
+        #: The number of snapshots to request per page when listing snapshots
+        #: with the snapshot API, on versions which support paginated
+        #: listings.  Each page is reduced to
+        #: :py:class:`~.curator.records.SnapshotInfo` records before the next
+        #: one is requested.  If `None`, all are requested at once.
+        #: **Type:** ``int()``
+        self.page_size = page_size
+        #: Instance variable.
         #: Information extracted from snapshots, such as age, etc.
         #: Populated by internal method `__get_snapshots` at instance creation
-        #: time. **Type:** ``dict()``
+        #: time. **Type:** ``dict()`` of
+        #: :py:class:`~.curator.records.SnapshotInfo`
         self.snapshot_info = {}
-        #: Instance variable.
-        #: The running list of snapshots which will be used by an Action class.
-        #: Populated by internal methods `__get_snapshots` at instance creation
-        #: time. **Type:** ``list()``
+        # Snapshots which filters have removed from `snapshots`, but which have
+        # not been pruned from it yet.  See the `snapshots` property.
+        self._removed = set()
         self.snapshots = []
         #: Instance variable.
-        #: Raw data dump of all snapshots in the repository at instance creation
-        #: time.  **Type:** ``list()`` of ``dict()`` data.
+        #: All snapshots in the repository at instance creation time, as the
+        #: same records as in `snapshot_info`.  **Type:** ``list()`` of
+        #: :py:class:`~.curator.records.SnapshotInfo`
         self.__get_snapshots()
 
 
+    @property
+    def snapshots(self):
+        """
+        The running list of snapshots which will be used by an Action class.
+        Populated by internal methods `__get_snapshots` at instance creation
+        time. **Type:** ``list()``
+
+        Filters mark snapshots for removal in constant time, and they are
+        pruned from the list in a single pass the next time it is read.
+        """
+        if self._removed:
+            self._snapshots[:] = [
+                snap for snap in self._snapshots if snap not in self._removed]
+            self._removed = set()
+        return self._snapshots
+
+    @snapshots.setter
+    def snapshots(self, value):
+        self._snapshots = value
+        self._removed = set()
+
     def __actionable(self, snap):
         self.loggit.debug(
             'Snapshot {0} is actionable and remains in the list.'.format(snap))
@@ -50,7 +92,7 @@ class SnapshotList(object):
                 'Snapshot {0} is not actionable, removing from '
                 'list.'.format(snap)
             )
-            self.snapshots.remove(snap)
+            self._removed.add(snap)
 
     def __excludify(self, condition, exclude, snap, msg=None):
         if condition:
@@ -75,13 +117,54 @@ class SnapshotList(object):
         Pull all snapshots into `snapshots` and populate
         `snapshot_info`
         """
-        self.all_snapshots = utils.get_snapshot_data(self.client, self.repository)
-        for list_item in self.all_snapshots:
+        self.all_snapshots = []
+        for list_item in self.__list_snapshots():
             if 'snapshot' in list_item.keys():
-                self.snapshots.append(list_item['snapshot'])
-                self.snapshot_info[list_item['snapshot']] = list_item
+                info = SnapshotInfo.from_snapshot(list_item)
+                info['snapshot'] = sys.intern(info['snapshot'])
+                self.all_snapshots.append(info)
+                self.snapshots.append(info['snapshot'])
+                self.snapshot_info[info['snapshot']] = info
         self.empty_list_check()
 
+    def __list_snapshots(self):
+        """
+        Return the snapshots in `repository`, as listed by `discovery`
+        """
+        if self.discovery == 'cat':
+            try:
+                return utils.get_cat_snapshots(self.client, self.repository)
+            except (exceptions.FailedExecution, KeyError, TypeError, ValueError) as err:
+                self.loggit.warning(
+                    'Unable to list snapshots with _cat/snapshots, falling '
+                    'back to the snapshot API. Error: {0}'.format(err)
+                )
+        elif self.discovery != 'get':
+            raise ValueError(
+                'Invalid value for "discovery": {0}'.format(self.discovery))
+        return itertools.chain.from_iterable(utils.get_snapshot_pages(
+            self.client, repository=self.repository, size=self.page_size))
+
+    def load_details(self, snapshots):
+        """
+        Complete the `snapshot_info` of `snapshots` with the fields which are
+        not kept when listing the repository, such as ``indices``, in a single
+        request for all of those which lack them.
+
+        :arg snapshots: A list of snapshot names
+        """
+        needed = [snap for snap in snapshots if 'indices' not in self.snapshot_info[snap]]
+        if not needed:
+            return
+        self.loggit.debug('Getting the details of snapshots {0}'.format(needed))
+        details = utils.get_snapshot(
+            self.client, repository=self.repository, snapshot=utils.to_csv(needed))
+        for snapshot in details['snapshots']:
+            info = self.snapshot_info[snapshot['snapshot']]
+            info.update(
+                (key, value) for key, value in snapshot.items() if key != 'snapshot')
+            info.setdefault('indices', [])
+
     def __map_method(self, ftype):
         methods = {
             'age': self.filter_by_age,
@@ -159,15 +242,24 @@ class SnapshotList(object):
         By default, the youngest are first with `reverse=True`, but the oldest
         can be first by setting `reverse=False`
         """
-        # Do the age-based sorting here.
-        # First, build an temporary dictionary with just snapshot and age
-        # as the key and value, respectively
-        temp = {}
+        # If reverse is True, this will sort so the youngest snapshots are
+        # first.  However, if you want oldest first, set reverse to False.
+        # Effectively, this should set us up to act on everything older than
+        # meets the other set criteria.
+        return sorted(
+            self._aged(snapshot_list), key=self._age, reverse=reverse)
+
+    def _aged(self, snapshot_list):
+        """
+        Return the snapshots in `snapshot_list` which have an age at
+        `age_keyfield`, removing those which do not from `snapshots`.
+        """
+        aged = []
         for snap in snapshot_list:
             if self.age_keyfield in self.snapshot_info[snap]:
                 # This fixes #1366. Catch None is a potential age value.
                 if self.snapshot_info[snap][self.age_keyfield]:
-                    temp[snap] = self.snapshot_info[snap][self.age_keyfield]
+                    aged.append(snap)
                 else:
                     msg = ' snapshot %s has no age' % snap
                     self.__excludify(True, True, snap, msg)
@@ -177,16 +269,11 @@ class SnapshotList(object):
                     ' metadata'.format(snap, self.age_keyfield)
                 )
                 self.__excludify(True, True, snap, msg)
+        return aged
 
-        # If reverse is True, this will sort so the youngest snapshots are
-        # first.  However, if you want oldest first, set reverse to False.
-        # Effectively, this should set us up to act on everything older than
-        # meets the other set criteria.
-        # It starts as a tuple, but then becomes a list.
-        sorted_tuple = (
-            sorted(temp.items(), key=lambda k: k[1], reverse=reverse)
-        )
-        return [x[0] for x in sorted_tuple]
+    def _age(self, snap):
+        """Return the age of `snap` at `age_keyfield`"""
+        return self.snapshot_info[snap][self.age_keyfield]
 
     def most_recent(self):
         """
@@ -284,7 +371,7 @@ class SnapshotList(object):
         for snapshot in self.working_list():
             if not self.snapshot_info[snapshot][self.age_keyfield]:
                 self.loggit.debug('Removing snapshot {0} for having no age')
-                self.snapshots.remove(snapshot)
+                self.__not_actionable(snapshot)
                 continue
             msg = (
                 'Snapshot "{0}" age ({1}), direction: "{2}", point of '
@@ -376,22 +463,26 @@ class SnapshotList(object):
 
         if use_age:
             self._calculate_ages(source=source, timestring=timestring)
-            # Using default value of reverse=True in self._sort_by_age()
-            sorted_snapshots = self._sort_by_age(working_list, reverse=reverse)
+            candidates = self._aged(working_list)
+            key = self._age
         else:
-            # Default to sorting by snapshot name
-            sorted_snapshots = sorted(working_list, reverse=reverse)
-
-        idx = 1
-        for snap in sorted_snapshots:
+            # Default to ordering by snapshot name
+            candidates = working_list
+            key = None
+
+        # Only the first `count` snapshots in order are needed, so keep them
+        # in a heap of `count` entries, rather than sorting all of them.  The
+        # order of ties is the same as that of a stable sort.
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        within = set(select(count, candidates, key=key))
+        for snap in candidates:
+            condition = snap in within
             msg = (
-                '{0} is {1} of specified count of {2}.'.format(
-                    snap, idx, count
+                '{0} is {1} the specified count of {2}.'.format(
+                    snap, 'within' if condition else 'beyond', count
                 )
             )
-            condition = True if idx <= count else False
             self.__excludify(condition, exclude, snap, msg)
-            idx += 1
 
     def filter_period(
             self, period_type='relative', source='name', range_from=None, range_to=None,
@@ -469,7 +560,7 @@ class SnapshotList(object):
         for snapshot in self.working_list():
             if not self.snapshot_info[snapshot][self.age_keyfield]:
                 self.loggit.debug('Removing snapshot {0} for having no age')
-                self.snapshots.remove(snapshot)
+                self.__not_actionable(snapshot)
                 continue
             age = utils.fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
             msg = (
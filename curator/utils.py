@@ -6,8 +6,14 @@ import random
 import re
 import string
 import sys
+import threading
+import weakref
 from datetime import timedelta, datetime, date
 import base64
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 import yaml
 import elasticsearch
 from voluptuous import Schema
@@ -101,7 +107,7 @@ def rollable_alias(client, alias):
     # number, and 'value of "alias" here' reflects the value of the passed
     # parameter, except in versions 6.5.0+ where the ``is_write_index`` setting
     # makes it possible to have more than one index associated with a rollover index
-    if get_version(client) >= (6, 5, 0):
+    if has_feature(client, 'is_write_index'):
         for idx in response:
             if 'is_write_index' in response[idx]['aliases'][alias]:
                 if response[idx]['aliases'][alias]['is_write_index']:
@@ -208,6 +214,77 @@ def get_date_regex(timestring):
     LOGGER.debug("regex = {0}".format(regex))
     return regex
 
+def _regex_to_wildcard(fragment):
+    """
+    Return an index expression which matches at least every index name
+    regex `fragment` matches, or `None` if there is no simple one.  Only
+    letters, digits, ``_`` and ``-`` are kept as is, and ``.`` becomes ``*``.
+    """
+    if not re.match(r'^[a-zA-Z0-9_.\-]*$', fragment):
+        return None
+    return fragment.replace('.', '*')
+
+def _timestring_to_wildcard(timestring):
+    """
+    Return an index expression which matches at least every index name
+    `timestring` matches, like :py:func:`get_date_regex`, or `None` if there
+    is no simple one.  Each date field becomes ``*``.
+    """
+    prev, wildcard = ('', '')
+    for char in timestring:
+        if char == '%':
+            pass
+        elif char in settings.date_regex() and prev == '%':
+            wildcard += '*'
+        elif char.isalnum() or char in ['.', '-', '_']:
+            wildcard += char
+        else:
+            return None
+        prev = char
+    return '*' + wildcard + '*'
+
+def get_search_pattern(filter_list):
+    """
+    Return an index expression, such as ``logstash-*``, which matches at
+    least every index the leading ``pattern`` filters of `filter_list` keep,
+    so that only those indices need be discovered.  Return ``_all`` if there
+    is none.  The filters must still run, as the expression can match more
+    indices than they keep.
+
+    Only the first ``prefix``, ``suffix`` or ``timestring`` pattern filter
+    which keeps its matches is used, as index expressions can't express that
+    an index must match several of them.
+
+    :arg filter_list: A list of index filter dictionaries
+    :rtype: str
+    """
+    for fltr in filter_list:
+        if fltr.get('filtertype') != 'pattern':
+            break
+        if fltr.get('exclude', False):
+            continue
+        kind, value = fltr.get('kind'), fltr.get('value')
+        if not value or not isinstance(value, str):
+            continue
+        if kind == 'prefix':
+            wildcard = _regex_to_wildcard(value)
+            wildcard = wildcard + '*' if wildcard is not None else None
+        elif kind == 'suffix':
+            wildcard = _regex_to_wildcard(value)
+            wildcard = '*' + wildcard if wildcard is not None else None
+        elif kind == 'timestring':
+            wildcard = _timestring_to_wildcard(value)
+        else:
+            continue
+        if wildcard is None:
+            continue
+        wildcard = re.sub(r'\*+', '*', wildcard)
+        if wildcard != '*':
+            LOGGER.debug(
+                'Index search pattern from {0} filter: {1}'.format(fltr, wildcard))
+            return wildcard
+    return '_all'
+
 def get_datetime(index_timestamp, timestring):
     """
     Return the datetime extracted from the index name, which is the index
@@ -293,6 +370,54 @@ def datetime_to_epoch(mydate):
     tdelta = (mydate - datetime(1970, 1, 1))
     return tdelta.seconds + tdelta.days * 24 * 3600
 
+def _week_to_datetime(year, week):
+    """
+    Return the Monday of `week` of `year`, counting weeks from the first
+    Monday, as :py:func:`get_datetime` does with ``%W``.
+    """
+    if week > 53:
+        raise ValueError('Week number {0} is out of range'.format(week))
+    first_weekday = date(year, 1, 1).weekday()
+    if week == 0:
+        days = -first_weekday
+    else:
+        days = (7 - first_weekday) % 7 + 7 * (week - 1)
+    return datetime(year, 1, 1) + timedelta(days=days)
+
+def _iso_week_to_datetime(timestamp):
+    monday = _week_to_datetime(int(timestamp[0:4]), int(timestamp[5:7]))
+    return _handle_iso_week_number(monday, '%Y.%W%w', timestamp + '1')
+
+# Parsers for common timestrings, which read the fields straight from the
+# matched date, rather than through `datetime.strptime`.  Each gives the same
+# result as `get_datetime`.
+_FAST_TIMESTRINGS = {
+    '%Y.%m.%d': lambda t: datetime(int(t[0:4]), int(t[5:7]), int(t[8:10])),
+    '%Y-%m-%d': lambda t: datetime(int(t[0:4]), int(t[5:7]), int(t[8:10])),
+    '%Y.%m': lambda t: datetime(int(t[0:4]), int(t[5:7]), 1),
+    '%Y.%W': lambda t: _week_to_datetime(int(t[0:4]), int(t[5:7])),
+    '%G.%V': _iso_week_to_datetime,
+}
+
+@lru_cache(maxsize=4096)
+def timestamp_to_epoch(timestamp, timestring):
+    """
+    Return the epoch timestamp of `timestamp`, a date string in the format of
+    `timestring`.  Results are memoized, as many index or snapshot names
+    share the same date.
+
+    :arg timestamp: The date string, e.g. extracted from an index name
+    :arg timestring: An strftime pattern
+    :rtype: int
+    """
+    if timestring in _FAST_TIMESTRINGS:
+        try:
+            return datetime_to_epoch(_FAST_TIMESTRINGS[timestring](timestamp))
+        except ValueError:
+            # Let strptime decide what to make of out-of-range fields
+            pass
+    return datetime_to_epoch(get_datetime(timestamp, timestring))
+
 class TimestringSearch(object):
     """
     An object to allow repetitive search against a string, `searchme`, without
@@ -316,10 +441,7 @@ class TimestringSearch(object):
         match = self.pattern.search(searchme)
         if match:
             if match.group("date"):
-                timestamp = match.group("date")
-                return datetime_to_epoch(
-                    get_datetime(timestamp, self.timestring)
-                )
+                return timestamp_to_epoch(match.group("date"), self.timestring)
                 # # I would have used `total_seconds`, but apparently that's new
                 # # to Python 2.7+, and due to so many people still using
                 # # RHEL/CentOS 6, I need this to support Python 2.6.
@@ -626,39 +748,158 @@ def check_csv(value):
             'but is of type {1}'.format(value, type(value))
         )
 
-def chunk_index_list(indices):
+def chunk_index_list(indices, size=3072):
     """
-    This utility chunks very large index lists into 3KB chunks
-    It measures the size as a csv string, then converts back into a list
-    for the return value.
+    This utility chunks very large index lists into chunks whose csv string is
+    at most `size` characters long, so the index names fit in a request URL.
+    An index name longer than `size` gets a chunk of its own.  It measures the
+    size as a csv string, then converts back into a list for the return value.
 
     :arg indices: A list of indices to act on.
+    :arg size: The maximum length of the csv string of each chunk.
     :rtype: list
     """
     chunks = []
     chunk = ""
     for index in indices:
-        if len(chunk) < 3072:
-            if not chunk:
-                chunk = index
-            else:
-                chunk += "," + index
+        if not chunk:
+            chunk = index
+        elif len(chunk) + 1 + len(index) <= size:
+            chunk += "," + index
         else:
             chunks.append(chunk.split(','))
             chunk = index
     chunks.append(chunk.split(','))
     return chunks
 
-def get_indices(client):
+# The chunk sizes which did and did not fit in a request, per cluster and
+# endpoint.  See `chunk_size`.
+_CHUNK_SIZES = {}
+_CHUNK_SIZES_LOCK = threading.Lock()
+
+def _cluster_key(client):
+    """Return a key identifying the cluster `client` connects to"""
+    try:
+        return tuple(sorted(str(host) for host in client.transport.hosts))
+    except Exception:
+        return client
+
+def chunk_size(client, endpoint):
+    """
+    Return the csv string length to use for chunks of index names sent to
+    `endpoint` of the cluster `client` connects to.
+
+    This starts at :py:func:`curator.defaults.settings.index_chunk_size`.  Once
+    a request is too large, it is the larger of half the smallest size which
+    failed, and the largest size which worked.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg endpoint: A name for the API endpoint, such as ``indices.stats``
+    :rtype: int
+    """
+    with _CHUNK_SIZES_LOCK:
+        sizes = _CHUNK_SIZES.get((_cluster_key(client), endpoint))
+    if not sizes or sizes['failed'] is None:
+        return settings.index_chunk_size()
+    return max(sizes['worked'], sizes['failed'] // 2)
+
+def _record_chunk_size(client, endpoint, size, worked):
+    with _CHUNK_SIZES_LOCK:
+        sizes = _CHUNK_SIZES.setdefault(
+            (_cluster_key(client), endpoint), {'worked': 0, 'failed': None})
+        if worked:
+            sizes['worked'] = max(sizes['worked'], size)
+        elif sizes['failed'] is None or size < sizes['failed']:
+            sizes['failed'] = size
+
+def request_too_large(err):
+    """
+    Return `True` if the :class:`elasticsearch.TransportError` `err` means the
+    request, or its URL, was too large: HTTP 413 or 414, or Elasticsearch's
+    ``too_long_frame_exception`` for an overlong HTTP line.
+
+    :arg err: An :class:`elasticsearch.TransportError`
+    :rtype: bool
+    """
+    if err.status_code in (413, 414):
+        return True
+    return err.status_code == 400 and 'too_long' in str(err)
+
+def chunked_call(client, endpoint, indices, func, concurrency=1):
+    """
+    Call `func` for chunks of `indices`, sized by :py:func:`chunk_size`.  If a
+    call fails because the request is too large, the chunk is split in half
+    and each half is tried again, down to single indices, and the size is
+    remembered for later calls to `endpoint` of the same cluster.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg endpoint: A name for the API endpoint, such as ``indices.stats``
+    :arg indices: A list of indices
+    :arg func: A function which takes a chunk (a list of indices) and makes
+        the request for it
+    :arg concurrency: The maximum number of chunks to request at the same
+        time.  See :py:func:`chunk_map`.
+    :returns: A list of ``(chunk, result)`` pairs, in the order of `indices`.
+        Chunks which were split appear as one pair per part.
+    :rtype: list
+    """
+    if not indices:
+        return []
+    def call(chunk):
+        size = len(to_csv(chunk))
+        try:
+            result = func(chunk)
+        except elasticsearch.TransportError as err:
+            if not request_too_large(err) or len(chunk) < 2:
+                raise
+            _record_chunk_size(client, endpoint, size, False)
+            LOGGER.debug(
+                'Request to {0} with {1} indices ({2} characters) was too large. '
+                'Splitting it in half.'.format(endpoint, len(chunk), size)
+            )
+            half = len(chunk) // 2
+            return call(chunk[:half]) + call(chunk[half:])
+        _record_chunk_size(client, endpoint, size, True)
+        return [(chunk, result)]
+    chunks = chunk_index_list(indices, size=chunk_size(client, endpoint))
+    results = chunk_map(call, chunks, concurrency)
+    return [pair for pairs in results for pair in pairs]
+
+def chunk_map(func, chunks, concurrency=1):
+    """
+    Call `func` once per chunk in `chunks`, with up to `concurrency` calls in
+    flight at once, and return the results in the same order as `chunks`.
+
+    With a `concurrency` of 1, or only one chunk, the calls are made serially
+    in the calling thread.  Otherwise they run in a bounded thread pool, and
+    the first exception raised by any call is raised here.
+
+    :arg func: A function which takes a single chunk as its argument
+    :arg chunks: A list of chunks, such as from :py:func:`chunk_index_list`
+    :arg concurrency: The maximum number of calls to run at the same time
+    :rtype: list
+    """
+    if concurrency <= 1 or len(chunks) <= 1:
+        return [func(chunk) for chunk in chunks]
+    workers = min(concurrency, len(chunks))
+    LOGGER.debug(
+        'Fetching {0} chunks with {1} concurrent requests'.format(len(chunks), workers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, chunks))
+
+def get_indices(client, search_pattern='_all'):
     """
     Get the current list of indices from the cluster.
 
     :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg search_pattern: An index expression, such as ``logstash-*``, to
+        limit the indices to.  Default: ``_all``
     :rtype: list
     """
     try:
         indices = list(
-            client.indices.get_settings(index='_all', params={'expand_wildcards': 'open,closed'})
+            client.indices.get_settings(
+                index=search_pattern, params={'expand_wildcards': 'open,closed'})
         )
         version_number = get_version(client)
         LOGGER.debug(
@@ -670,21 +911,84 @@ def get_indices(client):
     except Exception as err:
         raise exceptions.FailedExecution('Failed to get indices. Error: {0}'.format(err))
 
-def get_version(client):
+def get_cat_indices(client, search_pattern='_all'):
     """
-    Return the ES version number as a tuple.
-    Omits trailing tags like -dev, or Beta
+    Get the current list of indices from the cluster, along with their state,
+    shard and replica counts, creation date, doc count and store sizes, from a
+    single ``_cat/indices`` request.
 
     :arg client: An :class:`elasticsearch.Elasticsearch` client object
-    :rtype: tuple
+    :arg search_pattern: An index expression, such as ``logstash-*``, to
+        limit the indices to.  Default: ``_all``
+    :rtype: list of dict
+    """
+    try:
+        rows = client.cat.indices(
+            index=search_pattern, format='json', bytes='b', h=settings.cat_indices_columns(),
+            expand_wildcards='open,closed'
+        )
+        LOGGER.debug("All indices: {0}".format([row['index'] for row in rows]))
+        return rows
+    except Exception as err:
+        raise exceptions.FailedExecution('Failed to get indices. Error: {0}'.format(err))
+
+# The capabilities of the cluster of each client.  See `get_capabilities`.
+_CAPABILITIES = weakref.WeakKeyDictionary()
+_CAPABILITIES_LOCK = threading.Lock()
+
+def get_capabilities(client):
+    """
+    Return what the cluster `client` connects to is and supports, as a
+    dictionary of its ``version`` tuple and a `True`/`False` value for each
+    feature in
+    :py:func:`~.curator.defaults.settings.feature_versions`.
+
+    They come from a single ``client.info()`` call per client, which every
+    later call, from any module, reuses.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :rtype: dict
     """
-    version = client.info()['version']['number']
-    version = version.split('-')[0]
+    with _CAPABILITIES_LOCK:
+        capabilities = _CAPABILITIES.get(client)
+    if capabilities is not None:
+        return capabilities
+    info = client.info()
+    LOGGER.debug('Cluster info: {0}'.format(info))
+    version = info['version']['number'].split('-')[0]
     if len(version.split('.')) > 3:
         version = version.split('.')[:-1]
     else:
        version = version.split('.')
-    return tuple(map(int, version))
+    version = tuple(map(int, version))
+    capabilities = {'version': version}
+    for feature, minimum in settings.feature_versions().items():
+        capabilities[feature] = version >= minimum
+    LOGGER.debug('Cluster capabilities: {0}'.format(capabilities))
+    with _CAPABILITIES_LOCK:
+        _CAPABILITIES[client] = capabilities
+    return capabilities
+
+def has_feature(client, feature):
+    """
+    Return `True` if the cluster `client` connects to supports `feature`.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg feature: One of the features in
+        :py:func:`~.curator.defaults.settings.feature_versions`
+    :rtype: bool
+    """
+    return get_capabilities(client)[feature]
+
+def get_version(client):
+    """
+    Return the ES version number as a tuple.
+    Omits trailing tags like -dev, or Beta
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :rtype: tuple
+    """
+    return get_capabilities(client)['version']
 
 def is_master_node(client):
     """
@@ -966,6 +1270,86 @@ def verify_master_status(client, master_only):
         LOGGER.debug('Not verifying local master status (master_only: false)')
 
 
+# The keys to drop from JSON responses on each thread.  See `pruned_responses`.
+_PRUNING = threading.local()
+
+class PruningJSONSerializer(elasticsearch.serializer.JSONSerializer):
+    """
+    A JSON serializer which, within :py:func:`pruned_responses`, drops keys
+    Curator does not read from the objects of a response as soon as each of
+    them is parsed.  The complete object tree of a large response is then
+    never in memory at once, only the raw body, the kept data and the object
+    being parsed.
+    """
+    def loads(self, s):
+        rule = getattr(_PRUNING, 'rule', None)
+        if rule is None:
+            return super(PruningJSONSerializer, self).loads(s)
+        marker, drop = rule
+        def prune(pairs):
+            obj = dict(pairs)
+            if marker in obj:
+                for key in drop:
+                    obj.pop(key, None)
+            return obj
+        try:
+            return json.loads(s, object_pairs_hook=prune)
+        except (ValueError, TypeError) as err:
+            raise elasticsearch.SerializationError(s, err)
+
+@contextmanager
+def pruned_responses(marker, drop):
+    """
+    Within this context, drop the keys in `drop` from every object with the
+    key `marker` in the responses to requests made on this thread.  This only
+    has an effect on clients from :py:func:`get_client`, which use
+    :py:class:`PruningJSONSerializer`, so callers must not depend on it.
+
+    :arg marker: A key which identifies the objects to prune
+    :arg drop: A list of the keys to drop from them
+    """
+    previous = getattr(_PRUNING, 'rule', None)
+    _PRUNING.rule = (marker, frozenset(drop))
+    try:
+        yield
+    finally:
+        _PRUNING.rule = previous
+
+class TimeoutTransport(elasticsearch.Transport):
+    """
+    An :class:`elasticsearch.Transport` which sends each request with
+    `request_timeout`, unless the request sets its own, so that a single
+    client, and its pooled connections, can serve actions with different
+    timeouts.  See :py:func:`set_request_timeout`.
+    """
+    #: The timeout in seconds of each request, or `None` to use the timeout
+    #: the client was created with.
+    request_timeout = None
+
+    def perform_request(self, method, url, headers=None, params=None, body=None):
+        if self.request_timeout is not None:
+            params = dict(params or {})
+            params.setdefault('request_timeout', self.request_timeout)
+        return super(TimeoutTransport, self).perform_request(
+            method, url, headers=headers, params=params, body=body)
+
+def set_request_timeout(client, timeout):
+    """
+    Apply `timeout` to every later request `client` sends, without building
+    a new client.  This only has an effect on clients from
+    :py:func:`get_client`, which use :py:class:`TimeoutTransport`.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg timeout: Number of seconds before each request will timeout, or
+        `None` for the timeout the client was created with.
+    """
+    if isinstance(client.transport, TimeoutTransport):
+        client.transport.request_timeout = timeout
+    else:
+        LOGGER.warning(
+            'Unable to set the request timeout of a client without a '
+            'TimeoutTransport')
+
 def get_client(**kwargs):
     """
     NOTE: AWS IAM parameters `aws_sign_request` and `aws_region` are
@@ -1014,7 +1398,8 @@ def get_client(**kwargs):
     :type password: str
     :arg http_auth: Authentication credentials in `user:pass` format.
     :type http_auth: str
-    :arg timeout: Number of seconds before the client will timeout.
+    :arg timeout: Number of seconds before the client will timeout.  Use
+        :py:func:`set_request_timeout` to change it later.
     :type timeout: int
     :arg master_only: If `True`, the client will `only` connect if the
         endpoint is the elected master node of the cluster.  **This option does
@@ -1023,6 +1408,12 @@ def get_client(**kwargs):
     :type master_only: bool
     :arg skip_version_test: If `True`, skip the version check as part of the
         client connection.
+    :arg request_concurrency: Ignored here.  It is read by the callers which
+        build :class:`curator.indexlist.IndexList` objects.
+    :arg msearch_batch_size: Ignored here, like `request_concurrency`.
+    :arg field_stats_cache: Ignored here, like `request_concurrency`.
+    :arg repository_cache: Ignored here, like `request_concurrency`.
+    :arg repository_cache_ttl: Ignored here, like `request_concurrency`.
     :rtype: :class:`elasticsearch.Elasticsearch`
     :arg api_key: value to be used in optional X-Api-key header when accessing Elasticsearch
     :type api_key: str
@@ -1031,10 +1422,19 @@ def get_client(**kwargs):
     """
     # Walk through parsing/testing series of arguments to build the client
     skip_version_test = kwargs.pop('skip_version_test', False)
+    kwargs.pop('request_concurrency', None)
+    kwargs.pop('msearch_batch_size', None)
+    kwargs.pop('field_stats_cache', None)
+    kwargs.pop('repository_cache', None)
+    kwargs.pop('repository_cache_ttl', None)
     kwargs = process_url_prefix_arg(kwargs)
     kwargs = process_host_args(kwargs)
     kwargs = process_x_api_key_arg(kwargs)
     kwargs['connection_class'] = elasticsearch.RequestsHttpConnection
+    # So that `set_request_timeout` can change the timeout of this client
+    kwargs['transport_class'] = TimeoutTransport
+    # So that `pruned_responses` can drop what is not read from responses
+    kwargs['serializer'] = PruningJSONSerializer()
     kwargs = process_ssl_args(kwargs)
     kwargs = process_aws_args(kwargs)
     kwargs = try_boto_session(kwargs)
@@ -1050,9 +1450,10 @@ def get_client(**kwargs):
         # Creating the class object should be okay
         LOGGER.info('Instantiating client object')
         client = elasticsearch.Elasticsearch(**kwargs)
-        # Test client connectivity (debug log client.info() output)
+        # Test client connectivity (debug log client.info() output), and learn
+        # what the cluster supports for every later version check to reuse
         LOGGER.info('Testing client connectivity')
-        LOGGER.debug('Cluster info: {0}'.format(client.info()))
+        get_capabilities(client)
         LOGGER.info('Successfully created Elasticsearch client object with provided settings')
     # Catch all TransportError types first
     except elasticsearch.TransportError as err:
@@ -1089,6 +1490,7 @@ def show_dry_run(ilo, action, **kwargs):
     LOGGER.info(
         '(CLOSED) indices may be shown that may not be acted on by action "{0}".'.format(action)
     )
+    ilo.load_data('metadata')
     indices = sorted(ilo.indices)
     for idx in indices:
             index_closed = ilo.index_info[idx]['state'] == 'close'
@@ -1138,7 +1540,11 @@ def get_snapshot(client, repository=None, snapshot=''):
 
 def get_snapshot_data(client, repository=None):
     """
-    Get ``_all`` snapshots from repository and return a list.
+    Get ``_all`` snapshots from repository and return a list.  The fields in
+    :py:func:`~.curator.defaults.settings.pruned_snapshot_fields`, such as
+    the ``indices`` of each snapshot, are dropped while the response is
+    parsed, if `client` allows it (see :py:func:`pruned_responses`).  Use
+    :py:func:`get_snapshot` for those.
 
     :arg client: An :class:`elasticsearch.Elasticsearch` client object
     :arg repository: The Elasticsearch snapshot repository to use
@@ -1147,28 +1553,107 @@ def get_snapshot_data(client, repository=None):
     if not repository:
         raise exceptions.MissingArgument('No value for "repository" provided')
     try:
-        return client.snapshot.get(repository=repository, snapshot="_all")['snapshots']
+        with pruned_responses('snapshot', settings.pruned_snapshot_fields()):
+            return client.snapshot.get(repository=repository, snapshot="_all")['snapshots']
     except (elasticsearch.TransportError, elasticsearch.NotFoundError) as err:
         raise exceptions.FailedExecution(
             'Unable to get snapshot information from repository: '
             '{0}. Error: {1}'.format(repository, err)
         )
 
+def get_snapshot_pages(client, repository=None, size=None):
+    """
+    Yield the snapshots in `repository` in pages, each a list of at most
+    `size` snapshots, as returned by :py:func:`get_snapshot_data`.  The pages
+    are requested one at a time, in order of start time, so that only one
+    page of snapshot documents is held at once.  If `size` is not set, or
+    the cluster does not support paginated snapshot listings, all snapshots
+    are yielded as a single page.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg repository: The Elasticsearch snapshot repository to use
+    :arg size: The number of snapshots per page
+    :rtype: generator of list
+    """
+    if not size or not has_feature(client, 'snapshot_pagination'):
+        yield get_snapshot_data(client, repository=repository)
+        return
+    if not repository:
+        raise exceptions.MissingArgument('No value for "repository" provided')
+    params = {'size': size, 'sort': 'start_time'}
+    while True:
+        try:
+            with pruned_responses('snapshot', settings.pruned_snapshot_fields()):
+                page = client.snapshot.get(
+                    repository=repository, snapshot='_all', params=params)
+        except (elasticsearch.TransportError, elasticsearch.NotFoundError) as err:
+            raise exceptions.FailedExecution(
+                'Unable to get snapshot information from repository: '
+                '{0}. Error: {1}'.format(repository, err)
+            )
+        yield page['snapshots']
+        if not page.get('next'):
+            return
+        params = {'size': size, 'sort': 'start_time', 'after': page['next']}
+
+def get_cat_snapshots(client, repository=None):
+    """
+    Get the name, state and start time of every snapshot in `repository`,
+    and nothing else, from a single ``_cat/snapshots`` request.  Return them
+    as a list in the same form as :py:func:`get_snapshot_data`, with the
+    ``snapshot``, ``state`` and ``start_time_in_millis`` of each snapshot.
+    The start time is only precise to the second.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg repository: The Elasticsearch snapshot repository to use
+    :rtype: list
+    """
+    if not repository:
+        raise exceptions.MissingArgument('No value for "repository" provided')
+    try:
+        rows = client.cat.snapshots(
+            repository=repository, format='json', h=settings.cat_snapshots_columns())
+    except Exception as err:
+        raise exceptions.FailedExecution(
+            'Unable to list snapshots in repository: {0}. Error: '
+            '{1}'.format(repository, err)
+        )
+    return [
+        {
+            'snapshot': row['id'],
+            'state': row['status'],
+            'start_time_in_millis': int(row['start_epoch']) * 1000,
+        } for row in rows
+    ]
+
 def snapshot_in_progress(client, repository=None, snapshot=None):
     """
     Determine whether the provided snapshot in `repository` is ``IN_PROGRESS``.
     If no value is provided for `snapshot`, then check all of them.
     Return `snapshot` if it is found to be in progress, or `False`
 
+    Only the names of the running snapshots of `repository` are requested,
+    from ``_snapshot/<repository>/_status``, which Elasticsearch answers from
+    the cluster state, without reading the repository.
+
     :arg client: An :class:`elasticsearch.Elasticsearch` client object
     :arg repository: The Elasticsearch snapshot repository to use
     :arg snapshot: The snapshot name
     """
-    allsnaps = get_snapshot_data(client, repository=repository)
-    inprogress = (
-        [snap['snapshot'] for snap in allsnaps if 'state' in snap.keys() \
-            and snap['state'] == 'IN_PROGRESS']
-    )
+    if not repository:
+        raise exceptions.MissingArgument('No value for "repository" provided')
+    try:
+        status = client.snapshot.status(
+            repository=repository,
+            filter_path=settings.filter_paths()['snapshot_status']
+        )
+    except (elasticsearch.TransportError, elasticsearch.NotFoundError) as err:
+        raise exceptions.FailedExecution(
+            'Unable to get the status of snapshots in repository: '
+            '{0}. Error: {1}'.format(repository, err)
+        )
+    # The response is empty, rather than without snapshots, if none is running
+    inprogress = [snap['snapshot'] for snap in status.get('snapshots', [])]
     if snapshot:
         retval = snapshot if snapshot in inprogress else False
     else:
@@ -1187,11 +1672,18 @@ def find_snapshot_tasks(client):
     Check if there is snapshot activity in the Tasks API.
     Return `True` if activity is found, or `False`
 
+    Only tasks with snapshot actions are listed.
+
     :arg client: An :class:`elasticsearch.Elasticsearch` client object
     :rtype: bool
     """
     retval = False
-    tasklist = client.tasks.list()
+    tasklist = client.tasks.list(
+        actions='*snapshot*',
+        filter_path=settings.filter_paths()['find_snapshot_tasks']
+    )
+    # The response is empty, rather than without nodes, if there are no tasks
+    tasklist.setdefault('nodes', {})
     for node in tasklist['nodes']:
         for task in tasklist['nodes'][node]['tasks']:
             activity = tasklist['nodes'][node]['tasks'][task]['action']
@@ -1417,13 +1909,24 @@ def repository_exists(client, repository=None):
         response = False
     return response
 
-def test_repo_fs(client, repository=None):
+def test_repo_fs(client, repository=None, cache=None):
     """
     Test whether all nodes have write access to the repository
 
     :arg client: An :class:`elasticsearch.Elasticsearch` client object
     :arg repository: The Elasticsearch snapshot repository to use
+    :arg cache: An optional :class:`curator.cache.RepositoryCache`.  If it
+        holds a recent verification of `repository` by the same nodes, the
+        repository is not verified again.  Otherwise, a successful
+        verification is added to it.
     """
+    key = cache.key(client, repository) if cache is not None else None
+    if key is not None and cache.verified(key):
+        LOGGER.debug(
+            'Repository {0} was verified within the last {1} seconds, by the '
+            'same nodes'.format(repository, cache.ttl)
+        )
+        return
     try:
         nodes = client.snapshot.verify_repository(
             repository=repository)['nodes']
@@ -1446,6 +1949,9 @@ def test_repo_fs(client, repository=None):
         raise exceptions.ActionError(
             'Failed to verify all nodes have repository access: {0}'.format(msg)
         )
+    if key is not None:
+        cache.put(key)
+        cache.save()
 
 def snapshot_running(client):
     """
@@ -1455,7 +1961,11 @@ def snapshot_running(client):
     :rtype: bool
     """
     try:
-        status = client.snapshot.status()['snapshots']
+        # The response is empty, rather than without snapshots, if none is
+        # running
+        status = client.snapshot.status(
+            filter_path=settings.filter_paths()['snapshot_status']
+        ).get('snapshots')
     except Exception as err:
         report_failure(err)
     # We will only accept a positively identified False.  Anything else is
@@ -1684,7 +2194,9 @@ def snapshot_check(client, snapshot=None, repository=None):
     """
     try:
         state = client.snapshot.get(
-            repository=repository, snapshot=snapshot)['snapshots'][0]['state']
+            repository=repository, snapshot=snapshot,
+            filter_path=settings.filter_paths()['snapshot_check']
+        )['snapshots'][0]['state']
     except Exception as err:
         raise exceptions.CuratorException(
             'Unable to obtain information for snapshot "{0}" in repository '
@@ -1720,7 +2232,10 @@ def relocate_check(client, index):
     :arg index: The index to check the index shards state.
     """
     shard_state_data = (
-        client.cluster.state(index=index)['routing_table']['indices'][index]['shards']
+        client.cluster.state(
+            index=index, metric='routing_table',
+            filter_path=settings.filter_paths()['relocate_check']
+        )['routing_table']['indices'][index]['shards']
     )
     finished_state = (
         all(
@@ -1748,14 +2263,19 @@ def restore_check(client, index_list):
     :arg index_list: The list of indices to verify having been restored.
     """
     response = {}
-    for chunk in chunk_index_list(index_list):
-        try:
-            chunk_response = client.indices.recovery(index=chunk, human=True)
-        except Exception as err:
-            raise exceptions.CuratorException(
-                'Unable to obtain recovery information for specified indices. '
-                'Error: {0}'.format(err)
-            )
+    try:
+        chunk_responses = chunked_call(
+            client, 'indices.recovery', index_list,
+            lambda chunk: client.indices.recovery(
+                index=chunk, human=True,
+                filter_path=settings.filter_paths()['restore_check'])
+        )
+    except Exception as err:
+        raise exceptions.CuratorException(
+            'Unable to obtain recovery information for specified indices. '
+            'Error: {0}'.format(err)
+        )
+    for _, chunk_response in chunk_responses:
         # This should address #962, where perhaps the cluster state hasn't yet
         # had a chance to add a _recovery state yet, so it comes back empty.
         if chunk_response == {}:
@@ -37,6 +37,7 @@ def action_specific(action):
         ],
         'delete_indices' : [],
         'delete_snapshots' : [
+            option_defaults.batch_size(),
             option_defaults.repository(),
             option_defaults.retry_interval(),
             option_defaults.retry_count(),
@@ -144,6 +145,7 @@ def get_schema(action):
         option_defaults.continue_if_exception(),
         option_defaults.disable_action(),
         option_defaults.ignore_empty_list(),
+        option_defaults.optimize_filters(),
         option_defaults.timeout_override(action),
     ]
     for each in defaults:
@@ -0,0 +1,85 @@
+"""
+Benchmarks for Curator internals, run against a simulated cluster.
+
+Run one with, e.g.: ``python -m test.benchmark.discovery``
+"""
+import time
+from mock import Mock
+
+def index_names(count, prefix='logstash-'):
+    """Return `count` daily index names, starting 2000.01.01"""
+    start = 946684800
+    return [
+        '{0}{1}'.format(prefix, time.strftime('%Y.%m.%d', time.gmtime(start + i * 86400)))
+        for i in range(count)
+    ]
+
+def fake_client(indices, latency=0.0):
+    """
+    Return a mock client which answers the discovery APIs for `indices`,
+    sleeping `latency` seconds per request to simulate a network round-trip.
+    """
+    def settings(name):
+        return {
+            'number_of_shards': '1', 'number_of_replicas': '1',
+            'creation_date': '1456963200172',
+        }
+    def stats(name):
+        return {
+            'total': {'store': {'size_in_bytes': 2048}, 'docs': {'count': 10}},
+            'primaries': {'store': {'size_in_bytes': 1024}, 'docs': {'count': 5}},
+        }
+    def requested(index):
+        return indices if index == '_all' else index.split(',')
+    def respond(func):
+        def wrapper(*args, **kwargs):
+            time.sleep(latency)
+            return func(*args, **kwargs)
+        return Mock(side_effect=wrapper)
+    client = Mock()
+    client.info = respond(lambda: {'version': {'number': '7.13.0'}})
+    client.indices.get_settings = respond(lambda index=None, **kw: {
+        i: {'settings': {'index': settings(i)}} for i in requested(index)})
+    client.cluster.state = respond(lambda index=None, **kw: {
+        'metadata': {'indices': {
+            i: {'state': 'open', 'settings': {'index': settings(i)}}
+            for i in requested(index)
+        }}
+    })
+    client.indices.stats = respond(lambda index=None, **kw: {
+        'indices': {i: stats(i) for i in requested(index)}})
+    client.cat.indices = respond(lambda **kw: [
+        {
+            'index': i, 'status': 'open', 'pri': '1', 'rep': '1',
+            'creation.date': '1456963200172', 'docs.count': '10',
+            'store.size': '2048', 'pri.store.size': '1024',
+        } for i in indices
+    ])
+    return client
+
+def fake_snapshot_client(snapshots, repository='repo'):
+    """Return a mock client with `snapshots` in `repository`"""
+    client = Mock()
+    client.snapshot.get_repository.return_value = {repository: {'type': 'fs'}}
+    client.snapshot.get.return_value = {'snapshots': [
+        {
+            'snapshot': name, 'state': 'SUCCESS',
+            'start_time_in_millis': 946684800000 + i * 3600000,
+        } for i, name in enumerate(snapshots)
+    ]}
+    return client
+
+def request_count(client):
+    """Return the number of API requests `client` has answered"""
+    return sum(
+        func.call_count for func in [
+            client.info, client.indices.get_settings, client.cluster.state,
+            client.indices.stats, client.cat.indices,
+        ]
+    )
+
+def timed(func, *args, **kwargs):
+    """Return the result of calling `func` and the elapsed seconds"""
+    start = time.time()
+    result = func(*args, **kwargs)
+    return result, time.time() - start
@@ -0,0 +1,18 @@
+"""Compare the ``settings`` and ``cat`` IndexList discovery backends"""
+import sys
+from curator import IndexList
+from . import fake_client, index_names, request_count, timed
+
+def main(count=20000, latency=0.02):
+    """Discover `count` indices with each backend and report the cost"""
+    indices = index_names(count)
+    print('{0} indices, {1}s simulated latency per request'.format(count, latency))
+    for discovery in ['settings', 'cat']:
+        client = fake_client(indices, latency=latency)
+        ilo, elapsed = timed(IndexList, client, discovery=discovery)
+        assert len(ilo.indices) == count
+        print('{0:>10}: {1:5d} requests, {2:8.3f}s'.format(
+            discovery, request_count(client), elapsed))
+
+if __name__ == '__main__':
+    main(*[cast(arg) for cast, arg in zip([int, float], sys.argv[1:])])
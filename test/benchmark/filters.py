@@ -0,0 +1,30 @@
+"""Time IndexList and SnapshotList filters which drop most of the list"""
+import sys
+from curator import IndexList, SnapshotList
+from . import fake_client, fake_snapshot_client, index_names, timed
+
+def main(count=100000):
+    """Filter `count` indices and `count` snapshots down to the newest year"""
+    names = index_names(count)
+    # Only the last year of names share this prefix, e.g. 'logstash-2273'
+    prefix = names[-1][:13]
+    print('{0} entries'.format(count))
+    ilo = IndexList(fake_client(names), discovery='cat')
+    _, elapsed = timed(ilo.filter_by_regex, kind='prefix', value=prefix)
+    print('{0:>22}: {1:8.3f}s, {2} remain'.format(
+        'IndexList pattern', elapsed, len(ilo.indices)))
+    ilo = IndexList(fake_client(names), discovery='cat')
+    _, elapsed = timed(ilo.filter_by_count, count=365, exclude=False)
+    print('{0:>22}: {1:8.3f}s, {2} remain'.format(
+        'IndexList count', elapsed, len(ilo.indices)))
+    slo = SnapshotList(fake_snapshot_client(names), repository='repo')
+    _, elapsed = timed(slo.filter_by_regex, kind='prefix', value=prefix)
+    print('{0:>22}: {1:8.3f}s, {2} remain'.format(
+        'SnapshotList pattern', elapsed, len(slo.snapshots)))
+    slo = SnapshotList(fake_snapshot_client(names), repository='repo')
+    _, elapsed = timed(slo.filter_by_count, count=365, exclude=False)
+    print('{0:>22}: {1:8.3f}s, {2} remain'.format(
+        'SnapshotList count', elapsed, len(slo.snapshots)))
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
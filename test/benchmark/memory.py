@@ -0,0 +1,105 @@
+"""Memory per entry of index_info and snapshot_info, as dicts and as records"""
+import json
+import sys
+import tracemalloc
+from curator.records import IndexAge, IndexInfo, SnapshotInfo
+from . import index_names
+
+def cat_body(indices):
+    """Return the ``_cat/indices`` response body of `indices` indices"""
+    return json.dumps([
+        {
+            'index': name, 'status': 'open', 'pri': '1', 'rep': '1',
+            'creation.date': '1456963200172', 'docs.count': '10',
+            'store.size': '2048', 'pri.store.size': '1024',
+        } for name in index_names(indices)
+    ])
+
+def snapshot_body(snapshots):
+    """
+    Return the body of a listing of `snapshots` snapshots, as listed once
+    their ``indices`` have been pruned
+    """
+    return json.dumps([
+        {
+            'snapshot': 'snapshot-{0:06d}'.format(i), 'uuid': 'x' * 22,
+            'version_id': 7130099, 'version': '7.13.0',
+            'include_global_state': True, 'state': 'SUCCESS',
+            'start_time': '2000-01-01T00:00:00.000Z',
+            'start_time_in_millis': 946684800000 + i * 3600000,
+            'end_time': '2000-01-01T00:01:00.000Z',
+            'end_time_in_millis': 946684860000 + i * 3600000,
+            'duration_in_millis': 60000,
+            'shards': {'total': 200, 'failed': 0, 'successful': 200},
+        } for i in range(snapshots)
+    ])
+
+def index_dicts(rows):
+    """Build `index_info` the way `IndexList` did before records"""
+    info = {}
+    for row in rows:
+        info[row['index']] = {
+            'age': {'creation_date': int(row['creation.date']) // 1000},
+            'number_of_replicas': row['rep'], 'number_of_shards': row['pri'],
+            'segments': 0, 'size_in_bytes': int(row['store.size']),
+            'docs': int(row['docs.count']),
+            'primary_size_in_bytes': int(row['pri.store.size']),
+            'state': row['status'],
+        }
+    return info
+
+def index_records(rows):
+    """Build `index_info` the way `IndexList` does"""
+    info = {}
+    for row in rows:
+        info[sys.intern(row['index'])] = IndexInfo(
+            age=IndexAge(creation_date=int(row['creation.date']) // 1000),
+            number_of_replicas=row['rep'], number_of_shards=row['pri'],
+            segments=0, size_in_bytes=int(row['store.size']),
+            docs=int(row['docs.count']),
+            primary_size_in_bytes=int(row['pri.store.size']),
+            state=row['status'],
+        )
+    return info
+
+def snapshot_dicts(docs):
+    """Build `snapshot_info` the way `SnapshotList` did before records"""
+    return {doc['snapshot']: doc for doc in docs}
+
+def snapshot_records(docs):
+    """Build `snapshot_info` the way `SnapshotList` does"""
+    info = {}
+    for doc in docs:
+        record = SnapshotInfo.from_snapshot(doc)
+        record['snapshot'] = sys.intern(record['snapshot'])
+        info[record['snapshot']] = record
+    return info
+
+def retained(build, raw):
+    """
+    Return the bytes retained by the result of `build` on the parsed response
+    body `raw`, once the parsed response itself has been released
+    """
+    tracemalloc.start()
+    data = json.loads(raw)
+    result = build(data)
+    del data
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert result
+    return kept
+
+def main(indices=100000, snapshots=50000):
+    """Compare the memory of `indices` index and `snapshots` snapshot entries"""
+    for label, count, load, builds in [
+            ('index_info', indices, cat_body, (index_dicts, index_records)),
+            ('snapshot_info', snapshots, snapshot_body, (snapshot_dicts, snapshot_records)),
+        ]:
+        as_dicts, as_records = [retained(build, load(count)) for build in builds]
+        print('{0:>13} x {1:>6}: dicts {2:7.1f} MB ({3:4.0f} B/entry), '
+              'records {4:7.1f} MB ({5:4.0f} B/entry)'.format(
+                  label, count, as_dicts / 1048576.0, as_dicts / float(count),
+                  as_records / 1048576.0, as_records / float(count)))
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
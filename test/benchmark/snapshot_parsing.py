@@ -0,0 +1,47 @@
+"""Peak memory of parsing a large snapshot listing, in full and pruned"""
+import json
+import sys
+import tracemalloc
+from curator import PruningJSONSerializer, pruned_responses
+from curator.defaults import settings
+from . import index_names
+
+def raw_listing(snapshots, indices):
+    """Return the JSON body of `snapshots` snapshots of `indices` indices each"""
+    names = index_names(indices)
+    return json.dumps({'snapshots': [
+        {
+            'snapshot': 'snapshot-{0:06d}'.format(i), 'uuid': 'x' * 22,
+            'state': 'SUCCESS', 'indices': names, 'data_streams': [],
+            'start_time_in_millis': 946684800000 + i * 3600000,
+            'shards': {'total': indices, 'failed': 0, 'successful': indices},
+            'failures': [],
+        } for i in range(snapshots)
+    ]})
+
+def peak(func, *args):
+    """Return the result of calling `func`, and its peak traced memory in MB"""
+    tracemalloc.start()
+    result = func(*args)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak_bytes / 1048576.0
+
+def pruned(raw):
+    """Parse `raw` the way `get_snapshot_data` does"""
+    with pruned_responses('snapshot', settings.pruned_snapshot_fields()):
+        return PruningJSONSerializer().loads(raw)
+
+def main(snapshots=5000, indices=200):
+    """Parse a listing of `snapshots` snapshots of `indices` indices each"""
+    raw = raw_listing(snapshots, indices)
+    print('{0} snapshots x {1} indices: {2:.1f} MB of JSON'.format(
+        snapshots, indices, len(raw) / 1048576.0))
+    full, full_peak = peak(json.loads, raw)
+    kept, pruned_peak = peak(pruned, raw)
+    assert [s['snapshot'] for s in full['snapshots']] == [s['snapshot'] for s in kept['snapshots']]
+    print('full parse peak {0:7.1f} MB, pruned parse peak {1:7.1f} MB'.format(
+        full_peak, pruned_peak))
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,40 @@
+"""Time extracting ages from the names of many tenants' daily indices"""
+import sys
+from curator import datetime_to_epoch, get_datetime, timestamp_to_epoch, TimestringSearch
+from . import index_names, timed
+
+def strptime_ages(names, timestring):
+    """The previous path: `datetime.strptime` for every name"""
+    search = TimestringSearch(timestring)
+    ages = []
+    for name in names:
+        match = search.pattern.search(name)
+        ages.append(datetime_to_epoch(get_datetime(match.group('date'), timestring)))
+    return ages
+
+def fast_ages(names, timestring):
+    """The current path: fast parser plus memo"""
+    timestamp_to_epoch.cache_clear()
+    search = TimestringSearch(timestring)
+    return [search.get_epoch(name) for name in names]
+
+def main(tenants=200, days=730):
+    """Get the ages of `days` daily indices for each of `tenants`"""
+    names = []
+    for tenant in range(tenants):
+        names.extend(index_names(days, prefix='tenant{0:04d}-'.format(tenant)))
+    print('{0} indices ({1} tenants x {2} days)'.format(len(names), tenants, days))
+    for timestring in ['%Y.%m.%d', '%Y.%m', '%Y.%W']:
+        if timestring == '%Y.%m.%d':
+            subject = names
+        else:
+            # Reuse the same dates in the coarser formats
+            subject = [name[:-3] for name in names]
+        expected, slow = timed(strptime_ages, subject, timestring)
+        actual, fast = timed(fast_ages, subject, timestring)
+        assert expected == actual
+        print('{0:>10}: strptime {1:7.3f}s, fast {2:7.3f}s ({3:.1f}x)'.format(
+            timestring, slow, fast, slow / fast))
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
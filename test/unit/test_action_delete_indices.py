@@ -46,6 +46,18 @@ class TestActionDeleteIndices(TestCase):
         ilo = curator.IndexList(client)
         do = curator.DeleteIndices(ilo)
         self.assertIsNone(do.do_action())
+    def test_do_action_records_deleted(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.indices.delete.return_value = None
+        ilo = curator.IndexList(client)
+        do = curator.DeleteIndices(ilo)
+        client.indices.get_settings.return_value = {}
+        do.do_action()
+        self.assertEqual(sorted(ilo.indices), sorted(do.deleted_indices))
     def test_do_action_not_successful(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
@@ -30,6 +30,7 @@ class TestActionDeleteSnapshots(TestCase):
         client.snapshot.get.return_value = testvars.snapshots
         client.snapshot.get_repository.return_value = testvars.test_repo
         client.tasks.list.return_value = testvars.no_snap_tasks
+        client.snapshot.status.return_value = testvars.status_none
         client.snapshot.delete.return_value = None
         slo = curator.SnapshotList(client, repository=testvars.repo_name)
         do = curator.DeleteSnapshots(slo)
@@ -40,6 +41,7 @@ class TestActionDeleteSnapshots(TestCase):
         client.snapshot.get_repository.return_value = testvars.test_repo
         client.snapshot.delete.return_value = None
         client.tasks.list.return_value = testvars.no_snap_tasks
+        client.snapshot.status.return_value = testvars.status_none
         client.snapshot.delete.side_effect = testvars.fake_fail
         slo = curator.SnapshotList(client, repository=testvars.repo_name)
         do = curator.DeleteSnapshots(slo)
@@ -49,6 +51,76 @@ class TestActionDeleteSnapshots(TestCase):
         client.snapshot.get.return_value = testvars.inprogress
         client.snapshot.get_repository.return_value = testvars.test_repo
         client.tasks.list.return_value = testvars.no_snap_tasks
+        client.snapshot.status.return_value = testvars.status_inprogress
         slo = curator.SnapshotList(client, repository=testvars.repo_name)
         do = curator.DeleteSnapshots(slo, retry_interval=0, retry_count=1)
         self.assertRaises(curator.FailedExecution, do.do_action)
+    def batch_client(self, version='7.8.0'):
+        client = Mock()
+        client.info.return_value = {'version': {'number': version} }
+        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        client.tasks.list.return_value = testvars.no_snap_tasks
+        client.snapshot.status.return_value = testvars.status_none
+        client.snapshot.delete.return_value = None
+        return client
+    def test_do_action_batched(self):
+        client = self.batch_client()
+        slo = curator.SnapshotList(client, repository=testvars.repo_name)
+        do = curator.DeleteSnapshots(slo, batch_size=100)
+        self.assertIsNone(do.do_action())
+        client.snapshot.delete.assert_called_once_with(
+            repository=testvars.repo_name, snapshot='snap_name,snapshot-2015.03.01')
+    def test_batch_size(self):
+        client = self.batch_client()
+        slo = curator.SnapshotList(client, repository=testvars.repo_name)
+        do = curator.DeleteSnapshots(slo, batch_size=1)
+        do.do_action()
+        self.assertEqual(2, client.snapshot.delete.call_count)
+    def test_batch_progress_logged(self):
+        client = self.batch_client()
+        slo = curator.SnapshotList(client, repository=testvars.repo_name)
+        slo.snapshots = ['a', 'b', 'c']
+        do = curator.DeleteSnapshots(slo, batch_size=2)
+        with self.assertLogs('curator.actions.delete_snapshots', 'INFO') as logs:
+            do.do_action()
+        self.assertEqual(3, do.deleted)
+        progress = [line for line in logs.output if 'Deleted batch' in line]
+        self.assertEqual(2, len(progress))
+        self.assertIn('Deleted batch 1 of 2', progress[0])
+        self.assertIn('2 of 3 snapshots deleted', progress[0])
+        self.assertIn('3 of 3 snapshots deleted', progress[1])
+    def test_batch_failure_reports_deleted(self):
+        client = self.batch_client()
+        client.snapshot.delete.side_effect = [None, elasticsearch.TransportError(500, 'boom', {})]
+        slo = curator.SnapshotList(client, repository=testvars.repo_name)
+        slo.snapshots = ['a', 'b', 'c']
+        do = curator.DeleteSnapshots(slo, batch_size=2)
+        with self.assertLogs('curator.actions.delete_snapshots', 'ERROR') as logs:
+            self.assertRaises(curator.FailedExecution, do.do_action)
+        self.assertEqual(2, do.deleted)
+        self.assertIn('2 of 3 snapshots were deleted before the failure', logs.output[0])
+    def test_batches_split_when_url_too_long(self):
+        client = self.batch_client()
+        names = ['snapshot-{0:06d}'.format(i) for i in range(1000)]
+        deleted = []
+        def delete(repository=None, snapshot=None):
+            if len(snapshot) > 4096:
+                raise elasticsearch.TransportError(
+                    400, 'too_long_frame_exception',
+                    'An HTTP line is larger than 4096 bytes.')
+            deleted.extend(snapshot.split(','))
+        client.snapshot.delete.side_effect = delete
+        slo = curator.SnapshotList(client, repository=testvars.repo_name)
+        slo.snapshots = names
+        do = curator.DeleteSnapshots(slo, batch_size=1000)
+        self.assertIsNone(do.do_action())
+        self.assertEqual(names, deleted)
+    def test_batched_unsupported(self):
+        client = self.batch_client(version='7.7.0')
+        slo = curator.SnapshotList(client, repository=testvars.repo_name)
+        do = curator.DeleteSnapshots(slo, batch_size=100)
+        do.do_action()
+        self.assertEqual(2, client.snapshot.delete.call_count)
+        client.snapshot.delete.assert_called_with(
+            repository=testvars.repo_name, snapshot='snapshot-2015.03.01')
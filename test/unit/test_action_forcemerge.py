@@ -14,8 +14,7 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         ilo = curator.IndexList(client)
         self.assertRaises(
             curator.MissingArgument, curator.ForceMerge, ilo)
@@ -24,8 +23,7 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         ilo = curator.IndexList(client)
         fmo = curator.ForceMerge(ilo, max_num_segments=2)
         self.assertEqual(ilo, fmo.index_list)
@@ -35,8 +33,7 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         client.indices.forcemerge.return_value = None
         client.indices.optimize.return_value = None
         ilo = curator.IndexList(client)
@@ -47,8 +44,7 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         client.info.return_value = {'version': {'number': '2.3.2'} }
         client.indices.optimize.return_value = None
         ilo = curator.IndexList(client)
@@ -59,8 +55,7 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.forcemerge.return_value = None
         ilo = curator.IndexList(client)
@@ -71,8 +66,7 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.forcemerge.return_value = None
         ilo = curator.IndexList(client)
@@ -83,8 +77,7 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         client.indices.forcemerge.return_value = None
         client.indices.optimize.return_value = None
         client.indices.forcemerge.side_effect = testvars.fake_fail
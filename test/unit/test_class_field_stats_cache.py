@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from mock import patch
+import curator
+
+class TestFieldStatsCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'field_stats.json')
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    def test_no_file(self):
+        cache = curator.FieldStatsCache(self.path)
+        self.assertEqual({}, cache.entries)
+        self.assertIsNone(cache.get('uuid', '@timestamp'))
+    def test_round_trip(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.put('uuid', '@timestamp', 1456963206, 1457049599)
+        cache.save()
+        cache = curator.FieldStatsCache(self.path)
+        self.assertEqual((1456963206, 1457049599), cache.get('uuid', '@timestamp'))
+        self.assertIsNone(cache.get('uuid', 'other_field'))
+    def test_save_unchanged_writes_nothing(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.save()
+        self.assertFalse(os.path.exists(self.path))
+    def test_unreadable_file(self):
+        with open(self.path, 'w') as fhandle:
+            fhandle.write('not json')
+        cache = curator.FieldStatsCache(self.path)
+        self.assertEqual({}, cache.entries)
+    def test_wrong_version(self):
+        with open(self.path, 'w') as fhandle:
+            fhandle.write('{"version": 0, "entries": {"uuid": {"f": [1, 2]}}}')
+        cache = curator.FieldStatsCache(self.path)
+        self.assertIsNone(cache.get('uuid', 'f'))
+    def test_save_failure_is_not_fatal(self):
+        cache = curator.FieldStatsCache(
+            os.path.join(self.tmpdir, 'no_such_dir', 'field_stats.json'))
+        cache.put('uuid', '@timestamp', 1, 2)
+        cache.save()
+        self.assertTrue(cache.dirty)
+    def test_failed_write_leaves_no_temp_file(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.put('uuid', '@timestamp', 1, 2)
+        with patch('curator.cache.os.replace', side_effect=OSError('denied')):
+            cache.save()
+        self.assertTrue(cache.dirty)
+        self.assertEqual([], os.listdir(self.tmpdir))
+    def test_prune(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.put('live', '@timestamp', 1, 2)
+        cache.put('deleted', '@timestamp', 3, 4)
+        cache.save()
+        cache = curator.FieldStatsCache(self.path)
+        cache.prune(['live', 'other'])
+        self.assertTrue(cache.dirty)
+        self.assertEqual(['live'], list(cache.entries))
+    def test_prune_nothing_stale(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.prune(['live'])
+        self.assertFalse(cache.dirty)
@@ -1,3 +1,7 @@
+import os
+import shutil
+import sys
+import tempfile
 from unittest import TestCase
 from mock import Mock, patch
 from copy import deepcopy
@@ -33,6 +37,31 @@ class TestIndexListClientAndInit(TestCase):
             il.index_info['index-2016.03.04']['state']
         )
         self.assertEqual(['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
+    def test_shares_index_names(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        for index in il.all_indices:
+            self.assertIs(index, sys.intern(index))
+        for name in list(il.index_info) + list(il.index_settings):
+            self.assertIs(name, sys.intern(name))
+        self.assertIsInstance(il.index_info[il.indices[0]], curator.IndexInfo)
+    def test_index_info_routing_and_custom_keys(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        self.assertEqual(
+            {'allocation': {'include': {'tag': 'foo'}}},
+            il.index_info['index-2016.03.03']['routing']
+        )
+        il.index_info['index-2016.03.03']['custom'] = 1
+        self.assertEqual(1, il.index_info['index-2016.03.03']['custom'])
     def test_for_closed_index(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
@@ -60,16 +89,223 @@ class TestIndexListOtherMethods(TestCase):
         self.assertEqual(2, len(il.indices))
         il.indices = []
         self.assertRaises(curator.NoIndices, il.empty_list_check)
+    def test_removed_indices_pruned_in_place(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        before = il.indices
+        il.filter_by_regex(kind='suffix', value='03.03', exclude=True)
+        self.assertEqual(['index-2016.03.04'], il.indices)
+        self.assertIs(before, il.indices)
     def test_get_segmentcount(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         il = curator.IndexList(client)
         il._get_segment_counts()
         self.assertEqual(71, il.index_info[testvars.named_index]['segments'])
+        client.indices.stats.assert_called_with(
+            index=testvars.named_index, metric='segments',
+            filter_path='indices.*.total.segments.count'
+        )
+        self.assertFalse(client.indices.segments.called)
+
+class TestIndexListLazy(TestCase):
+    def lazy_client(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        return client
+    def test_init_skips_metadata_and_stats(self):
+        client = self.lazy_client()
+        il = curator.IndexList(client, lazy=True)
+        self.assertEqual(['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
+        self.assertFalse(client.cluster.state.called)
+        self.assertFalse(client.indices.stats.called)
+    def test_pattern_filter_needs_no_data(self):
+        client = self.lazy_client()
+        il = curator.IndexList(client, lazy=True)
+        il.filter_by_regex(kind='prefix', value='index-2016.03.03')
+        il.filter_by_age(source='name', direction='older', timestring='%Y.%m.%d',
+            unit='days', unit_count=1, epoch=1457136000)
+        self.assertEqual(['index-2016.03.03'], il.indices)
+        self.assertFalse(client.cluster.state.called)
+        self.assertFalse(client.indices.stats.called)
+    def test_load_only_remaining_indices(self):
+        client = self.lazy_client()
+        il = curator.IndexList(client, lazy=True)
+        il.filter_by_regex(kind='prefix', value='index-2016.03.03')
+        il.filter_empty()
+        client.cluster.state.assert_called_once_with(
+            index='index-2016.03.03', metric='metadata',
+            filter_path=curator.settings.filter_paths()['cluster_state_metadata'])
+        client.indices.stats.assert_called_once_with(
+            index='index-2016.03.03', metric='store,docs',
+            filter_path=curator.settings.filter_paths()['index_stats'])
+        self.assertEqual([], il.needs_data('stats'))
+    def test_load_data_once(self):
+        client = self.lazy_client()
+        il = curator.IndexList(client, lazy=True)
+        il.filter_closed()
+        il.filter_opened(exclude=False)
+        self.assertEqual(1, client.cluster.state.call_count)
+        self.assertEqual('open', il.index_info['index-2016.03.04']['state'])
+    def test_eager_load_data_is_noop(self):
+        client = self.lazy_client()
+        il = curator.IndexList(client)
+        il.load_data('metadata', 'stats')
+        self.assertEqual(1, client.cluster.state.call_count)
+        self.assertEqual(1, client.indices.stats.call_count)
+
+class TestIndexListSettings(TestCase):
+    def test_settings_from_cluster_state(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        client.indices.get_settings.reset_mock()
+        il.filter_allocated(key='tag', value='foo', allocation_type='include')
+        il.filter_ilm()
+        self.assertFalse(client.indices.get_settings.called)
+        self.assertEqual(1, client.cluster.state.call_count)
+        self.assertEqual(
+            testvars.settings_two['index-2016.03.04']['settings']['index'],
+            il.index_settings['index-2016.03.04']
+        )
+    def test_cat_discovery_loads_settings_once(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.cat.indices.return_value = testvars.cat_indices_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        il = curator.IndexList(client, lazy=True, discovery='cat')
+        il.filter_ilm()
+        il.filter_allocated(key='tag', value='foo', allocation_type='include')
+        self.assertEqual(1, client.cluster.state.call_count)
+        self.assertEqual(['index-2016.03.04'], il.indices)
+    def test_missing_settings_fetched_per_chunk(self):
+        # Used by AWS ES <= 5.1
+        no_settings = deepcopy(testvars.clu_state_two)
+        for index in no_settings['metadata']['indices'].values():
+            del index['settings']
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = no_settings
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        self.assertFalse(client.indices.get.called)
+        self.assertEqual(2, client.indices.get_settings.call_count)
+        self.assertEqual(
+            '5', il.index_info['index-2016.03.03']['number_of_shards'])
+
+class TestIndexListConcurrency(TestCase):
+    def many_client(self, count):
+        # Long names, so the list is split over several chunks
+        names = [
+            'superlongindexnamebyanystandardyouchoosethisissilly-{0:04d}'.format(i)
+            for i in range(count)
+        ]
+        def settings(index=None, **kwargs):
+            wanted = names if index == '_all' else index.split(',')
+            return {
+                i: {'settings': {'index': {'routing': {'allocation': {
+                    'include': {'tag': 'foo' if int(i[-4:]) % 2 else 'bar'}}}}}}
+                for i in wanted
+            }
+        def state(index=None, metric=None, **kwargs):
+            return {'metadata': {'indices': {
+                i: {'state': 'open', 'settings': {'index': {
+                    'creation_date': '1456963200172',
+                    'number_of_shards': '1', 'number_of_replicas': '1',
+                    'routing': {'allocation': {
+                        'include': {'tag': 'foo' if int(i[-4:]) % 2 else 'bar'}}}}}}
+                for i in index.split(',')
+            }}}
+        def stats(index=None, metric=None, **kwargs):
+            return {'indices': {
+                i: {'total': {'store': {'size_in_bytes': 10}, 'docs': {'count': int(i[-4:])}},
+                    'primaries': {'store': {'size_in_bytes': 5}}}
+                for i in index.split(',')
+            }}
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.side_effect = settings
+        client.cluster.state.side_effect = state
+        client.indices.stats.side_effect = stats
+        return names, client
+    def test_same_result_as_serial(self):
+        names, client = self.many_client(200)
+        serial = curator.IndexList(client)
+        _, client = self.many_client(200)
+        concurrent = curator.IndexList(client, concurrency=4)
+        self.assertTrue(client.cluster.state.call_count > 1)
+        self.assertEqual(sorted(names), sorted(concurrent.indices))
+        self.assertEqual(serial.index_info, concurrent.index_info)
+    def test_filter_allocated(self):
+        names, client = self.many_client(200)
+        il = curator.IndexList(client, concurrency=4)
+        il.filter_allocated(
+            key='tag', value='foo', allocation_type='include', exclude=False)
+        self.assertEqual(
+            [n for n in names if int(n[-4:]) % 2], sorted(il.indices))
+
+class TestIndexListCatDiscovery(TestCase):
+    def test_init(self):
+        client = Mock()
+        client.cat.indices.return_value = testvars.cat_indices_two
+        il = curator.IndexList(client, discovery='cat')
+        self.assertEqual(['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
+        self.assertEqual(1115219663, il.index_info['index-2016.03.03']['size_in_bytes'])
+        self.assertEqual(6377544, il.index_info['index-2016.03.04']['docs'])
+        self.assertEqual(
+            1457049600, il.index_info['index-2016.03.04']['age']['creation_date'])
+        self.assertFalse(client.indices.get_settings.called)
+        self.assertFalse(client.cluster.state.called)
+        self.assertFalse(client.indices.stats.called)
+    def test_closed_index(self):
+        client = Mock()
+        client.cat.indices.return_value = testvars.cat_indices_2_closed
+        il = curator.IndexList(client, discovery='cat')
+        self.assertEqual('close', il.index_info['index-2016.03.03']['state'])
+        self.assertEqual(0, il.index_info['index-2016.03.03']['docs'])
+        il.filter_closed()
+        self.assertEqual(['index-2016.03.04'], il.indices)
+    def test_lazy_loads_nothing_more(self):
+        client = Mock()
+        client.cat.indices.return_value = testvars.cat_indices_two
+        il = curator.IndexList(client, lazy=True, discovery='cat')
+        il.filter_by_size(size_threshold=0.5)
+        self.assertFalse(client.cluster.state.called)
+        self.assertFalse(client.indices.stats.called)
+        self.assertEqual(['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
+    def test_fallback(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.cat.indices.side_effect = testvars.fake_fail
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client, discovery='cat')
+        self.assertEqual(['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
+        self.assertEqual(1115219663, il.index_info['index-2016.03.03']['size_in_bytes'])
+    def test_search_pattern(self):
+        client = Mock()
+        client.cat.indices.return_value = testvars.cat_indices_two
+        il = curator.IndexList(client, discovery='cat', search_pattern='index-*')
+        self.assertEqual('index-*', client.cat.indices.call_args[1]['index'])
+        self.assertEqual('index-*', il.search_pattern)
+    def test_invalid_discovery(self):
+        client = Mock()
+        self.assertRaises(ValueError, curator.IndexList, client, discovery='foo')
 
 class TestIndexListAgeFilterName(TestCase):
     def test_get_name_based_ages_match(self):
@@ -103,7 +339,7 @@ class TestIndexListAgeFilterStatsAPI(TestCase):
         client.indices.get_settings.return_value = testvars.settings_two
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
-        client.search.return_value = testvars.fieldstats_query
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query] * 2}
         il = curator.IndexList(client)
         client.field_stats.return_value = testvars.fieldstats_two
         il._get_field_stats_dates(field='timestamp')
@@ -114,10 +350,148 @@ class TestIndexListAgeFilterStatsAPI(TestCase):
         client.indices.get_settings.return_value = testvars.settings_two
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
-        client.search.return_value = {u'aggregations': {u'foo':u'bar'}}
+        client.msearch.return_value = {'responses': [{u'aggregations': {u'foo':u'bar'}}] * 2}
+        il = curator.IndexList(client)
+        self.assertRaises(
+            curator.ActionError, il._get_field_stats_dates, field='not_in_index')
+    def test_get_field_stats_dates_unmapped_field(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.msearch.return_value = {'responses': [
+            {u'aggregations': {u'min': {u'value': None}, u'max': {u'value': None}}}] * 2}
         il = curator.IndexList(client)
         self.assertRaises(
             curator.ActionError, il._get_field_stats_dates, field='not_in_index')
+    def test_get_field_stats_dates_batches(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query] * 2}
+        il = curator.IndexList(client, msearch_batch_size=2)
+        il._get_field_stats_dates(field='timestamp')
+        # The closed index is omitted, leaving 3 indices in batches of 2
+        self.assertEqual(2, client.msearch.call_count)
+        searches = client.msearch.call_args_list[0][1]['body']
+        self.assertEqual(il.indices[0:2], [s['index'] for s in searches[0::2]])
+        self.assertEqual(
+            curator.fix_epoch(testvars.fieldstats_query['aggregations']['min']['value']),
+            il.index_info[il.indices[2]]['age']['min_value']
+        )
+    def test_get_field_stats_dates_error_response(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        first = il.indices[0]
+        client.msearch.return_value = {'responses': [
+            {'error': {'type': 'index_not_found_exception'}, 'status': 404},
+            testvars.fieldstats_query,
+        ]}
+        il._get_field_stats_dates(field='timestamp')
+        self.assertNotIn(first, il.indices)
+        self.assertEqual(1, len(il.indices))
+
+    def test_ages_calculated_once_per_field(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query] * 2}
+        il = curator.IndexList(client)
+        il.filter_by_age(
+            source='field_stats', field='timestamp', stats_result='min_value',
+            direction='older', unit='days', unit_count=1, exclude=False)
+        il.filter_by_count(
+            count=1, pattern=r'^(.*)-\d{4}\.\d{2}\.\d{2}$', use_age=True,
+            source='field_stats', field='timestamp', stats_result='max_value')
+        self.assertEqual(1, client.msearch.call_count)
+        # A different field is queried again
+        il.filter_by_count(
+            count=1, use_age=True, source='field_stats', field='other',
+            stats_result='max_value')
+        self.assertEqual(2, client.msearch.call_count)
+
+class TestIndexListFieldStatsCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'field_stats.json')
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    def sealed_client(self):
+        # index-2016.03.03 is write-blocked, index-2016.03.04 is not
+        state = deepcopy(testvars.clu_state_two)
+        state['metadata']['indices']['index-2016.03.03']['settings']['index']['blocks'] = {
+            'write': 'true'}
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = state
+        client.indices.stats.return_value = testvars.stats_two
+        return client
+    def test_only_sealed_indices_cached(self):
+        client = self.sealed_client()
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query] * 2}
+        il = curator.IndexList(client, field_stats_cache=curator.FieldStatsCache(self.path))
+        il._get_field_stats_dates(field='timestamp')
+        cache = curator.FieldStatsCache(self.path)
+        self.assertIsNotNone(cache.get(
+            il.index_info['index-2016.03.03']['uuid'], 'timestamp'))
+        self.assertEqual(1, len(cache.entries))
+    def test_cached_indices_not_queried(self):
+        client = self.sealed_client()
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query] * 2}
+        il = curator.IndexList(client, field_stats_cache=curator.FieldStatsCache(self.path))
+        il._get_field_stats_dates(field='timestamp')
+        client = self.sealed_client()
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query]}
+        il = curator.IndexList(client, field_stats_cache=curator.FieldStatsCache(self.path))
+        il._get_field_stats_dates(field='timestamp')
+        searches = client.msearch.call_args[1]['body']
+        self.assertEqual(['index-2016.03.04'], [s['index'] for s in searches[0::2]])
+        self.assertEqual(
+            curator.fix_epoch(testvars.fieldstats_query['aggregations']['min']['value']),
+            il.index_info['index-2016.03.03']['age']['min_value']
+        )
+    def test_all_cached(self):
+        client = self.sealed_client()
+        cache = curator.FieldStatsCache(self.path)
+        il = curator.IndexList(client, field_stats_cache=cache)
+        il.filter_by_regex(kind='prefix', value='index-2016.03.03')
+        cache.put(il.index_info['index-2016.03.03']['uuid'], 'timestamp', 1, 2)
+        il._get_field_stats_dates(field='timestamp')
+        self.assertFalse(client.msearch.called)
+        self.assertEqual(2, il.index_info['index-2016.03.03']['age']['max_value'])
+    def test_deleted_indices_pruned(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.put('deleted_index_uuid', 'timestamp', 1, 2)
+        cache.save()
+        client = self.sealed_client()
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query] * 2}
+        il = curator.IndexList(client, field_stats_cache=curator.FieldStatsCache(self.path))
+        il._get_field_stats_dates(field='timestamp')
+        cache = curator.FieldStatsCache(self.path)
+        self.assertEqual(
+            [il.index_info['index-2016.03.03']['uuid']], list(cache.entries))
+    def test_not_pruned_for_partial_discovery(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.put('other_index_uuid', 'timestamp', 1, 2)
+        cache.save()
+        client = self.sealed_client()
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query] * 2}
+        il = curator.IndexList(
+            client, field_stats_cache=curator.FieldStatsCache(self.path),
+            search_pattern='index-*')
+        il._get_field_stats_dates(field='timestamp')
+        cache = curator.FieldStatsCache(self.path)
+        self.assertIn('other_index_uuid', cache.entries)
 
 class TestIndexListRegexFilters(TestCase):
     def test_filter_by_regex_prefix(self):
@@ -566,7 +940,7 @@ class TestIndexListFilterBySpace(TestCase):
         client.indices.get_settings.return_value = testvars.settings_four
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
-        client.search.return_value = testvars.fieldstats_query
+        client.msearch.return_value = {'responses': [testvars.fieldstats_query] * 4}
         il = curator.IndexList(client)
         self.assertRaises(ValueError,
             il.filter_by_space, disk_space=2.1, use_age=True,
@@ -668,8 +1042,7 @@ class TestIndexListFilterForceMerged(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         il = curator.IndexList(client)
         self.assertRaises(curator.MissingArgument, il.filter_forceMerged)
     def test_filter_forcemerge_positive(self):
@@ -677,8 +1050,7 @@ class TestIndexListFilterForceMerged(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         il = curator.IndexList(client)
         il.filter_forceMerged(max_num_segments=2)
         self.assertEqual([testvars.named_index], il.indices)
@@ -687,8 +1059,7 @@ class TestIndexListFilterForceMerged(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.fm_shards
+        client.indices.stats.return_value = testvars.stats_one_fm_segments
         il = curator.IndexList(client)
         il.filter_forceMerged(max_num_segments=2)
         self.assertEqual([], il.indices)
@@ -748,6 +1119,16 @@ class TestIndexListFilterAllocated(TestCase):
         il = curator.IndexList(client)
         il.filter_allocated(key='tag', value='foo', allocation_type='include')
         self.assertEqual(['index-2016.03.04'], il.indices)
+    def test_settings_unavailable(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.side_effect = elasticsearch.TransportError(
+            503, 'cluster_block_exception', {})
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        il.filter_allocated(key='tag', value='foo', allocation_type='include')
+        self.assertEqual(['index-2016.03.04'], il.indices)
     def test_invalid_tag(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
@@ -760,6 +1141,55 @@ class TestIndexListFilterAllocated(TestCase):
         self.assertEqual(
             ['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
 
+class TestPlanFilters(TestCase):
+    def builder(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        return client
+    def test_cheap_filters_first(self):
+        ilo = curator.IndexList(self.builder())
+        flist = [
+            {'filtertype': 'ilm'},
+            {'filtertype': 'age', 'source': 'field_stats'},
+            {'filtertype': 'closed'},
+            {'filtertype': 'age', 'source': 'creation_date'},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'a'},
+        ]
+        self.assertEqual(
+            [flist[4], flist[2], flist[3], flist[0], flist[1]],
+            ilo._plan_filters(flist)
+        )
+    def test_order_dependent_filters_stay(self):
+        ilo = curator.IndexList(self.builder())
+        flist = [
+            {'filtertype': 'ilm'},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'a'},
+            {'filtertype': 'count', 'count': 1},
+            {'filtertype': 'alias', 'aliases': ['foo']},
+            {'filtertype': 'period', 'use_age': True},
+            {'filtertype': 'opened'},
+            {'filtertype': 'none'},
+        ]
+        self.assertEqual(
+            [flist[1], flist[0], flist[2], flist[3], flist[4], flist[6], flist[5]],
+            ilo._plan_filters(flist)
+        )
+    def test_optimized_iterate_filters(self):
+        client = self.builder()
+        ilo = curator.IndexList(client, lazy=True)
+        config = {'filters': [
+            {'filtertype': 'ilm', 'exclude': True},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'a-'},
+        ]}
+        ilo.iterate_filters(config, optimize=True)
+        self.assertEqual(['a-2016.03.03'], ilo.indices)
+        client.cluster.state.assert_called_once_with(
+            index='a-2016.03.03', metric='metadata',
+            filter_path=curator.settings.filter_paths()['cluster_state_metadata'])
+
 class TestIterateFiltersIndex(TestCase):
     def test_no_filters(self):
         client = Mock()
@@ -829,8 +1259,7 @@ class TestIterateFiltersIndex(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.stats_one_segments
         ilo = curator.IndexList(client)
         config = yaml.load(testvars.forcemerge_ft, Loader=yaml.FullLoader)['actions'][1]
         ilo.iterate_filters(config)
@@ -913,7 +1342,7 @@ class TestIterateFiltersIndex(TestCase):
         with_ilm = deepcopy(testvars.settings_two)
         with_ilm['index-2016.03.03']['settings']['index']['lifecycle'] = {'name':'mypolicy'}
         client.indices.get_settings.return_value = with_ilm
-        client.cluster.state.return_value = testvars.clu_state_two
+        client.cluster.state.return_value = {'metadata': {'indices': with_ilm}}
         client.indices.stats.return_value = testvars.stats_two
         ilo = curator.IndexList(client)
         config = {'filters': [{'filtertype':'ilm','exclude':True}]}
@@ -929,6 +1358,30 @@ class TestIterateFiltersIndex(TestCase):
         config = {'filters': [{'filtertype':'ilm','exclude':True}]}
         ilo.iterate_filters(config)
         self.assertEqual(['index-2016.03.03','index-2016.03.04'], sorted(ilo.indices))
+    def test_ilm_filtertype_settings_unavailable(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '6.6.0'} }
+        with_ilm = deepcopy(testvars.settings_two)
+        for index in with_ilm:
+            with_ilm[index]['settings']['index']['lifecycle'] = {'name':'mypolicy'}
+        client.indices.get_settings.return_value = with_ilm
+        client.cluster.state.side_effect = elasticsearch.TransportError(
+            503, 'cluster_block_exception', {})
+        client.indices.stats.return_value = testvars.stats_two
+        ilo = curator.IndexList(client)
+        ilo.filter_ilm()
+        self.assertEqual([], ilo.indices)
+    def test_ilm_filtertype_settings_error_raises(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '6.6.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.side_effect = elasticsearch.TransportError(
+            503, 'cluster_block_exception', {})
+        client.indices.stats.return_value = testvars.stats_two
+        ilo = curator.IndexList(client)
+        client.indices.get_settings.side_effect = elasticsearch.TransportError(
+            503, 'cluster_block_exception', {})
+        self.assertRaises(elasticsearch.TransportError, ilo.filter_ilm)
     def test_size_filtertype(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
@@ -1260,6 +1713,16 @@ class TestIndexListFilterBySize(TestCase):
         il = curator.IndexList(client)
         il.filter_by_size(size_threshold=1.04, size_behavior='total')
         self.assertEqual([u'index-2016.03.04'], il.indices)
+    def test_filter_missing_size(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        del il.index_info['index-2016.03.03']['primary_size_in_bytes']
+        il.filter_by_size(size_threshold=0.1)
+        self.assertEqual([u'index-2016.03.04'], il.indices)
     def test_filter_by_size_behavior_total_and_threshold_behavior_less_than(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
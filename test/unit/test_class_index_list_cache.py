@@ -0,0 +1,139 @@
+from unittest import TestCase
+from mock import Mock
+import curator
+from curator.cli import invalidate_index_cache
+# Get test variables and constants from a single source
+from . import testvars as testvars
+
+def cat_client():
+    client = Mock()
+    client.info.return_value = {'version': {'number': '5.0.0'} }
+    client.cat.indices.return_value = testvars.cat_indices_two
+    client.cluster.state.return_value = testvars.clu_state_two
+    client.indices.stats.return_value = testvars.stats_two
+    return client
+
+class TestIndexListCache(TestCase):
+    def test_discovers_once(self):
+        client = cat_client()
+        cache = curator.IndexListCache()
+        first = cache.get(client)
+        second = cache.get(client)
+        self.assertEqual(1, client.cat.indices.call_count)
+        self.assertIsNot(first, second)
+        self.assertEqual(sorted(first.indices), sorted(second.indices))
+    def test_clones_filter_independently(self):
+        client = cat_client()
+        cache = curator.IndexListCache()
+        first = cache.get(client)
+        first.filter_by_regex(kind='suffix', value='03', exclude=True)
+        second = cache.get(client)
+        self.assertEqual(['index-2016.03.04'], first.indices)
+        self.assertEqual(
+            ['index-2016.03.03','index-2016.03.04'], sorted(second.indices))
+    def test_clone_uses_new_client(self):
+        client = cat_client()
+        other = cat_client()
+        cache = curator.IndexListCache()
+        cache.get(client)
+        self.assertIs(other, cache.get(other).client)
+        self.assertFalse(other.cat.indices.called)
+    def test_shares_loaded_data(self):
+        client = cat_client()
+        cache = curator.IndexListCache()
+        cache.get(client).filter_allocated(
+            key='foo', value='bar', allocation_type='require', exclude=False)
+        self.assertEqual(1, client.cluster.state.call_count)
+        cache.get(client).filter_allocated(
+            key='foo', value='bar', allocation_type='require', exclude=False)
+        self.assertEqual(1, client.cluster.state.call_count)
+    def test_invalidate(self):
+        client = cat_client()
+        cache = curator.IndexListCache()
+        cache.get(client)
+        cache.invalidate(['index-2016.03.03'])
+        ilo = cache.get(client)
+        self.assertEqual(
+            ['index-2016.03.03','index-2016.03.04'], sorted(ilo.indices))
+        ilo.filter_closed()
+        self.assertEqual(
+            'index-2016.03.03', client.cluster.state.call_args[1]['index'])
+        self.assertEqual('open', ilo.index_info['index-2016.03.03']['state'])
+    def test_invalidate_deleted(self):
+        client = cat_client()
+        cache = curator.IndexListCache()
+        cache.get(client)
+        cache.invalidate(['index-2016.03.03'], deleted=True)
+        ilo = cache.get(client)
+        self.assertEqual(['index-2016.03.04'], ilo.indices)
+        self.assertEqual(['index-2016.03.04'], ilo.all_indices)
+        self.assertNotIn('index-2016.03.03', ilo.index_info)
+    def test_search_patterns(self):
+        client = cat_client()
+        cache = curator.IndexListCache()
+        cache.get(client, 'index-*')
+        cache.get(client, 'index-*')
+        self.assertEqual(1, client.cat.indices.call_count)
+        cache.get(client, 'other-*')
+        self.assertEqual(2, client.cat.indices.call_count)
+        cache.get(client)
+        # Every pattern is a subset of _all
+        cache.get(client, 'third-*')
+        self.assertEqual(3, client.cat.indices.call_count)
+        cache.invalidate(['index-2016.03.03'], deleted=True)
+        for index_list in cache.index_lists.values():
+            self.assertNotIn('index-2016.03.03', index_list.indices)
+    def test_clear(self):
+        client = cat_client()
+        cache = curator.IndexListCache()
+        cache.get(client)
+        cache.clear()
+        cache.get(client)
+        self.assertEqual(2, client.cat.indices.call_count)
+
+class TestInvalidateIndexCache(TestCase):
+    def action_obj(self):
+        action_obj = Mock()
+        action_obj.index_list.indices = ['index-2016.03.03']
+        return action_obj
+    def test_creating_action(self):
+        cache = Mock()
+        invalidate_index_cache(cache, 'rollover', Mock())
+        cache.clear.assert_called_once_with()
+    def test_delete_indices(self):
+        cache = Mock()
+        action_obj = self.action_obj()
+        action_obj.deleted_indices = ['index-2016.03.03']
+        invalidate_index_cache(cache, 'delete_indices', action_obj)
+        cache.invalidate.assert_any_call(['index-2016.03.03'], deleted=True)
+        cache.invalidate.assert_called_with([])
+    def test_delete_indices_unverified(self):
+        cache = Mock()
+        action_obj = self.action_obj()
+        action_obj.deleted_indices = []
+        invalidate_index_cache(cache, 'delete_indices', action_obj)
+        cache.invalidate.assert_any_call([], deleted=True)
+        cache.invalidate.assert_called_with(['index-2016.03.03'])
+    def test_failed_deletes_stay_cached(self):
+        client = cat_client()
+        # Deletes never take effect
+        client.indices.get_settings.return_value = testvars.settings_two
+        cache = curator.IndexListCache()
+        index_list = cache.get(client)
+        action_obj = curator.DeleteIndices(index_list)
+        action_obj.do_action()
+        self.assertEqual([], action_obj.deleted_indices)
+        invalidate_index_cache(cache, 'delete_indices', action_obj)
+        self.assertEqual(
+            ['index-2016.03.03', 'index-2016.03.04'],
+            sorted(cache.get(client).all_indices)
+        )
+    def test_changing_action(self):
+        cache = Mock()
+        invalidate_index_cache(cache, 'close', self.action_obj())
+        cache.invalidate.assert_called_once_with(['index-2016.03.03'])
+    def test_other_action(self):
+        cache = Mock()
+        invalidate_index_cache(cache, 'alias', Mock())
+        self.assertFalse(cache.clear.called)
+        self.assertFalse(cache.invalidate.called)
@@ -0,0 +1,50 @@
+from unittest import TestCase
+from curator.records import IndexAge, IndexInfo, SnapshotInfo
+
+class TestRecord(TestCase):
+    def test_unset_keys_are_absent(self):
+        age = IndexAge(creation_date=1)
+        self.assertIn('creation_date', age)
+        self.assertNotIn('name', age)
+        self.assertNotIn('get', age)
+        self.assertRaises(KeyError, lambda: age['name'])
+        self.assertIsNone(age.get('name'))
+        self.assertEqual(['creation_date'], list(age))
+        self.assertEqual(1, len(age))
+    def test_set_and_pop(self):
+        age = IndexAge()
+        age['name'] = 2
+        self.assertEqual(2, age.pop('name'))
+        self.assertIsNone(age.pop('name', None))
+        self.assertRaises(KeyError, age.pop, 'name')
+    def test_unknown_key(self):
+        info = IndexInfo(state='open')
+        self.assertNotIn('custom', info)
+        self.assertRaises(KeyError, lambda: info['custom'])
+        info['custom'] = {'a': 1}
+        self.assertIn('custom', info)
+        self.assertEqual({'a': 1}, info['custom'])
+        self.assertEqual({'state': 'open', 'custom': {'a': 1}}, dict(info))
+        del info['custom']
+        self.assertNotIn('custom', info)
+        self.assertRaises(KeyError, info.__delitem__, 'custom')
+    def test_routing(self):
+        info = IndexInfo(routing={'allocation': {}})
+        self.assertEqual({'allocation': {}}, info['routing'])
+    def test_equals_dict(self):
+        info = IndexInfo(age=IndexAge(name=3), state='open')
+        self.assertEqual({'age': {'name': 3}, 'state': 'open'}, info)
+        self.assertEqual(info, IndexInfo(age=IndexAge(name=3), state='open'))
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(IndexInfo(), '__dict__'))
+
+class TestSnapshotInfo(TestCase):
+    def test_from_snapshot(self):
+        doc = {
+            'snapshot': 'snap', 'state': 'SUCCESS', 'uuid': 'abc',
+            'start_time_in_millis': 1, 'shards': {'total': 1},
+            'metadata': {'taken_by': 'curator'},
+        }
+        info = SnapshotInfo.from_snapshot(doc)
+        self.assertEqual(doc, dict(info.items()))
+        self.assertEqual({'taken_by': 'curator'}, info['metadata'])
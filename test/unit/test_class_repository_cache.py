@@ -0,0 +1,58 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from mock import Mock, patch
+import curator
+
+class TestRepositoryCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'repositories.json')
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    def client(self, nodes):
+        client = Mock()
+        client.cat.nodes.return_value = [{'id': node} for node in nodes]
+        return client
+    def test_key(self):
+        cache = curator.RepositoryCache()
+        key = cache.key(self.client(['b', 'a']), 'repo')
+        self.assertTrue(key.startswith('repo/'))
+        self.assertEqual(key, cache.key(self.client(['a', 'b']), 'repo'))
+        self.assertNotEqual(key, cache.key(self.client(['a']), 'repo'))
+    def test_key_without_nodes(self):
+        client = Mock()
+        client.cat.nodes.side_effect = Exception('nope')
+        cache = curator.RepositoryCache()
+        self.assertIsNone(cache.key(client, 'repo'))
+        cache.put(None)
+        self.assertFalse(cache.verified(None))
+        self.assertEqual({}, cache.entries)
+    def test_ttl(self):
+        cache = curator.RepositoryCache(ttl=60)
+        with patch('curator.cache.time.time', return_value=1000):
+            cache.put('repo/x')
+        with patch('curator.cache.time.time', return_value=1059):
+            self.assertTrue(cache.verified('repo/x'))
+        with patch('curator.cache.time.time', return_value=1060):
+            self.assertFalse(cache.verified('repo/x'))
+            cache.put('repo/y')
+        self.assertEqual(['repo/y'], list(cache.entries))
+    def test_in_memory_only(self):
+        cache = curator.RepositoryCache()
+        cache.put('repo/x')
+        cache.save()
+        self.assertEqual([], os.listdir(self.tmpdir))
+    def test_round_trip(self):
+        cache = curator.RepositoryCache(self.path)
+        cache.put('repo/x')
+        cache.save()
+        with open(self.path) as fhandle:
+            self.assertEqual(1, json.load(fhandle)['version'])
+        self.assertTrue(curator.RepositoryCache(self.path).verified('repo/x'))
+    def test_unreadable_file(self):
+        with open(self.path, 'w') as fhandle:
+            fhandle.write('not json')
+        self.assertEqual({}, curator.RepositoryCache(self.path).entries)
@@ -28,10 +28,81 @@ class TestSnapshotListClientAndInit(TestCase):
         client.snapshot.get_repository.return_value = testvars.test_repo
         sl = curator.SnapshotList(client, repository=testvars.repo_name)
         self.assertEqual(testvars.snapshots['snapshots'],sl.all_snapshots)
+        self.assertIs(sl.all_snapshots[0], sl.snapshot_info[sl.snapshots[0]])
         self.assertEqual(
             ['snap_name','snapshot-2015.03.01'], sorted(sl.snapshots)
         )
 
+class TestSnapshotListPages(TestCase):
+    def test_init(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '7.14.0'} }
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        first, second = testvars.snapshots['snapshots']
+        client.snapshot.get.side_effect = [
+            {'snapshots': [first], 'next': 'cursor'},
+            {'snapshots': [second]},
+        ]
+        sl = curator.SnapshotList(
+            client, repository=testvars.repo_name, page_size=1)
+        self.assertEqual(['snap_name','snapshot-2015.03.01'], sl.snapshots)
+        self.assertEqual(2, client.snapshot.get.call_count)
+        self.assertEqual(
+            'SUCCESS', sl.snapshot_info['snapshot-2015.03.01']['state'])
+
+class TestSnapshotListCatDiscovery(TestCase):
+    def cat_client(self):
+        client = Mock()
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        client.cat.snapshots.return_value = [
+            {'id': snap['snapshot'], 'status': snap['state'],
+             'start_epoch': str(snap['start_time_in_millis'] // 1000)}
+            for snap in testvars.snapshots['snapshots']
+        ]
+        return client
+    def test_init(self):
+        client = self.cat_client()
+        sl = curator.SnapshotList(
+            client, repository=testvars.repo_name, discovery='cat')
+        self.assertEqual(['snap_name','snapshot-2015.03.01'], sorted(sl.snapshots))
+        self.assertEqual('SUCCESS', sl.snapshot_info['snap_name']['state'])
+        self.assertEqual(
+            1422748000, sl.snapshot_info['snap_name']['start_time_in_millis'])
+        self.assertFalse(client.snapshot.get.called)
+    def test_filters_without_details(self):
+        client = self.cat_client()
+        sl = curator.SnapshotList(
+            client, repository=testvars.repo_name, discovery='cat')
+        sl.filter_by_age(unit='days', unit_count=1, direction='older')
+        sl.filter_by_state(state='SUCCESS')
+        self.assertEqual(['snap_name','snapshot-2015.03.01'], sorted(sl.snapshots))
+        self.assertFalse(client.snapshot.get.called)
+    def test_load_details(self):
+        client = self.cat_client()
+        client.snapshot.get.return_value = {
+            'snapshots': testvars.snapshots['snapshots'][1:]}
+        sl = curator.SnapshotList(
+            client, repository=testvars.repo_name, discovery='cat')
+        sl.load_details(['snapshot-2015.03.01'])
+        client.snapshot.get.assert_called_once_with(
+            repository=testvars.repo_name, snapshot='snapshot-2015.03.01')
+        self.assertEqual(
+            testvars.named_indices, sl.snapshot_info['snapshot-2015.03.01']['indices'])
+    def test_fallback(self):
+        client = self.cat_client()
+        client.cat.snapshots.side_effect = testvars.four_oh_one
+        client.snapshot.get.return_value = testvars.snapshots
+        sl = curator.SnapshotList(
+            client, repository=testvars.repo_name, discovery='cat')
+        self.assertEqual(['snap_name','snapshot-2015.03.01'], sorted(sl.snapshots))
+        self.assertTrue(client.snapshot.get.called)
+    def test_invalid_discovery(self):
+        client = self.cat_client()
+        self.assertRaises(
+            ValueError, curator.SnapshotList, client,
+            repository=testvars.repo_name, discovery='bogus'
+        )
+
 class TestSnapshotListOtherMethods(TestCase):
     def test_empty_list(self):
         client = Mock()
@@ -48,6 +119,25 @@ class TestSnapshotListOtherMethods(TestCase):
         sl = curator.SnapshotList(client, repository=testvars.repo_name)
         self.assertEqual(['snap_name', 'snapshot-2015.03.01'], sl.working_list())
 
+    def test_load_details(self):
+        client = Mock()
+        client.snapshot.get.return_value = {'snapshots': [
+            {'snapshot': snap['snapshot'], 'state': snap['state'],
+             'start_time_in_millis': snap['start_time_in_millis']}
+            for snap in testvars.snapshots['snapshots']
+        ]}
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        sl = curator.SnapshotList(client, repository=testvars.repo_name)
+        client.snapshot.get.return_value = {
+            'snapshots': testvars.snapshots['snapshots'][1:]}
+        sl.load_details(['snapshot-2015.03.01'])
+        client.snapshot.get.assert_called_with(
+            repository=testvars.repo_name, snapshot='snapshot-2015.03.01')
+        self.assertEqual(
+            testvars.named_indices, sl.snapshot_info['snapshot-2015.03.01']['indices'])
+        sl.load_details(['snapshot-2015.03.01'])
+        self.assertEqual(2, client.snapshot.get.call_count)
+
 class TestSnapshotListAgeFilterName(TestCase):
     def test_get_name_based_ages_match(self):
         client = Mock()
@@ -401,7 +491,8 @@ class TestSnapshotListFilterCount(TestCase):
         slo.age_keyfield = 'invalid'
         snaps = slo.snapshots
         slo._sort_by_age(snaps)
-        self.assertEqual(['snapshot-2015.03.01'], slo.snapshots)
+        # No snapshot has the age key, so all of them are removed
+        self.assertEqual([], slo.snapshots)
 
 class TestSnapshotListPeriodFilter(TestCase):
     def test_bad_args(self):
@@ -95,6 +95,34 @@ class TestGetVersion(TestCase):
         version = curator.get_version(client)
         self.assertEqual(version, (9,9,9))
 
+class TestGetCapabilities(TestCase):
+    def test_cached_per_client(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '7.10.2'} }
+        curator.get_version(client)
+        self.assertTrue(curator.has_feature(client, 'multi_snapshot_delete'))
+        self.assertEqual((7,10,2), curator.get_capabilities(client)['version'])
+        self.assertEqual(1, client.info.call_count)
+        other = Mock()
+        other.info.return_value = {'version': {'number': '5.0.0'} }
+        self.assertFalse(curator.has_feature(other, 'sliced_reindex'))
+        self.assertEqual(1, other.info.call_count)
+    def test_logs_cluster_info(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '7.10.2'} }
+        with self.assertLogs('curator.utils', level='DEBUG') as logs:
+            curator.get_capabilities(client)
+        self.assertIn(
+            "Cluster info: {'version': {'number': '7.10.2'}}", logs.output[0])
+    def test_features(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '6.1.0'} }
+        capabilities = curator.get_capabilities(client)
+        self.assertTrue(capabilities['sliced_reindex'])
+        self.assertTrue(capabilities['rollover_max_size'])
+        self.assertFalse(capabilities['is_write_index'])
+        self.assertFalse(capabilities['multi_snapshot_delete'])
+
 class TestIsMasterNode(TestCase):
     def test_positive(self):
         client = Mock()
@@ -153,6 +181,40 @@ class TestGetIndexTime(TestCase):
                 ]:
             self.assertEqual(dt, curator.get_datetime(text, datestring))
 
+class TestTimestampToEpoch(TestCase):
+    def slow(self, timestamp, timestring):
+        try:
+            return curator.datetime_to_epoch(curator.get_datetime(timestamp, timestring))
+        except ValueError:
+            return ValueError
+    def fast(self, timestamp, timestring):
+        try:
+            return curator.timestamp_to_epoch(timestamp, timestring)
+        except ValueError:
+            return ValueError
+    def test_weeks_match_strptime(self):
+        for year in range(1999, 2031):
+            for week in range(0, 56):
+                for timestring in ['%Y.%W', '%G.%V']:
+                    timestamp = '{0:04d}.{1:02d}'.format(year, week)
+                    self.assertEqual(
+                        self.slow(timestamp, timestring), self.fast(timestamp, timestring),
+                        '{0} {1}'.format(timestamp, timestring)
+                    )
+    def test_days_match_strptime(self):
+        for timestamp, timestring in [
+                ('2016.02.29', '%Y.%m.%d'), ('2015-12-31', '%Y-%m-%d'),
+                ('2017.02.29', '%Y.%m.%d'), ('2016.13', '%Y.%m'), ('2016.03', '%Y.%m'),
+                ('2016.03.03.07', '%Y.%m.%d.%H'),
+            ]:
+            self.assertEqual(
+                self.slow(timestamp, timestring), self.fast(timestamp, timestring))
+    def test_memoized(self):
+        curator.timestamp_to_epoch.cache_clear()
+        curator.TimestringSearch('%Y.%m.%d').get_epoch('a-2016.03.03')
+        curator.TimestringSearch('%Y.%m.%d').get_epoch('b-2016.03.03')
+        self.assertEqual(1, curator.timestamp_to_epoch.cache_info().hits)
+
 class TestGetDateRegex(TestCase):
     def test_non_escaped(self):
         self.assertEqual(
@@ -212,6 +274,79 @@ class TestChunkIndexList(TestCase):
         self.assertEqual(2, len(curator.chunk_index_list(indices)))
     def test_small_list(self):
         self.assertEqual(1, len(curator.chunk_index_list(['short','list','of','indices'])))
+    def test_size(self):
+        chunks = curator.chunk_index_list(['aaaa', 'bbbb', 'cccc', 'dddd', 'eeeeeeeeee'], size=9)
+        self.assertEqual([['aaaa', 'bbbb'], ['cccc', 'dddd'], ['eeeeeeeeee']], chunks)
+
+class TestChunkedCall(TestCase):
+    def setUp(self):
+        curator.utils._CHUNK_SIZES.clear()
+    def tearDown(self):
+        curator.utils._CHUNK_SIZES.clear()
+    def too_large_over(self, limit, status=413):
+        calls = []
+        def func(chunk):
+            calls.append(chunk)
+            if len(curator.to_csv(chunk)) > limit:
+                raise elasticsearch.TransportError(status, 'too large')
+            return len(chunk)
+        return func, calls
+    def test_no_indices(self):
+        func, calls = self.too_large_over(10)
+        self.assertEqual([], curator.chunked_call(Mock(), 'x', [], func))
+        self.assertEqual([], calls)
+    def test_splits_in_half(self):
+        indices = ['index-{0:04d}'.format(i) for i in range(8)]
+        func, calls = self.too_large_over(50)
+        result = curator.chunked_call(Mock(), 'x', indices, func)
+        self.assertEqual(indices, [i for chunk, _ in result for i in chunk])
+        self.assertEqual([4, 4], [count for _, count in result])
+        self.assertEqual(3, len(calls))
+    def test_remembers_size(self):
+        client = Mock()
+        indices = ['index-{0:04d}'.format(i) for i in range(8)]
+        func, calls = self.too_large_over(50)
+        curator.chunked_call(client, 'x', indices, func)
+        self.assertEqual(43, curator.chunk_size(client, 'x'))
+        del calls[:]
+        curator.chunked_call(client, 'x', indices, func)
+        self.assertEqual(2, len(calls))
+        # Other endpoints start over
+        self.assertEqual(
+            curator.settings.index_chunk_size(), curator.chunk_size(client, 'y'))
+    def test_url_too_long(self):
+        indices = ['index-{0:04d}'.format(i) for i in range(8)]
+        func, calls = self.too_large_over(
+            50, status=400)
+        self.assertRaises(
+            elasticsearch.TransportError, curator.chunked_call, Mock(), 'x', indices, func)
+        curator.utils._CHUNK_SIZES.clear()
+        def too_long(chunk):
+            if len(chunk) > 4:
+                raise elasticsearch.TransportError(400, 'too_long_frame_exception')
+            return len(chunk)
+        result = curator.chunked_call(Mock(), 'x', indices, too_long)
+        self.assertEqual([4, 4], [count for _, count in result])
+    def test_single_index_too_large_raises(self):
+        func, calls = self.too_large_over(5)
+        self.assertRaises(
+            elasticsearch.TransportError, curator.chunked_call, Mock(), 'x',
+            ['index-0001'], func)
+
+class TestChunkMap(TestCase):
+    def test_serial(self):
+        self.assertEqual([2, 4, 6], curator.chunk_map(lambda x: x * 2, [1, 2, 3]))
+    def test_concurrent_keeps_order(self):
+        chunks = [[str(i)] for i in range(20)]
+        self.assertEqual(
+            chunks, curator.chunk_map(lambda x: x, chunks, concurrency=4))
+    def test_concurrent_raises(self):
+        def func(chunk):
+            if chunk == [3]:
+                raise ValueError('chunk failed')
+            return chunk
+        self.assertRaises(
+            ValueError, curator.chunk_map, func, [[1], [2], [3]], concurrency=2)
 
 class TestGetIndices(TestCase):
     def test_client_exception(self):
@@ -430,10 +565,92 @@ class TestGetSnapshotData(TestCase):
             curator.get_snapshot_data, client, repository=testvars.repo_name
         )
 
+class TestGetSnapshotPages(TestCase):
+    def paged_client(self, version='7.14.0'):
+        client = Mock()
+        client.info.return_value = {'version': {'number': version} }
+        first, second = testvars.snapshots['snapshots']
+        client.snapshot.get.side_effect = [
+            {'snapshots': [first], 'next': 'cursor'},
+            {'snapshots': [second]},
+        ]
+        return client
+    def test_pages(self):
+        client = self.paged_client()
+        pages = list(curator.get_snapshot_pages(
+            client, repository=testvars.repo_name, size=1))
+        self.assertEqual(
+            [['snap_name'], ['snapshot-2015.03.01']],
+            [[snap['snapshot'] for snap in page] for page in pages]
+        )
+        client.snapshot.get.assert_called_with(
+            repository=testvars.repo_name, snapshot='_all',
+            params={'size': 1, 'sort': 'start_time', 'after': 'cursor'}
+        )
+    def test_unsupported(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '7.13.0'} }
+        client.snapshot.get.return_value = testvars.snapshots
+        pages = list(curator.get_snapshot_pages(
+            client, repository=testvars.repo_name, size=1))
+        self.assertEqual([testvars.snapshots['snapshots']], pages)
+        client.snapshot.get.assert_called_once_with(
+            repository=testvars.repo_name, snapshot='_all')
+    def test_no_size(self):
+        client = Mock()
+        client.snapshot.get.return_value = testvars.snapshots
+        pages = list(curator.get_snapshot_pages(client, repository=testvars.repo_name))
+        self.assertEqual([testvars.snapshots['snapshots']], pages)
+        self.assertFalse(client.info.called)
+    def test_raises_exception_onfail(self):
+        client = self.paged_client()
+        client.snapshot.get.side_effect = testvars.four_oh_one
+        self.assertRaises(
+            curator.FailedExecution, list,
+            curator.get_snapshot_pages(client, repository=testvars.repo_name, size=1)
+        )
+
+class TestGetCatSnapshots(TestCase):
+    def test_missing_repo_arg(self):
+        client = Mock()
+        self.assertRaises(curator.MissingArgument, curator.get_cat_snapshots, client)
+    def test_return_data(self):
+        client = Mock()
+        client.cat.snapshots.return_value = [
+            {'id': 'snap_name', 'status': 'SUCCESS', 'start_epoch': '1422748800'}]
+        self.assertEqual(
+            [{'snapshot': 'snap_name', 'state': 'SUCCESS',
+              'start_time_in_millis': 1422748800000}],
+            curator.get_cat_snapshots(client, repository=testvars.repo_name)
+        )
+        client.cat.snapshots.assert_called_once_with(
+            repository=testvars.repo_name, format='json', h='id,status,start_epoch')
+    def test_raises_exception_onfail(self):
+        client = Mock()
+        client.cat.snapshots.side_effect = testvars.four_oh_one
+        self.assertRaises(
+            curator.FailedExecution,
+            curator.get_cat_snapshots, client, repository=testvars.repo_name
+        )
+
 class TestSnapshotInProgress(TestCase):
+    def test_status_request(self):
+        client = Mock()
+        client.snapshot.status.return_value = testvars.status_none
+        curator.snapshot_in_progress(client, repository=testvars.repo_name)
+        client.snapshot.status.assert_called_once_with(
+            repository=testvars.repo_name, filter_path='snapshots.snapshot')
+        self.assertFalse(client.snapshot.get.called)
+    def test_raises_exception_onfail(self):
+        client = Mock()
+        client.snapshot.status.side_effect = testvars.four_oh_one
+        self.assertRaises(
+            curator.FailedExecution,
+            curator.snapshot_in_progress, client, repository=testvars.repo_name
+        )
     def test_all_snapshots_for_in_progress(self):
         client = Mock()
-        client.snapshot.get.return_value = testvars.inprogress
+        client.snapshot.status.return_value = testvars.status_inprogress
         client.snapshot.get_repository.return_value = testvars.test_repo
         self.assertEqual(
             'snapshot-2015.03.01',
@@ -441,7 +658,7 @@ class TestSnapshotInProgress(TestCase):
         )
     def test_specified_snapshot_in_progress(self):
         client = Mock()
-        client.snapshot.get.return_value = testvars.inprogress
+        client.snapshot.status.return_value = testvars.status_inprogress
         client.snapshot.get_repository.return_value = testvars.test_repo
         self.assertEqual(
             'snapshot-2015.03.01',
@@ -452,7 +669,7 @@ class TestSnapshotInProgress(TestCase):
         )
     def test_specified_snapshot_in_progress_negative(self):
         client = Mock()
-        client.snapshot.get.return_value = testvars.inprogress
+        client.snapshot.status.return_value = testvars.status_inprogress
         client.snapshot.get_repository.return_value = testvars.test_repo
         self.assertFalse(
             curator.snapshot_in_progress(
@@ -462,14 +679,14 @@ class TestSnapshotInProgress(TestCase):
         )
     def test_all_snapshots_for_in_progress_negative(self):
         client = Mock()
-        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.status.return_value = testvars.status_none
         client.snapshot.get_repository.return_value = testvars.test_repo
         self.assertFalse(
             curator.snapshot_in_progress(client, repository=testvars.repo_name)
         )
     def test_for_multiple_in_progress(self):
         client = Mock()
-        client.snapshot.get.return_value = testvars.highly_unlikely
+        client.snapshot.status.return_value = testvars.status_highly_unlikely
         client.snapshot.get_repository.return_value = testvars.test_repo
         self.assertRaises(
             curator.CuratorException,
@@ -542,6 +759,33 @@ class TestRepositoryExists(TestCase):
         self.assertFalse(curator.repository_exists(client, repository="repo"))
 
 class TestRepositoryFs(TestCase):
+    def cached_client(self, nodes):
+        client = Mock()
+        client.snapshot.verify_repository.return_value = testvars.verified_nodes
+        client.cat.nodes.return_value = [{'id': node} for node in nodes]
+        return client
+    def test_cached(self):
+        client = self.cached_client(['node-a', 'node-b'])
+        cache = curator.RepositoryCache()
+        curator.test_repo_fs(client, repository=testvars.repo_name, cache=cache)
+        curator.test_repo_fs(client, repository=testvars.repo_name, cache=cache)
+        self.assertEqual(1, client.snapshot.verify_repository.call_count)
+        curator.test_repo_fs(client, repository='other_repo', cache=cache)
+        self.assertEqual(2, client.snapshot.verify_repository.call_count)
+    def test_cached_node_set_changed(self):
+        client = self.cached_client(['node-a', 'node-b'])
+        cache = curator.RepositoryCache()
+        curator.test_repo_fs(client, repository=testvars.repo_name, cache=cache)
+        client.cat.nodes.return_value = [{'id': 'node-a'}, {'id': 'node-c'}]
+        curator.test_repo_fs(client, repository=testvars.repo_name, cache=cache)
+        self.assertEqual(2, client.snapshot.verify_repository.call_count)
+    def test_failure_not_cached(self):
+        client = self.cached_client(['node-a'])
+        client.snapshot.verify_repository.side_effect = testvars.four_oh_one
+        cache = curator.RepositoryCache()
+        self.assertRaises(curator.ActionError, curator.test_repo_fs, client,
+            repository=testvars.repo_name, cache=cache)
+        self.assertEqual({}, cache.entries)
     def test_passing(self):
         client = Mock()
         client.snapshot.verify_repository.return_value = testvars.verified_nodes
@@ -574,7 +818,7 @@ class TestSafeToSnap(TestCase):
         )
     def test_in_progress_fail(self):
         client = Mock()
-        client.snapshot.get.return_value = testvars.inprogress
+        client.snapshot.status.return_value = testvars.status_inprogress
         client.snapshot.get_repository.return_value = testvars.test_repo
         client.tasks.list.return_value = testvars.no_snap_tasks
         self.assertFalse(
@@ -585,7 +829,7 @@ class TestSafeToSnap(TestCase):
         )
     def test_ongoing_tasks_fail(self):
         client = Mock()
-        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.status.return_value = testvars.status_none
         client.snapshot.get_repository.return_value = testvars.test_repo
         client.tasks.list.return_value = testvars.snap_task
         self.assertFalse(
@@ -596,7 +840,7 @@ class TestSafeToSnap(TestCase):
         )
     def test_in_progress_pass(self):
         client = Mock()
-        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.status.return_value = testvars.status_none
         client.snapshot.get_repository.return_value = testvars.test_repo
         client.tasks.list.return_value = testvars.no_snap_tasks
         self.assertTrue(
@@ -764,7 +1008,8 @@ class TestRestoreCheck(TestCase):
         client = Mock()
         client.indices.recovery.side_effect = testvars.fake_fail
         self.assertRaises(
-            curator.CuratorException, curator.restore_check, client, []
+            curator.CuratorException, curator.restore_check, client,
+            testvars.named_indices
         )
     def test_incomplete_recovery(self):
         client = Mock()
@@ -1578,3 +1823,123 @@ class Test_verify_master_status(TestCase):
         client.cluster.state.return_value = {"master_node": "foo"}
         master_only = True
         self.assertIsNone(curator.utils.verify_master_status(client, master_only))
+
+class TestSetRequestTimeout(TestCase):
+    def client(self):
+        return elasticsearch.Elasticsearch(
+            hosts=['127.0.0.1'], transport_class=curator.TimeoutTransport)
+    def test_applied_to_requests(self):
+        client = self.client()
+        curator.set_request_timeout(client, 42)
+        with patch('elasticsearch.Transport.perform_request') as perform:
+            client.transport.perform_request('GET', '/', params={'human': 'true'})
+        perform.assert_called_once_with(
+            'GET', '/', headers=None, body=None,
+            params={'human': 'true', 'request_timeout': 42})
+    def test_request_keeps_own_timeout(self):
+        client = self.client()
+        curator.set_request_timeout(client, 42)
+        with patch('elasticsearch.Transport.perform_request') as perform:
+            client.transport.perform_request('GET', '/', params={'request_timeout': 5})
+        self.assertEqual(
+            {'request_timeout': 5}, perform.call_args[1]['params'])
+    def test_none_uses_client_timeout(self):
+        client = self.client()
+        curator.set_request_timeout(client, None)
+        with patch('elasticsearch.Transport.perform_request') as perform:
+            client.transport.perform_request('GET', '/')
+        self.assertIsNone(perform.call_args[1]['params'])
+    def test_other_transport(self):
+        client = elasticsearch.Elasticsearch(hosts=['127.0.0.1'])
+        curator.set_request_timeout(client, 42)
+        self.assertFalse(hasattr(client.transport, 'request_timeout'))
+
+class TestGetSearchPattern(TestCase):
+    def test_prefix(self):
+        filters = [
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'logstash-'},
+            {'filtertype': 'age', 'source': 'creation_date'},
+        ]
+        self.assertEqual('logstash-*', curator.get_search_pattern(filters))
+    def test_suffix_with_dot(self):
+        filters = [{'filtertype': 'pattern', 'kind': 'suffix', 'value': '-2016.01'}]
+        self.assertEqual('*-2016*01', curator.get_search_pattern(filters))
+    def test_timestring(self):
+        filters = [{'filtertype': 'pattern', 'kind': 'timestring', 'value': 'x-%Y.%m'}]
+        self.assertEqual('*x-*.*', curator.get_search_pattern(filters))
+    def test_timestring_only_dates(self):
+        filters = [{'filtertype': 'pattern', 'kind': 'timestring', 'value': '%Y%m%d'}]
+        self.assertEqual('_all', curator.get_search_pattern(filters))
+    def test_skips_regex_and_exclude(self):
+        filters = [
+            {'filtertype': 'pattern', 'kind': 'regex', 'value': '^foo$'},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'bar', 'exclude': True},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'log(a|b)'},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'baz'},
+        ]
+        self.assertEqual('baz*', curator.get_search_pattern(filters))
+    def test_only_leading_filters(self):
+        filters = [
+            {'filtertype': 'age', 'source': 'creation_date'},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'logstash-'},
+        ]
+        self.assertEqual('_all', curator.get_search_pattern(filters))
+    def test_no_filters(self):
+        self.assertEqual('_all', curator.get_search_pattern([]))
+
+class TestFindSnapshotTasks(TestCase):
+    def test_no_tasks(self):
+        client = Mock()
+        # filter_path leaves nothing of a response without matching tasks
+        client.tasks.list.return_value = {}
+        self.assertFalse(curator.find_snapshot_tasks(client))
+        client.tasks.list.assert_called_once_with(
+            actions='*snapshot*',
+            filter_path=curator.settings.filter_paths()['find_snapshot_tasks']
+        )
+    def test_snapshot_task(self):
+        client = Mock()
+        client.tasks.list.return_value = testvars.snap_task
+        self.assertTrue(curator.find_snapshot_tasks(client))
+
+class TestRelocateCheck(TestCase):
+    def test_started(self):
+        client = Mock()
+        client.cluster.state.return_value = {'routing_table': {'indices': {'foo': {
+            'shards': {'0': [{'state': 'STARTED'}, {'state': 'STARTED'}]}}}}}
+        self.assertTrue(curator.relocate_check(client, 'foo'))
+        client.cluster.state.assert_called_once_with(
+            index='foo', metric='routing_table',
+            filter_path='routing_table.indices.*.shards.*.state')
+    def test_relocating(self):
+        client = Mock()
+        client.cluster.state.return_value = {'routing_table': {'indices': {'foo': {
+            'shards': {'0': [{'state': 'STARTED'}, {'state': 'RELOCATING'}]}}}}}
+        self.assertFalse(curator.relocate_check(client, 'foo'))
+
+class TestPrunedResponses(TestCase):
+    raw = (
+        '{"snapshots": [{"snapshot": "a", "state": "SUCCESS", '
+        '"indices": ["i1", "i2"], "shards": {"total": 2}}], '
+        '"indices": {"i1": {}}}'
+    )
+    def deserializer(self):
+        client = elasticsearch.Elasticsearch(
+            hosts=['127.0.0.1'], serializer=curator.PruningJSONSerializer())
+        return client.transport.deserializer
+    def test_not_pruned_outside_context(self):
+        data = self.deserializer().loads(self.raw, 'application/json')
+        self.assertEqual(['i1', 'i2'], data['snapshots'][0]['indices'])
+    def test_pruned(self):
+        with curator.pruned_responses('snapshot', ['indices']):
+            data = self.deserializer().loads(self.raw, 'application/json')
+        self.assertEqual(
+            {'snapshot': 'a', 'state': 'SUCCESS', 'shards': {'total': 2}},
+            data['snapshots'][0])
+        # Only objects with the marker key are pruned
+        self.assertEqual({'i1': {}}, data['indices'])
+    def test_invalid_json(self):
+        with curator.pruned_responses('snapshot', ['indices']):
+            self.assertRaises(
+                elasticsearch.SerializationError,
+                self.deserializer().loads, '{"snapshot":', 'application/json')
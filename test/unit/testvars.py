@@ -1,3 +1,4 @@
+from copy import deepcopy
 import elasticsearch
 
 fake_fail      = Exception('Simulated Failure')
@@ -162,6 +163,11 @@ highly_unlikely   = { 'snapshots': [
                         'indices': named_indices,
                         'failures': [], 'start_time_in_millis': 1425168002
                     }]}
+# _snapshot/<repository>/_status responses, after filter_path
+status_inprogress = { 'snapshots': [{'snapshot': 'snapshot-2015.03.01'}] }
+status_none       = {}
+status_highly_unlikely = { 'snapshots': [
+                    {'snapshot': snap_name}, {'snapshot': 'snapshot-2015.03.01'}] }
 snap_body_all   = {
                     "ignore_unavailable": False,
                     "include_global_state": True,
@@ -426,6 +432,34 @@ clu_state_four = {
     }
 }
 
+cat_indices_two = [
+    {
+        u'index': u'index-2016.03.03', u'status': u'open', u'pri': u'5',
+        u'rep': u'1', u'creation.date': u'1456963200172',
+        u'docs.count': u'6374962', u'store.size': u'1115219663',
+        u'pri.store.size': u'557951789'
+    },
+    {
+        u'index': u'index-2016.03.04', u'status': u'open', u'pri': u'5',
+        u'rep': u'1', u'creation.date': u'1457049600812',
+        u'docs.count': u'6377544', u'store.size': u'1120891046',
+        u'pri.store.size': u'560677114'
+    }
+]
+cat_indices_2_closed = [
+    {
+        u'index': u'index-2016.03.03', u'status': u'close', u'pri': u'5',
+        u'rep': u'1', u'creation.date': u'1456963200172',
+        u'docs.count': None, u'store.size': None, u'pri.store.size': None
+    },
+    {
+        u'index': u'index-2016.03.04', u'status': u'open', u'pri': u'5',
+        u'rep': u'1', u'creation.date': u'1457049600812',
+        u'docs.count': u'6377544', u'store.size': u'1120891046',
+        u'pri.store.size': u'560677114'
+    }
+]
+
 stats_one      = {
     u'indices': {
         named_index : {
@@ -601,6 +635,12 @@ fm_shards      = { 'indices': { named_index: { 'shards': {
         '0': [ { 'num_search_segments' : 1 }, { 'num_search_segments' : 1 } ],
         '1': [ { 'num_search_segments' : 1 }, { 'num_search_segments' : 1 } ] }}}}
 
+# indices.stats responses with both the store/docs and segments metrics
+stats_one_segments = deepcopy(stats_one)
+stats_one_segments['indices'][named_index]['total']['segments'] = {'count': 71}
+stats_one_fm_segments = deepcopy(stats_one)
+stats_one_fm_segments['indices'][named_index]['total']['segments'] = {'count': 4}
+
 loginfo        =    {   "loglevel": "INFO",
                         "logfile": None,
                         "logformat": "default"